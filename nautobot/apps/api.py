@@ -43,6 +43,7 @@ from nautobot.core.api.views import (
     ModelViewSet,
     ModelViewSetMixin,
     ReadOnlyModelViewSet,
+    StreamingCSVListModelMixin,
 )
 from nautobot.extras.api.fields import MultipleChoiceJSONField
 from nautobot.extras.api.mixins import TaggedModelSerializerMixin
@@ -82,6 +83,7 @@ __all__ = (
     "RelationshipModelSerializerMixin",
     "rest_api_server_error",
     "SerializedPKRelatedField",
+    "StreamingCSVListModelMixin",
     "TaggedModelSerializerMixin",
     "TimeZoneSerializerField",
     "TreeModelSerializerMixin",
@@ -1,4 +1,12 @@
+from base64 import b64decode, b64encode
+import binascii
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from nautobot.core.utils.config import get_settings_or_config
 
@@ -8,13 +16,34 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
     Override the stock paginator to allow setting limit=0 to disable pagination for a request. This returns all objects
     matching a query, but retains the same format as a paginated request. The limit can only be disabled if
     MAX_PAGE_SIZE has been set to 0 or None.
+
+    Additionally, specifying the `cursor` query parameter (initially with an empty value, e.g. `?cursor=&limit=1000`)
+    switches to keyset ("cursor") pagination. Rather than counting all matching objects and using an `OFFSET` to reach
+    a given page, each page is retrieved by filtering on the position of the last object of the previous page, as
+    encoded in the opaque `cursor` value of the `next` link. The cost of retrieving a page therefore does not depend
+    on how deep into the results it is, and no `COUNT(*)` is performed (the response `count` will be `null`).
+
+    Keyset pagination orders the results by the view's `cursor_pagination_ordering` attribute, which must be a
+    sequence of non-nullable, ideally indexed, concrete fields of the model ending in a unique field (by default, just
+    the primary key). Any `sort` requested by the client is ignored in this mode.
     """
 
+    cursor_query_param = "cursor"
+    cursor_query_description = (
+        "Opaque pagination cursor. Specify an empty value to retrieve the first page using keyset pagination, "
+        "then follow the `next` link to retrieve subsequent pages."
+    )
+    default_cursor_ordering = ("pk",)
+    invalid_cursor_message = "Invalid cursor"
+
     def paginate_queryset(self, queryset, request, view=None):
         # No pagination when rendering to CSV
         if "text/csv" in request.accepted_media_type:
             return None
 
+        if self.cursor_query_param in request.query_params:
+            return self.paginate_queryset_by_cursor(queryset, request, view=view)
+
         self.count = self.get_count(queryset)
         self.limit = self.get_limit(request)
         self.offset = self.get_offset(request)
@@ -31,6 +60,96 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         else:
             return list(queryset[self.offset :])
 
+    def paginate_queryset_by_cursor(self, queryset, request, view=None):
+        """Retrieve the page of `queryset` following the position encoded in the request's `cursor` parameter."""
+        self.request = request
+        self.count = None
+        self.offset = 0
+        self.limit = self.get_limit(request)
+        self.cursor_ordering = self.get_cursor_ordering(queryset.model, view)
+        self.next_position = None
+
+        queryset = queryset.order_by(*self.cursor_ordering)
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(position))
+
+        if not self.limit:
+            return list(queryset)
+
+        # Retrieve one extra object to determine whether there is a next page
+        results = list(queryset[: self.limit + 1])
+        if len(results) > self.limit:
+            results = results[: self.limit]
+            self.next_position = self.get_position(results[-1])
+        return results
+
+    def get_cursor_ordering(self, model, view=None):
+        """Get the ordering to use for keyset pagination, validating that it's usable for the given model."""
+        ordering = tuple(getattr(view, "cursor_pagination_ordering", None) or self.default_cursor_ordering)
+        for field_name in ordering:
+            field_name = field_name.lstrip("-")
+            if field_name == "pk":
+                continue
+            try:
+                field = model._meta.get_field(field_name)
+            except FieldDoesNotExist as err:
+                raise ValueError(f"Invalid cursor_pagination_ordering field {field_name} for {model}") from err
+            if not field.concrete or field.null:
+                raise ValueError(f"cursor_pagination_ordering field {field_name} must be a non-nullable field")
+        return ordering
+
+    def get_position(self, instance):
+        """Get the values of the keyset ordering fields for the given instance."""
+        position = []
+        for field_name in self.cursor_ordering:
+            field_name = field_name.lstrip("-")
+            if field_name == "pk":
+                value = instance.pk
+            else:
+                value = getattr(instance, instance._meta.get_field(field_name).attname)
+            position.append(value)
+        return position
+
+    def get_keyset_filter(self, position):
+        """
+        Get a `Q` object matching all objects that sort after the given position.
+
+        For an ordering of `(a, b, c)` this is `(a > x) OR (a = x AND b > y) OR (a = x AND b = y AND c > z)`.
+        """
+        query = Q()
+        preceding = {}
+        for field_name, value in zip(self.cursor_ordering, position):
+            lookup = "lt" if field_name.startswith("-") else "gt"
+            field_name = field_name.lstrip("-")
+            query |= Q(**preceding, **{f"{field_name}__{lookup}": value})
+            preceding[field_name] = value
+        return query
+
+    def encode_cursor(self, position):
+        return b64encode(json.dumps(position, default=str).encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, request, model):
+        """Decode the position from the request's cursor parameter, or return None if it's empty."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(b64decode(encoded.encode("ascii"), validate=True).decode("utf-8"))
+        except (binascii.Error, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.cursor_ordering):
+            raise NotFound(self.invalid_cursor_message)
+        # Validate that the values are appropriate for their fields before they're used in a query
+        for field_name, value in zip(self.cursor_ordering, position):
+            field_name = field_name.lstrip("-")
+            field = model._meta.pk if field_name == "pk" else model._meta.get_field(field_name)
+            try:
+                field.to_python(value)
+            except ValidationError:
+                raise NotFound(self.invalid_cursor_message)
+        return position
+
     def get_limit(self, request):
         if self.limit_query_param:
             try:
@@ -55,6 +174,13 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        if self.count is None:
+            # Keyset pagination
+            if self.next_position is None:
+                return None
+            url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+            return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
         return super().get_next_link()
 
     def get_previous_link(self):
@@ -62,4 +188,27 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        # Keyset pagination only supports traversing forward
+        if self.count is None:
+            return None
+
         return super().get_previous_link()
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        # When using keyset pagination, no count is performed
+        response_schema["properties"]["count"]["nullable"] = True
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append(
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.cursor_query_description,
+                "schema": {"type": "string"},
+            }
+        )
+        return parameters
@@ -35,11 +35,21 @@ class NautobotJSONRenderer(JSONRenderer):
     encoder_class = NautobotKombuJSONEncoder
 
 
+class _Echo:
+    """A file-like object that returns what is written to it rather than storing it, for use with `csv.writer`."""
+
+    def write(self, value):
+        return value
+
+
 class NautobotCSVRenderer(BaseRenderer):
     """
     Render to CSV format.
 
     Loosely inspired by https://github.com/mjumbewu/django-rest-framework-csv/.
+
+    In addition to the standard `render()` API, which renders an entire list of records at once, `render_stream()`
+    can be used to render records incrementally (e.g. from a chunked queryset) with flat memory usage.
     """
 
     media_type = "text/csv"
@@ -72,9 +82,35 @@ class NautobotCSVRenderer(BaseRenderer):
 
         return buffer.getvalue()
 
+    def render_stream(self, records, custom_field_keys=None):
+        """
+        Render the provided iterable of records to CSV format, yielding one line of CSV text at a time.
+
+        Since the records are consumed lazily, the set of custom field columns can't be derived by inspecting every
+        record up front as `render()` does; pass `custom_field_keys` (see `get_custom_field_keys()`) to define them.
+        """
+        writer = csv.writer(_Echo())
+        headers = None
+        for record in records:
+            if headers is None:
+                headers = self.get_headers([record], custom_field_keys=custom_field_keys)
+                yield writer.writerow(headers)
+            yield writer.writerow(self.object_to_row_elements(record, headers=headers))
+
+    @staticmethod
+    def get_custom_field_keys(model):
+        """Get the keys of all custom fields applicable to the given model, for use with `render_stream()`."""
+        from nautobot.extras.models import CustomField
+
+        return [cf.key for cf in CustomField.objects.get_for_model(model)]
+
     @classmethod
-    def get_headers(cls, data):
-        """Identify the appropriate CSV headers corresponding to the given data."""
+    def get_headers(cls, data, custom_field_keys=None):
+        """
+        Identify the appropriate CSV headers corresponding to the given data.
+
+        If `custom_field_keys` is not specified, the custom field headers are derived from all records in `data`.
+        """
         base_headers = list(data[0].keys())
 
         # Remove specific headers that we know are irrelevant
@@ -90,8 +126,10 @@ class NautobotCSVRenderer(BaseRenderer):
 
         # Add individual headers for each relevant custom field
         # Since we know there are cases where custom field data may be missing from a given instance,
-        # we iterate over *all* instances in the data set to be safe.
-        if "custom_fields" in data[0]:
+        # we iterate over *all* instances in the data set to be safe, unless the keys were provided.
+        if "custom_fields" in data[0] and custom_field_keys is not None:
+            cf_headers = sorted(f"cf_{key}" for key in custom_field_keys)
+        elif "custom_fields" in data[0]:
             cf_headers = set()
             for record in data:
                 cf_headers |= {f"cf_{key}" for key in record["custom_fields"]}
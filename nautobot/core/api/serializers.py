@@ -138,6 +138,7 @@ class BaseModelSerializer(OptInFieldsMixin, serializers.HyperlinkedModelSerializ
     object_type = ObjectTypeField()
     # composite_key = serializers.SerializerMethodField()  # TODO: Revisit if we reintroduce composite keys
     natural_keys_values = None
+    _natural_keys_values_by_pk = None
     natural_slug = serializers.SerializerMethodField()
 
     def __init__(self, *args, force_csv=False, **kwargs):
@@ -680,13 +681,23 @@ class BaseModelSerializer(OptInFieldsMixin, serializers.HyperlinkedModelSerializ
                     data[key] = value
         return data
 
+    def _get_natural_keys_values_for_instance(self, instance):
+        """
+        Get the `natural_keys_values` entry of the given instance, or None if there is none.
+
+        The entries are indexed by pk the first time that this is called, so that serializing each of the instances is
+        a constant-time lookup rather than a scan of the entries of all of them.
+        """
+        if self._natural_keys_values_by_pk is None:
+            self._natural_keys_values_by_pk = {item["pk"]: item for item in self.natural_keys_values}
+        return self._natural_keys_values_by_pk.get(instance.pk)
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
         altered_data = {}
 
         if self._is_csv_request() and self.natural_keys_values is not None:
-            if natural_key_field_instance := [item for item in self.natural_keys_values if item["pk"] == instance.pk]:
-                cleaned_natural_key_field_instance = natural_key_field_instance[0]
+            if cleaned_natural_key_field_instance := self._get_natural_keys_values_for_instance(instance):
                 for key, value in data.items():
                     # FK field with natural_field_lookups
                     if natural_key_field_lookups_for_field := self._get_natural_key_lookups_value_for_field(
@@ -903,8 +914,15 @@ class BulkOperationIntegerIDSerializer(serializers.Serializer):
 
 
 class GraphQLAPISerializer(serializers.Serializer):
-    query = serializers.CharField(required=True, help_text="GraphQL query")
+    query = serializers.CharField(
+        required=False, help_text="GraphQL query (may be omitted when executing a persisted query by its hash)"
+    )
     variables = serializers.JSONField(required=False, help_text="Variables in JSON Format")
+    extensions = serializers.JSONField(
+        required=False,
+        help_text='Request extensions in JSON format, such as `{"persistedQuery": {"version": 1, "sha256Hash": "..."}}` '
+        "to execute a persisted query",
+    )
 
 
 class CustomFieldModelSerializerMixin(ValidatedModelSerializer):
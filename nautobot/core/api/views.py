@@ -1,5 +1,6 @@
 from collections import OrderedDict
 import itertools
+import json
 import logging
 import os
 import platform
@@ -8,10 +9,11 @@ from django import __version__ as DJANGO_VERSION, forms
 from django.apps import apps
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.db import transaction
-from django.db.models import ProtectedError
-from django.http.response import HttpResponseBadRequest
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist, ValidationError
+from django.db import router, transaction
+from django.db.models import Model, ProtectedError, UniqueConstraint
+from django.db.models.signals import post_save, pre_save
+from django.http.response import HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import NoReverseMatch, reverse as django_reverse
 from drf_spectacular.plumbing import get_relative_url, set_query_parameters
@@ -29,21 +31,29 @@ from rest_framework.exceptions import ParseError, PermissionDenied
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
+from rest_framework.serializers import ModelSerializer
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet as ModelViewSet_, ReadOnlyModelViewSet as ReadOnlyModelViewSet_
 import yaml
 
 from nautobot.core.api import BulkOperationSerializer
 from nautobot.core.api.exceptions import SerializerNotFound
+from nautobot.core.api.renderers import NautobotCSVRenderer
 from nautobot.core.api.utils import get_serializer_for_model
 from nautobot.core.celery import app as celery_app
 from nautobot.core.exceptions import FilterSetFieldNotFound
+from nautobot.core.graphql.backends import get_query_hash, NautobotGraphQLBackend
+from nautobot.core.models.querysets import chunked_queryset
+from nautobot.core.settings_funcs import is_truthy
 from nautobot.core.utils.data import is_uuid
 from nautobot.core.utils.filtering import get_all_lookup_expr_for_field, get_filterset_parameter_form_field
 from nautobot.core.utils.lookup import get_form_for_model, get_route_for_model
 from nautobot.core.utils.permissions import get_permission_for_model
 from nautobot.core.utils.requests import ensure_content_type_and_field_name_in_query_params
 from nautobot.core.views.utils import get_csv_form_fields_from_serializer_class
+from nautobot.extras.api.mixins import TaggedModelSerializerMixin
+from nautobot.extras.context_managers import deferred_change_logging_for_bulk_operation
+from nautobot.extras.models import GraphQLQuery, Relationship
 from nautobot.extras.registry import registry
 
 from . import serializers
@@ -77,6 +87,14 @@ class NautobotAPIVersionMixin:
         return response
 
 
+def _is_summary_requested(request):
+    """Return whether the `summary` query parameter of a bulk operation request is true."""
+    try:
+        return is_truthy(request.query_params.get("summary", False))
+    except ValueError:
+        raise ParseError("The summary parameter must be a boolean value.")
+
+
 class BulkUpdateModelMixin:
     """
     Support bulk modification of objects using the list endpoint for a model. Accepts a PATCH action with a list of one
@@ -94,9 +112,16 @@ class BulkUpdateModelMixin:
             "status": "planned"
         }
     ]
+
+    Updates that only set fields which can be updated in bulk (see `get_bulk_update_fields()`) are all validated before
+    any of them is applied, and then applied with a single `bulk_update()` query; any others are applied one object at a
+    time. Either way, the changes are logged in bulk. If the `summary` query parameter is true, only the number of
+    updated objects is returned, rather than their full representations.
     """
 
     bulk_operation_serializer_class = BulkOperationSerializer
+    # Number of objects to update per query when updating them in bulk
+    bulk_update_batch_size = 1000
 
     def bulk_update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -107,23 +132,141 @@ class BulkUpdateModelMixin:
         # Map update data by object ID
         update_data = {obj.pop("id"): obj for obj in request.data}
 
-        data = self.perform_bulk_update(qs, update_data, partial=partial)
+        summary = _is_summary_requested(request)
+        objects = self.perform_bulk_update(qs, update_data, partial=partial)
+        if summary:
+            return Response({"count": len(objects)}, status=status.HTTP_200_OK)
 
         # 2.0 TODO: this should be wrapped with a paginator so as to match the same format as the list endpoint,
         # i.e. `{"results": [{instance}, {instance}, ...]}` instead of bare list `[{instance}, {instance}, ...]`
-        return Response(data, status=status.HTTP_200_OK)
+        return Response(self.get_serializer(objects, many=True).data, status=status.HTTP_200_OK)
 
     def perform_bulk_update(self, objects, update_data, partial):
-        with transaction.atomic():
-            data_list = []
+        """Apply the given updates (by object ID) to the given objects, returning the list of updated objects."""
+        objects = list(objects)
+        if not objects:
+            return objects
+
+        # Determine the model fields that the updates set from the serializer fields given, before validating them
+        serializer_fields = self.get_serializer().fields
+        field_names = {
+            serializer_fields[key].source
+            for data in update_data.values()
+            for key in data
+            if key in serializer_fields and not serializer_fields[key].read_only
+        }
+
+        with deferred_change_logging_for_bulk_operation():
+            if self.get_bulk_update_fields(field_names) is None:
+                for obj in objects:
+                    serializer = self.get_serializer(obj, data=update_data.get(str(obj.id)), partial=partial)
+                    serializer.is_valid(raise_exception=True)
+                    self.perform_update(serializer)
+                return objects
+
+            serializers_ = []
             for obj in objects:
-                data = update_data.get(str(obj.id))
-                serializer = self.get_serializer(obj, data=data, partial=partial)
+                serializer = self.get_serializer(obj, data=update_data.get(str(obj.id)), partial=partial)
                 serializer.is_valid(raise_exception=True)
-                self.perform_update(serializer)
-                data_list.append(serializer.data)
+                serializers_.append(serializer)
+
+            # Serializers may add to the validated data, so check the fields that they actually set as well
+            fields = self.get_bulk_update_fields(
+                {name for serializer in serializers_ for name in serializer.validated_data}
+            )
+            if fields is None:
+                for serializer in serializers_:
+                    self.perform_update(serializer)
+            else:
+                self.perform_bulk_update_fields(serializers_, fields)
+
+        return objects
+
+    def get_bulk_update_fields(self, field_names):
+        """
+        Return the list of model fields to update in order to set the given fields of objects in bulk, or None if the
+        objects must be saved one at a time instead.
+
+        Objects can't be updated in bulk if their model customizes `save()`, as with Interfaces, or has required
+        Relationships, or if their serializer customizes `update()`. Neither can fields that aren't concrete, such as
+        tags or Relationships, many-to-many fields, self-referential ones (such as tree parents) and those subject to
+        uniqueness constraints, as their validation depends on the other objects being updated.
+        """
+        model = self.queryset.model
+        if model.save is not Model.save:
+            return None
+        serializer_mro = self.get_serializer_class().__mro__
+        for serializer_class in serializer_mro[: serializer_mro.index(ModelSerializer)]:
+            if "update" in vars(serializer_class) and serializer_class not in (
+                serializers.RelationshipModelSerializerMixin,
+                TaggedModelSerializerMixin,
+            ):
+                return None
+        if Relationship.objects.get_required_for_model(model).exists():
+            return None
+
+        unique_field_names = set(itertools.chain.from_iterable(model._meta.unique_together))
+        for constraint in model._meta.constraints:
+            if isinstance(constraint, UniqueConstraint):
+                unique_field_names.update(constraint.fields)
+
+        fields = []
+        for name in field_names:
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if (
+                not field.concrete
+                or field.many_to_many
+                or field.primary_key
+                or field.unique
+                or field.name in unique_field_names
+                or (field.is_relation and field.related_model is model)
+            ):
+                return None
+            fields.append(field)
+
+        # Also update any fields that are automatically set whenever an object is saved, such as `last_updated`
+        fields += [
+            field for field in model._meta.concrete_fields if getattr(field, "auto_now", False) and field not in fields
+        ]
+        return fields
+
+    def perform_bulk_update_fields(self, serializers_, fields):
+        """
+        Save the validated data of the given serializers to their objects with a single `bulk_update()` query.
+
+        The `pre_save` and `post_save` signals are sent for each object as if it had been saved, so that its changes are
+        logged and anything else depending on them is kept up to date.
+        """
+        model = self.queryset.model
+        objects = [serializer.instance for serializer in serializers_]
+        self.logger.info(f"Updating {len(objects)} {model._meta.verbose_name_plural}")
+        using = router.db_for_write(model)
 
-            return data_list
+        # Enforce object-level permissions on save()
+        try:
+            with transaction.atomic(using=using):
+                for serializer in serializers_:
+                    for name, value in serializer.validated_data.items():
+                        setattr(serializer.instance, name, value)
+                    for field in fields:
+                        if getattr(field, "auto_now", False):
+                            field.pre_save(serializer.instance, add=False)
+                    pre_save.send(
+                        sender=model, instance=serializer.instance, raw=False, using=using, update_fields=None
+                    )
+                model.objects.bulk_update(
+                    objects, [field.name for field in fields], batch_size=self.bulk_update_batch_size
+                )
+                for obj in objects:
+                    post_save.send(
+                        sender=model, instance=obj, created=False, raw=False, using=using, update_fields=None
+                    )
+                self._validate_objects(objects)
+        except ObjectDoesNotExist:
+            raise PermissionDenied()
 
     def bulk_partial_update(self, request, *args, **kwargs):
         kwargs["partial"] = True
@@ -140,6 +283,10 @@ class BulkDestroyModelMixin:
         {"id": "3f01f169-49b9-42d5-a526-df9118635d62"},
         {"id": "c27d6c5b-7ea8-41e7-b9dd-c065efd5d9cd"}
     ]
+
+    Unless their model customizes `delete()`, the objects are deleted all at once rather than one at a time, and either
+    way, the deletions are logged in bulk. If the `summary` query parameter is true, the number of deleted objects is
+    returned rather than an empty response.
     """
 
     bulk_operation_serializer_class = BulkOperationSerializer
@@ -152,14 +299,68 @@ class BulkDestroyModelMixin:
         serializer.is_valid(raise_exception=True)
         qs = self.get_queryset().filter(pk__in=[o["id"] for o in serializer.data])
 
-        self.perform_bulk_destroy(qs)
+        summary = _is_summary_requested(request)
+        count = self.perform_bulk_destroy(qs)
+        if summary:
+            return Response({"count": count}, status=status.HTTP_200_OK)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def perform_bulk_destroy(self, objects):
-        with transaction.atomic():
-            for obj in objects:
-                self.perform_destroy(obj)
+        """Delete the given objects, returning the number of deleted objects."""
+        model = objects.model
+        with deferred_change_logging_for_bulk_operation():
+            if model.delete is not Model.delete:
+                count = 0
+                for obj in objects:
+                    self.perform_destroy(obj)
+                    count += 1
+                return count
+
+            pks = list(objects.values_list("pk", flat=True))
+            self.logger.info(f"Deleting {len(pks)} {model._meta.verbose_name_plural}")
+            _, deleted_counts = model.objects.filter(pk__in=pks).delete()
+            return deleted_counts.get(model._meta.label, 0)
+
+
+class StreamingCSVListModelMixin:
+    """
+    Stream the response to a CSV-format list request rather than rendering it all in memory at once.
+
+    The queryset is serialized and rendered `csv_stream_chunk_size` records at a time, so that memory usage stays flat
+    regardless of the number of records being exported. Requests for any other format are handled as usual.
+    """
+
+    csv_stream_chunk_size = 1000
+
+    def list(self, request, *args, **kwargs):
+        if isinstance(getattr(request, "accepted_renderer", None), NautobotCSVRenderer):
+            return self.stream_csv_list(request)
+        return super().list(request, *args, **kwargs)
+
+    def stream_csv_list(self, request):
+        renderer = request.accepted_renderer
+        queryset = self.filter_queryset(self.get_queryset())
+        chunks = chunked_queryset(queryset, chunk_size=self.csv_stream_chunk_size)
+
+        # Serialize the first chunk before returning the response, so that any errors are reported normally.
+        first_chunk = next(chunks, None)
+        first_records = self.get_serializer(first_chunk, many=True).data if first_chunk is not None else []
+
+        def records():
+            yield from first_records
+            for chunk in chunks:
+                yield from self.get_serializer(chunk, many=True).data
+
+        if hasattr(queryset.model, "_custom_field_data"):
+            custom_field_keys = renderer.get_custom_field_keys(queryset.model)
+        else:
+            custom_field_keys = None
+
+        return StreamingHttpResponse(
+            renderer.render_stream(records(), custom_field_keys=custom_field_keys),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
 
 
 #
@@ -170,6 +371,10 @@ class BulkDestroyModelMixin:
 class ModelViewSetMixin:
     logger = logging.getLogger(__name__ + ".ModelViewSet")
 
+    # Ordering used for keyset pagination (`?cursor=`) of list results; see OptionalLimitOffsetPagination.
+    # Must consist of non-nullable model fields, ending with a unique field. Defaults to ordering by primary key.
+    cursor_pagination_ordering = None
+
     # TODO: can't set lookup_value_regex globally; some models/viewsets (ContentType, Group) have integer rather than
     #       UUID PKs and also do NOT support composite-keys.
     #       The impact of NOT setting this is that per the OpenAPI schema, only UUIDs are permitted for most ViewSets;
@@ -282,6 +487,7 @@ class ModelViewSet(
     NautobotAPIVersionMixin,
     BulkUpdateModelMixin,
     BulkDestroyModelMixin,
+    StreamingCSVListModelMixin,
     ModelViewSetMixin,
     ModelViewSet_,
 ):
@@ -336,7 +542,12 @@ class ModelViewSet(
         return super().perform_destroy(instance)
 
 
-class ReadOnlyModelViewSet(NautobotAPIVersionMixin, ModelViewSetMixin, ReadOnlyModelViewSet_):
+class ReadOnlyModelViewSet(
+    NautobotAPIVersionMixin,
+    StreamingCSVListModelMixin,
+    ModelViewSetMixin,
+    ReadOnlyModelViewSet_,
+):
     """
     Extend DRF's ReadOnlyModelViewSet to support queryset restriction.
     """
@@ -637,6 +848,15 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
         """
         query, variables, operation_name, _id = GraphQLView.get_graphql_params(request, data)
 
+        query_hash = self.get_persisted_query_hash(data)
+        if query_hash is not None:
+            if query and get_query_hash(query) != query_hash:
+                return {"errors": [{"message": "provided sha does not match query"}]}, 400
+            if not query:
+                query = self.get_persisted_query(request, query_hash)
+                if query is None:
+                    return {"errors": [{"message": "PersistedQueryNotFound"}]}, 400
+
         execution_result = self.execute_graphql_request(request, data, query, variables, operation_name)
 
         status_code = 200
@@ -657,6 +877,51 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
 
         return result, status_code
 
+    def get_persisted_query_hash(self, data):
+        """Get the SHA-256 hash of the query from the `persistedQuery` request extension, if specified.
+
+        Args:
+            data (dict): Parsed content of the body of the request.
+
+        Returns:
+            (str): the hash, or None if the request doesn't include the extension
+        """
+        extensions = data.get("extensions") or {}
+        if isinstance(extensions, str):
+            try:
+                extensions = json.loads(extensions)
+            except ValueError:
+                raise HttpError(HttpResponseBadRequest("Extensions are invalid JSON."))
+        persisted_query = extensions.get("persistedQuery") if isinstance(extensions, dict) else None
+        if not isinstance(persisted_query, dict) or not persisted_query.get("sha256Hash"):
+            return None
+        return str(persisted_query["sha256Hash"]).lower()
+
+    def get_persisted_query(self, request, query_hash):
+        """Get the query string of a persisted query, given its SHA-256 hash.
+
+        A query is persisted once it has been executed with its hash and is still in the GraphQL document cache,
+        or if it is a saved GraphQLQuery that the user has permission to view.
+
+        Args:
+            request (HttpRequest): Request object from Django
+            query_hash (str): SHA-256 hash of the query
+
+        Returns:
+            (str): the query, or None if no persisted query matches the hash
+        """
+        self.init_graphql()
+        backend = self.get_backend(request)
+        if isinstance(backend, NautobotGraphQLBackend):
+            document = backend.get_cached_document(self.graphql_schema, query_hash)
+            if document is not None:
+                return document.document_string
+
+        graphql_query = GraphQLQuery.objects.restrict(request.user, "view").filter(query_hash=query_hash).first()
+        if graphql_query is None:
+            return None
+        return graphql_query.query
+
     def parse_body(self, request):
         """Analyze the request and based on the content type,
         extract the query from the body as a string or as a JSON payload.
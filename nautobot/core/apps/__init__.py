@@ -906,6 +906,13 @@ class CoreConfig(NautobotConfig):
             """Convert BigIntegerField to BigInteger scalar."""
             return BigInteger()
 
+        from graphql import set_default_backend
+
+        from nautobot.core.graphql.backends import NautobotGraphQLBackend
+
+        # Cache parsed and validated GraphQL documents
+        set_default_backend(NautobotGraphQLBackend())
+
         from django.conf import settings
         from django.contrib.auth.models import update_last_login
         from django.contrib.auth.signals import user_logged_in
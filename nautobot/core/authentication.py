@@ -1,4 +1,5 @@
 from collections import defaultdict
+import contextlib
 import logging
 
 from django.conf import settings
@@ -7,11 +8,14 @@ from django.contrib.auth.backends import (
     RemoteUserBackend as _RemoteUserBackend,
 )
 from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Q
+import redis.exceptions
 
 from nautobot.core.utils.permissions import (
+    get_compiled_constraints,
     permission_is_exempt,
-    qs_filter_from_constraints,
     resolve_permission,
     resolve_permission_ct,
 )
@@ -19,6 +23,36 @@ from nautobot.users.models import ObjectPermission
 
 logger = logging.getLogger(__name__)
 
+OBJECT_PERMISSIONS_CACHE_KEY_PREFIX = "nautobot.core.authentication.ObjectPermissionBackend.object_permissions"
+
+
+def clear_object_permissions_cache(user_pks=None):
+    """Delete the cached ObjectPermissions of the users with the given primary keys, or of all users if None."""
+    with contextlib.suppress(redis.exceptions.ConnectionError):
+        if user_pks is None:
+            cache.delete_pattern(f"{OBJECT_PERMISSIONS_CACHE_KEY_PREFIX}.*")
+        else:
+            cache.delete_many(
+                [ObjectPermissionBackend.get_object_permissions_cache_key(user_pk) for user_pk in user_pks]
+            )
+
+
+def invalidate_object_permissions_cache(user_pks=None):
+    """
+    Invalidate the cached ObjectPermissions of the users with the given primary keys, or of all users if None.
+
+    As the cache may be repopulated with the permissions as seen by another transaction until the current transaction
+    is committed, the cache is invalidated both immediately and once the transaction is committed. Nothing is done if
+    the cache is disabled (`settings.OBJECT_PERMISSIONS_CACHE_TIMEOUT` is 0); any permissions left cached from before
+    are cleared by the `refresh_object_permissions_cache` management command.
+    """
+    if not settings.OBJECT_PERMISSIONS_CACHE_TIMEOUT:
+        return
+
+    clear_object_permissions_cache(user_pks)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: clear_object_permissions_cache(user_pks))
+
 
 class ObjectPermissionBackend(ModelBackend):
     def get_all_permissions(self, user_obj, obj=None):
@@ -26,11 +60,33 @@ class ObjectPermissionBackend(ModelBackend):
             return {}
         if not hasattr(user_obj, "_object_perm_cache"):
             user_obj._object_perm_cache = self.get_object_permissions(user_obj)
+            user_obj._object_perm_compiled_cache = {}
         return user_obj._object_perm_cache
 
+    @staticmethod
+    def get_object_permissions_cache_key(user_pk):
+        """Return the key of the cached ObjectPermissions of the user with the given primary key."""
+        return f"{OBJECT_PERMISSIONS_CACHE_KEY_PREFIX}.{user_pk}"
+
     def get_object_permissions(self, user_obj):
         """
         Return all permissions granted to the user by an ObjectPermission.
+
+        These are cached for `settings.OBJECT_PERMISSIONS_CACHE_TIMEOUT` seconds, if set, across all Nautobot processes.
+        """
+        if not settings.OBJECT_PERMISSIONS_CACHE_TIMEOUT:
+            return self.query_object_permissions(user_obj)
+
+        cache_key = self.get_object_permissions_cache_key(user_obj.pk)
+        perms = cache.get(cache_key)
+        if perms is None:
+            perms = dict(self.query_object_permissions(user_obj))
+            cache.set(cache_key, perms, settings.OBJECT_PERMISSIONS_CACHE_TIMEOUT)
+        return perms
+
+    def query_object_permissions(self, user_obj):
+        """
+        Look up all permissions granted to the user by an ObjectPermission in the database, bypassing the cache.
         """
         # Retrieve all assigned and enabled ObjectPermissions
         object_permissions = ObjectPermission.objects.filter(
@@ -82,16 +138,14 @@ class ObjectPermissionBackend(ModelBackend):
         if model._meta.label_lower != ".".join((app_label, model_name)):
             raise ValueError(f"Invalid permission {perm} for model {model}")
 
-        # Compile a QuerySet filter that matches all instances of the specified model
-        tokens = {
-            "$user": user_obj,
-        }
-        constraints = qs_filter_from_constraints(self.get_all_permissions(user_obj)[perm], tokens)
-
-        # Permission to perform the requested action on the object depends on whether the specified object matches
-        # the specified constraints. Note that this check is made against the *database* record representing the object,
-        # not the instance itself.
-        return model.objects.filter(constraints, pk=obj.pk).exists()
+        # Evaluate the constraints against the object's loaded field values if possible. Otherwise, permission to perform
+        # the requested action on the object depends on whether the *database* record representing the object matches
+        # the constraints.
+        constraints = get_compiled_constraints(user_obj, perm)
+        permitted = constraints.matches(obj)
+        if permitted is None:
+            permitted = model.objects.filter(constraints.q, pk=obj.pk).exists()
+        return permitted
 
 
 class RemoteUserBackend(_RemoteUserBackend):
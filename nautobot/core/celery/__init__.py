@@ -145,6 +145,12 @@ def setup_nautobot_job_logging(sender, instance, conf, **kwargs):
         add_nautobot_log_handler(redirect_logger)
 
 
+@signals.task_postrun.connect
+def flush_nautobot_job_logging(sender=None, task_id=None, **kwargs):
+    """Store any log entries of the task still buffered by the nautobot database logging handler, and forget it."""
+    NautobotDatabaseHandler.flush_task(task_id, forget=True)
+
+
 @signals.worker_ready.connect
 def setup_prometheus(**kwargs):
     """This sets up an HTTP server to serve prometheus metrics from the celery workers."""
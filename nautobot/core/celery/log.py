@@ -1,38 +1,134 @@
 import logging
+import threading
+import time
 
 from celery import current_task
+from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import connections
+
+logger = logging.getLogger(__name__)
 
 
 class NautobotDatabaseHandler(logging.Handler):
-    """Custom logging handler to log messages to JobLogEntry database entries."""
+    """
+    Custom logging handler to log messages to JobLogEntry database entries.
+
+    Rather than storing each entry as it's logged, the entries of each task are buffered and stored in bulk once
+    `settings.JOB_LOG_BUFFER_SIZE` of them are buffered, once the oldest of them is `settings.JOB_LOG_BUFFER_TIMEOUT`
+    seconds old (by a timer, so even if the task logs nothing else meanwhile), and when the task ends (see
+    `flush_task()`). The first entry of each task, and those of warnings and errors, are stored right away, along with
+    any buffered before them. Each entry keeps the time it was logged at, so the entries remain ordered by it.
+    """
+
+    # Shared by all instances of the handler (such as those of the task logger and of the redirected stdout/stderr), so
+    # that all of the entries of a task are flushed together:
+    # The JobResult of each running task (or None if it has none), as looked up when the task first logs a message
+    _job_results = {}
+    # The buffered entries of each running task, and the time.monotonic() that the oldest of them was buffered at
+    _buffers = {}
+    _buffer_times = {}
+    # The threading.Timer of each task with buffered entries, to store them once they're too old
+    _buffer_timers = {}
+    _buffer_lock = threading.RLock()
 
     def emit(self, record):
         if current_task is None:
             return
 
-        from nautobot.extras.models.jobs import JobResult
+        # Skip recording the log entry if it has been marked as such
+        if getattr(record, "skip_db_logging", False):
+            return
 
         try:
             self.format(record)
 
-            try:
-                job_result = JobResult.objects.get(id=record.task_id)
-            except (ValidationError, JobResult.DoesNotExist):
-                # Both of these cases are very rare
-                # ValidationError - because the task_id might not a valid UUID
-                # JobResult.DoesNotExist - because we might not have a JobResult with that ID
-                return
-
-            # Skip recording the log entry if it has been marked as such
-            if getattr(record, "skip_db_logging", False):
+            first_entry = record.task_id not in self._job_results
+            job_result = self.get_job_result(record.task_id)
+            if job_result is None:
                 return
 
-            job_result.log(
+            log_entry = job_result.build_log_entry(
                 message=record.message,
                 level_choice=record.levelname.lower(),
                 obj=getattr(record, "object", None),
                 grouping=getattr(record, "grouping", record.funcName),
             )
+            with self._buffer_lock:
+                buffer = self._buffers.setdefault(record.task_id, [])
+                buffer.append(log_entry)
+                buffer_time = self._buffer_times.setdefault(record.task_id, time.monotonic())
+                if (
+                    first_entry
+                    or record.levelno >= logging.WARNING
+                    or len(buffer) >= settings.JOB_LOG_BUFFER_SIZE
+                    or time.monotonic() - buffer_time >= settings.JOB_LOG_BUFFER_TIMEOUT
+                ):
+                    self.flush_task(record.task_id)
+                elif record.task_id not in self._buffer_timers:
+                    timer = threading.Timer(
+                        settings.JOB_LOG_BUFFER_TIMEOUT, self.flush_task_on_timeout, args=(record.task_id,)
+                    )
+                    timer.daemon = True
+                    self._buffer_timers[record.task_id] = timer
+                    timer.start()
         except Exception:
             self.handleError(record)
+
+    @classmethod
+    def get_job_result(cls, task_id):
+        """Get the JobResult of the given task, or None if it has none, looking it up only once per task."""
+        from nautobot.extras.models.jobs import JobResult
+
+        with cls._buffer_lock:
+            if task_id not in cls._job_results:
+                try:
+                    cls._job_results[task_id] = JobResult.objects.get(id=task_id)
+                except (ValidationError, JobResult.DoesNotExist):
+                    # Both of these cases are very rare
+                    # ValidationError - because the task_id might not a valid UUID
+                    # JobResult.DoesNotExist - because we might not have a JobResult with that ID
+                    cls._job_results[task_id] = None
+            return cls._job_results[task_id]
+
+    @classmethod
+    def flush_task(cls, task_id, forget=False):
+        """
+        Store the buffered log entries of the given task.
+
+        Args:
+            task_id (str): ID of the task
+            forget (bool): Whether to also forget the JobResult of the task, as it has ended
+        """
+        with cls._buffer_lock:
+            log_entries = cls._buffers.pop(task_id, None)
+            cls._buffer_times.pop(task_id, None)
+            timer = cls._buffer_timers.pop(task_id, None)
+            if timer is not None:
+                timer.cancel()
+            job_result = cls._job_results.pop(task_id, None) if forget else cls._job_results.get(task_id)
+            if log_entries and job_result is not None:
+                job_result.save_log_entries(log_entries)
+
+    @classmethod
+    def flush_task_on_timeout(cls, task_id):
+        """Store the buffered log entries of the given task from its timer thread, once the oldest of them is too old."""
+        try:
+            cls.flush_task(task_id)
+        except Exception:
+            # Like in flush(), the entries are dropped rather than retried
+            logger.exception("Failed to store the buffered log entries of task %s", task_id)
+        finally:
+            # Don't leave the database connections of the timer thread open
+            connections.close_all()
+
+    def flush(self):
+        """Store the buffered log entries of all tasks, such as when the worker is shut down."""
+        with self._buffer_lock:
+            for task_id in list(self._buffers):
+                try:
+                    self.flush_task(task_id)
+                except Exception:
+                    # Don't keep the other entries from being stored
+                    self._buffers.pop(task_id, None)
+                    self._buffer_times.pop(task_id, None)
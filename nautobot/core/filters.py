@@ -376,13 +376,20 @@ class MappedPredicatesFilterMixin:
         Given a `value`, return a `Q` object for 2-tuple of `predicate=value`. Filter predicates are
         read from the instance filter. Any `kwargs` are ignored.
         """
+        return self.generate_predicates_query(value, self.filter_predicates)
+
+    def generate_predicates_query(self, value, filter_predicates):
+        """
+        Given a `value`, return a `Q` object for 2-tuple of `predicate=value` for the given subset of
+        this filter's predicates.
+        """
 
         def noop(v):
             """Pass through the value."""
             return v
 
         query = models.Q()
-        for field_name, lookup_info in self.filter_predicates.items():
+        for field_name, lookup_info in filter_predicates.items():
             # Unless otherwise specified, set the default prepreprocssor
             if isinstance(lookup_info, str):
                 lookup_expr = lookup_info
@@ -498,6 +505,27 @@ class SearchFilter(MappedPredicatesFilterMixin, django_filters.CharFilter):
 
     label = "Search"
 
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES or not settings.SEARCH_INDEX_ENABLED:
+            return super().filter(qs, value)
+
+        from nautobot.extras import search_index  # avoid circular import
+
+        model = qs.model._meta.concrete_model
+        if (
+            model not in search_index.get_indexed_models()
+            or search_index.get_indexed_field_lookups(self) != search_index.get_search_fields(model)
+            or not search_index.is_searchable(value)
+        ):
+            return super().filter(qs, value)
+
+        # Match the value against the searchable text of the objects in the search index with a single subquery, and
+        # against any other predicates (such as `id` or exact matches) as usual
+        query = models.Q(pk__in=search_index.get_matching_entries(value, [model]).values("object_id"))
+        query |= search_index.get_unindexed_query(self, value)
+        self._most_recent_query = query
+        return self.get_method(qs)(query).distinct()
+
 
 class TagFilter(NaturalKeyOrPKMultipleChoiceFilter):
     """
@@ -541,6 +569,23 @@ class TreeNodeMultipleChoiceFilter(NaturalKeyOrPKMultipleChoiceFilter):
         """
         Given a filter value, return a `Q` object that accounts for nested tree node descendants.
         """
+        query = models.Q()
+        if value and settings.TREE_CLOSURE_ENABLED:
+            # Match the descendants of the nodes in the closure table of their tree with a single subquery
+            from nautobot.extras.models import TreeClosure  # avoid circular import
+            from nautobot.extras.tree_closures import get_closed_node_ids
+
+            closed_node_ids = get_closed_node_ids([node.pk for node in value if not isinstance(node, str)])
+            if closed_node_ids:
+                query |= models.Q(
+                    **{
+                        f"{self.field_name}__in": TreeClosure.objects.filter(ancestor_id__in=closed_node_ids).values(
+                            "descendant_id"
+                        )
+                    }
+                )
+                value = [node for node in value if isinstance(node, str) or node.pk not in closed_node_ids]
+
         if value:
             # django-tree-queries
             value = [node.descendants(include_self=True) if not isinstance(node, str) else node for node in value]
@@ -560,7 +605,6 @@ class TreeNodeMultipleChoiceFilter(NaturalKeyOrPKMultipleChoiceFilter):
 
         # Construct a nested OR query from the list of filter predicates derived from the flattened
         # listed of descendant objects.
-        query = models.Q()
         for predicate in predicates:
             query |= models.Q(**predicate)
 
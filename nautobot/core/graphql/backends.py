@@ -0,0 +1,112 @@
+"""GraphQL backend with a cache of parsed and validated documents."""
+
+from collections import namedtuple, OrderedDict
+from functools import partial
+import hashlib
+import threading
+
+from django.conf import settings
+from graphql.backend.base import GraphQLDocument
+from graphql.backend.core import GraphQLCoreBackend
+from graphql.execution import execute, ExecutionResult
+from graphql.language import ast
+from graphql.language.base import parse
+from graphql.validation import validate
+from prometheus_client import Counter
+
+# Statistics of the GraphQL document cache, in the same form as `functools.lru_cache().cache_info()`
+GraphQLDocumentCacheInfo = namedtuple("GraphQLDocumentCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+GRAPHQL_DOCUMENT_CACHE_METRIC = Counter(
+    "nautobot_graphql_document_cache_lookups", "Lookups of parsed and validated GraphQL documents.", ["result"]
+)
+
+
+def get_query_hash(query):
+    """Return the SHA-256 hash of the given GraphQL query string, as used to identify persisted queries."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def _execute_validated(schema, document_ast, validation_errors, *args, **kwargs):
+    """Execute a document that has already been validated, reporting the validation errors (if any) as the result."""
+    if kwargs.pop("validate", True) and validation_errors:
+        return ExecutionResult(errors=validation_errors, invalid=True)
+    return execute(schema, document_ast, *args, **kwargs)
+
+
+class NautobotGraphQLBackend(GraphQLCoreBackend):
+    """
+    GraphQL backend that keeps a thread-safe LRU cache of parsed and validated documents.
+
+    Documents are keyed by the schema (which is only regenerated when the web service is restarted) and the SHA-256
+    hash of the query string, so that repeatedly executing the same query, such as a saved `GraphQLQuery`, only parses
+    and validates it once. The hash also allows a cached document to be retrieved by its hash alone, as is done for
+    persisted queries.
+
+    The maximum number of documents cached is given by the `GRAPHQL_DOCUMENT_CACHE_SIZE` setting; `0` disables caching.
+    """
+
+    def __init__(self, executor=None):
+        super().__init__(executor=executor)
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def compile_document(self, schema, document_string):
+        """Parse and validate the given query string, returning a document whose execution skips re-validation."""
+        document_ast = parse(document_string)
+        validation_errors = validate(schema, document_ast)
+        return GraphQLDocument(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            execute=partial(_execute_validated, schema, document_ast, validation_errors, **self.execute_params),
+        )
+
+    def get_cached_document(self, schema, query_hash):
+        """Get the cached document for the given schema and query hash, or None if it's not cached."""
+        with self._lock:
+            document = self._documents.get((schema, query_hash))
+            if document is not None:
+                self._documents.move_to_end((schema, query_hash))
+                self.hits += 1
+                GRAPHQL_DOCUMENT_CACHE_METRIC.labels(result="hit").inc()
+            return document
+
+    def document_from_string(self, schema, document_string):
+        if isinstance(document_string, ast.Document):
+            return super().document_from_string(schema, document_string)
+        maxsize = settings.GRAPHQL_DOCUMENT_CACHE_SIZE
+        if not maxsize:
+            return self.compile_document(schema, document_string)
+
+        key = (schema, get_query_hash(document_string))
+        document = self.get_cached_document(*key)
+        if document is not None:
+            return document
+
+        # Compile outside of the lock; a concurrent compilation of the same document is harmless
+        document = self.compile_document(schema, document_string)
+        with self._lock:
+            self.misses += 1
+            GRAPHQL_DOCUMENT_CACHE_METRIC.labels(result="miss").inc()
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+            while len(self._documents) > maxsize:
+                self._documents.popitem(last=False)
+        return document
+
+    def cache_info(self):
+        """Return the hits, misses, maximum size and current size of the cache."""
+        with self._lock:
+            return GraphQLDocumentCacheInfo(
+                self.hits, self.misses, settings.GRAPHQL_DOCUMENT_CACHE_SIZE, len(self._documents)
+            )
+
+    def cache_clear(self):
+        """Remove all documents from the cache and reset its statistics."""
+        with self._lock:
+            self._documents.clear()
+            self.hits = 0
+            self.misses = 0
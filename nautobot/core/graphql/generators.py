@@ -2,15 +2,15 @@
 
 import logging
 
+from django.conf import settings
 import graphene
 import graphene_django_optimizer as gql_optimizer
 from graphql import GraphQLError
 
+from nautobot.core.graphql.loaders import load_relationship_peers
 from nautobot.core.graphql.types import OptimizedNautobotObjectType
-from nautobot.core.graphql.utils import get_filtering_args_from_filterset, str_to_var_name
+from nautobot.core.graphql.utils import get_filtering_args_from_filterset, is_field_selected, str_to_var_name
 from nautobot.core.utils.lookup import get_filterset_for_model
-from nautobot.extras.choices import RelationshipSideChoices
-from nautobot.extras.models import RelationshipAssociation
 
 logger = logging.getLogger(__name__)
 RESOLVER_PREFIX = "resolve_"
@@ -134,72 +134,12 @@ def generate_relationship_resolver(name, resolver_name, relationship, side, peer
     """
 
     def resolve_relationship(self, info, **kwargs):
-        """Return a queryset or an object depending on the type of the relationship."""
-        peer_side = RelationshipSideChoices.OPPOSITE[side]
-        query_params = {"relationship": relationship}
-        # https://github.com/nautobot/nautobot/issues/1228
-        # If querying for **only** the ID of the related object, for example:
-        # { device(id:"...") { ... rel_my_relationship { id } } }
-        # we will get this exception:
-        # TypeError: Cannot call select_related() after .values() or .values_list()
-        # This appears to be a bug in graphene_django_optimizer but I haven't found a known issue on GitHub.
-        # For now we just work around it by catching the exception and retrying without optimization, below...
-        if not relationship.symmetric:
-            # Get the objects on the other side of this relationship
-            query_params[f"{side}_id"] = self.pk
-
-            try:
-                queryset_ids = gql_optimizer.query(
-                    RelationshipAssociation.objects.filter(**query_params).values_list(f"{peer_side}_id", flat=True),
-                    info,
-                )
-            except TypeError:
-                logger.debug("Caught TypeError in graphene_django_optimizer, falling back to un-optimized query")
-                queryset_ids = RelationshipAssociation.objects.filter(**query_params).values_list(
-                    f"{peer_side}_id", flat=True
-                )
-        else:
-            # Get objects that are peers for this relationship, regardless of side
-            try:
-                queryset_ids = list(
-                    gql_optimizer.query(
-                        RelationshipAssociation.objects.filter(source_id=self.pk, **query_params).values_list(
-                            "destination_id", flat=True
-                        ),
-                        info,
-                    )
-                )
-                queryset_ids += list(
-                    gql_optimizer.query(
-                        RelationshipAssociation.objects.filter(destination_id=self.pk, **query_params).values_list(
-                            "source_id", flat=True
-                        ),
-                        info,
-                    )
-                )
-            except TypeError:
-                logger.debug("Caught TypeError in graphene_django_optimizer, falling back to un-optimized query")
-                queryset_ids = list(
-                    RelationshipAssociation.objects.filter(source_id=self.pk, **query_params).values_list(
-                        "destination_id", flat=True
-                    ),
-                )
-                queryset_ids += list(
-                    RelationshipAssociation.objects.filter(destination_id=self.pk, **query_params).values_list(
-                        "source_id", flat=True
-                    ),
-                )
-
-        if relationship.has_many(peer_side):
-            return gql_optimizer.query(peer_model.objects.filter(id__in=queryset_ids), info)
-
-        # Also apparently a graphene_django_optimizer bug - in the same query case as described above, here we may see:
-        # AttributeError: object has no attribute "only"
-        try:
-            return gql_optimizer.query(peer_model.objects.filter(id__in=queryset_ids).first(), info)
-        except AttributeError:
-            logger.debug("Caught AttributeError in graphene_django_optimizer, falling back to un-optimized query")
-            return peer_model.objects.filter(id__in=queryset_ids).first()
+        """
+        Return a list of objects or an object depending on the type of the relationship.
+
+        The peers of all of the objects being resolved in the query are loaded together via a DataLoader.
+        """
+        return load_relationship_peers(self, info, relationship, side, peer_model)
 
     resolve_relationship.__name__ = resolver_name
     return resolve_relationship
@@ -324,6 +264,15 @@ def generate_list_resolver(schema_type, resolver_name):
         else:
             qs = model.objects.restrict(info.context.user, "view").all()
 
+        # Retrieve the config context data of all the objects in the same query if it's requested, unless it must take
+        # Dynamic Groups into account, which annotate_config_context_data() doesn't
+        if (
+            hasattr(qs, "annotate_config_context_data")
+            and not settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED
+            and is_field_selected(info, "config_context")
+        ):
+            qs = qs.annotate_config_context_data()
+
         if offset:
             qs = qs[offset:]
 
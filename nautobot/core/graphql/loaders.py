@@ -0,0 +1,173 @@
+"""DataLoaders for resolving GraphQL fields of many objects at once, rather than with separate queries per object."""
+
+from collections import defaultdict
+import logging
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import F, Q
+import graphene_django_optimizer as gql_optimizer
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from nautobot.extras.choices import RelationshipSideChoices
+from nautobot.extras.models import DynamicGroup, RelationshipAssociation
+
+logger = logging.getLogger(__name__)
+
+
+def get_dataloader(info, key, loader_class, *args, **kwargs):
+    """
+    Get the DataLoader instance for the given key for the GraphQL query execution in progress, creating it if needed.
+
+    Loaders are stored on the request (`info.context`) so that all resolvers of a single execution of a query share
+    them and their requested keys can be batched together. As the same request could be used to execute more than one
+    query, the loaders are discarded whenever a different execution (identified by its variable values, which are
+    unique to each execution) requests a loader, so that the results cached by a loader never outlive the execution.
+
+    Args:
+        info (ResolveInfo): GraphQL resolver information
+        key (tuple): Identifier for the loader, unique to the `loader_class` and its arguments
+        loader_class (type): DataLoader subclass to instantiate if necessary
+        *args, **kwargs: Arguments with which to instantiate `loader_class`
+
+    Returns:
+        (DataLoader): the loader
+    """
+    execution_variables, loaders = getattr(info.context, "_graphql_dataloaders", (None, None))
+    if loaders is None or execution_variables is not info.variable_values:
+        loaders = {}
+        setattr(info.context, "_graphql_dataloaders", (info.variable_values, loaders))
+    key = (loader_class, *key)
+    if key not in loaders:
+        loaders[key] = loader_class(*args, **kwargs)
+    return loaders[key]
+
+
+class RelationshipPeersLoader(DataLoader):
+    """
+    Load the peers of objects on one side of a Relationship, given their primary keys.
+
+    Each batch is resolved with one query for the RelationshipAssociations and one query for the peer objects, which is
+    optimized for the fields requested by the GraphQL query. Each object is loaded as a list of peers if the peer side
+    of the relationship has many objects, else as a single peer object or `None`.
+    """
+
+    def __init__(self, relationship, side, peer_model, info, **kwargs):
+        super().__init__(**kwargs)
+        self.relationship = relationship
+        self.side = side
+        self.peer_model = peer_model
+        self.info = info
+
+    def get_peer_ids(self, keys):
+        """Get a dict of the set of peer IDs for each of the given keys."""
+        peer_side = RelationshipSideChoices.OPPOSITE[self.side]
+        associations = RelationshipAssociation.objects.filter(relationship=self.relationship)
+        peer_ids = defaultdict(set)
+        if not self.relationship.symmetric:
+            associations = associations.filter(**{f"{self.side}_id__in": keys})
+            for obj_id, peer_id in associations.values_list(f"{self.side}_id", f"{peer_side}_id"):
+                peer_ids[obj_id].add(peer_id)
+        else:
+            # Get objects that are peers for this relationship, regardless of side
+            keys = set(keys)
+            associations = associations.filter(Q(source_id__in=keys) | Q(destination_id__in=keys))
+            for source_id, destination_id in associations.values_list("source_id", "destination_id"):
+                if source_id in keys:
+                    peer_ids[source_id].add(destination_id)
+                if destination_id in keys:
+                    peer_ids[destination_id].add(source_id)
+        return peer_ids
+
+    def batch_load_fn(self, keys):
+        peer_ids = self.get_peer_ids(keys)
+        all_peer_ids = set().union(*peer_ids.values())
+        peers = self.peer_model.objects.filter(id__in=all_peer_ids)
+        # https://github.com/nautobot/nautobot/issues/1228
+        # graphene_django_optimizer may raise a TypeError or AttributeError if **only** the ID of the peer is queried,
+        # in which case we fall back to the un-optimized query.
+        try:
+            peers = list(gql_optimizer.query(peers, self.info))
+        except (AttributeError, TypeError):
+            logger.debug("Caught exception in graphene_django_optimizer, falling back to un-optimized query")
+            peers = list(peers)
+
+        # Preserve the peer model's ordering in the results for each object
+        peer_positions = {peer.id: position for position, peer in enumerate(peers)}
+        peer_side = RelationshipSideChoices.OPPOSITE[self.side]
+        results = []
+        for key in keys:
+            key_peers = [
+                peers[position]
+                for position in sorted(
+                    peer_positions[peer_id] for peer_id in peer_ids.get(key, ()) if peer_id in peer_positions
+                )
+            ]
+            if self.relationship.has_many(peer_side):
+                results.append(key_peers)
+            else:
+                results.append(key_peers[0] if key_peers else None)
+        return Promise.resolve(results)
+
+
+class ConfigContextLoader(DataLoader):
+    """
+    Load the rendered config context of objects of a `ConfigContextModel`, given their primary keys.
+
+    Each batch is resolved with a single query using `annotate_config_context_data()`, rather than individually
+    querying the applicable ConfigContexts of each object. As that doesn't take the ConfigContexts assigned to Dynamic
+    Groups into account, the config context of each object is computed individually if
+    `CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED` is True.
+    """
+
+    def __init__(self, model, **kwargs):
+        super().__init__(**kwargs)
+        self.model = model
+
+    def batch_load_fn(self, keys):
+        objects = self.model.objects.filter(pk__in=keys)
+        if not settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+            objects = objects.annotate_config_context_data()
+        config_contexts = {obj.pk: obj.get_config_context() for obj in objects}
+        return Promise.resolve([config_contexts.get(key) for key in keys])
+
+
+class DynamicGroupsLoader(DataLoader):
+    """Load the list of DynamicGroups that objects of the given model are members of, given their primary keys."""
+
+    def __init__(self, model, **kwargs):
+        super().__init__(**kwargs)
+        self.model = model
+
+    def batch_load_fn(self, keys):
+        dynamic_groups = defaultdict(list)
+        queryset = DynamicGroup.objects.filter(
+            content_type=ContentType.objects.get_for_model(self.model._meta.concrete_model),
+            static_group_associations__associated_object_id__in=keys,
+        ).annotate(_associated_object_id=F("static_group_associations__associated_object_id"))
+        for dynamic_group in queryset:
+            dynamic_groups[dynamic_group._associated_object_id].append(dynamic_group)
+        return Promise.resolve([dynamic_groups.get(key, []) for key in keys])
+
+
+def load_config_context(obj, info):
+    """Resolve the config context of the given object, batched with those of other objects of the same model."""
+    # The config context data may have already been annotated onto the object, such as by generate_list_resolver()
+    if hasattr(obj, "config_context_data") or hasattr(obj, "rendered_config_context"):
+        return obj.get_config_context()
+    model = obj._meta.concrete_model
+    return get_dataloader(info, (model,), ConfigContextLoader, model).load(obj.pk)
+
+
+def load_dynamic_groups(obj, info):
+    """Resolve the dynamic groups of the given object, batched with those of other objects of the same model."""
+    model = obj._meta.concrete_model
+    return get_dataloader(info, (model,), DynamicGroupsLoader, model).load(obj.pk)
+
+
+def load_relationship_peers(obj, info, relationship, side, peer_model):
+    """Resolve the peer(s) of the given object in a Relationship, batched with those of other objects."""
+    # Loaders are also keyed by the field in the query, since the peer query is optimized for its requested subfields
+    key = (relationship.pk, side, id(info.field_asts[0]))
+    return get_dataloader(info, key, RelationshipPeersLoader, relationship, side, peer_model, info).load(obj.pk)
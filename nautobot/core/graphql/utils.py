@@ -2,6 +2,7 @@ import logging
 
 from django_filters.filters import BooleanFilter, MultipleChoiceFilter, NumberFilter
 import graphene
+from graphql.language import ast
 
 from nautobot.core.filters import (
     MultiValueBigNumberFilter,
@@ -24,6 +25,37 @@ def str_to_var_name(verbose_name):
     return slugify_dashes_to_underscores(verbose_name)
 
 
+def is_field_selected(info, field_name):
+    """Check whether the given subfield of the field being resolved is selected by the GraphQL query.
+
+    Fragments are taken into account, but directives such as `@include` and `@skip` are not.
+
+    Args:
+        info (ResolveInfo): GraphQL resolver information
+        field_name (str): Name of the subfield to look for
+
+    Returns:
+        (bool): True if the subfield is selected
+    """
+
+    def _is_selected(selection_set):
+        if selection_set is None:
+            return False
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                if selection.name.value == field_name:
+                    return True
+            elif isinstance(selection, ast.FragmentSpread):
+                fragment = info.fragments.get(selection.name.value)
+                if fragment is not None and _is_selected(fragment.selection_set):
+                    return True
+            elif _is_selected(selection.selection_set):  # InlineFragment
+                return True
+        return False
+
+    return any(_is_selected(field_ast.selection_set) for field_ast in info.field_asts)
+
+
 def get_filtering_args_from_filterset(filterset_class):
     """Generate a list of filter arguments from a filterset.
 
@@ -1,6 +1,7 @@
 import codecs
 import contextlib
 from io import BytesIO
+import tempfile
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -16,7 +17,9 @@ from nautobot.core.api.utils import get_serializer_for_model
 from nautobot.core.celery import app, register_jobs
 from nautobot.core.exceptions import AbortTransaction
 from nautobot.core.jobs.cleanup import LogsCleanup
+from nautobot.core.jobs.devices import ProvisionDevices
 from nautobot.core.jobs.groups import RefreshDynamicGroupCaches
+from nautobot.core.models.querysets import chunked_queryset
 from nautobot.core.utils.lookup import get_filterset_for_model
 from nautobot.core.utils.requests import get_filterable_params_from_filter_params
 from nautobot.extras.datasources import ensure_git_repository, git_repository_dry_run, refresh_datasource_content
@@ -122,6 +125,11 @@ class ExportObjectList(Job):
         soft_time_limit = 1800
         time_limit = 2000
 
+    # Number of objects to serialize at a time when exporting to CSV
+    csv_chunk_size = 1000
+    # Number of objects to retrieve at a time when rendering an ExportTemplate
+    export_template_chunk_size = 1000
+
     def run(self, *, content_type, query_string="", export_format="csv", export_template=None):
         if not self.user.has_perm(f"{content_type.app_label}.view_{content_type.model}"):
             self.logger.error('User "%s" does not have permission to view %s objects', self.user, content_type.model)
@@ -173,15 +181,23 @@ class ExportObjectList(Job):
                 object_count,
                 extra={"object": export_template},
             )
-            try:
-                # export_template.render() consumes the whole queryset, so we don't have any way to do a progress bar.
-                output = export_template.render(queryset)
-            except Exception as err:
-                self.logger.error("Error when rendering ExportTemplate: %s", err)
-                raise
             if export_template.file_extension:
                 filename += f".{export_template.file_extension}"
-            self.create_file(filename, output)
+
+            def report_progress(rendered_count):
+                self.logger.debug("Rendered %d of %d objects", rendered_count, object_count)
+
+            # Write the rendered output to a temporary file as it's rendered, rather than building it all in memory
+            with tempfile.TemporaryFile() as output_file:
+                try:
+                    for output in export_template.render_stream(
+                        queryset, chunk_size=self.export_template_chunk_size, progress_callback=report_progress
+                    ):
+                        output_file.write(output.encode("utf-8"))
+                except Exception as err:
+                    self.logger.error("Error when rendering ExportTemplate: %s", err)
+                    raise
+                self.create_file(filename, output_file)
 
         elif export_format == "yaml":
             # Device-type (etc.) YAML export
@@ -198,11 +214,26 @@ class ExportObjectList(Job):
             self.logger.debug("Found serializer class: `%s`", serializer_class.__name__)
             renderer = NautobotCSVRenderer()
             self.logger.info("Exporting %d objects to CSV. This may take some time.", object_count)
-            # The force_csv=True attribute is a hack, but much easier than trying to construct a valid HttpRequest
-            # object from scratch that passes all implicit and explicit assumptions in Django and DRF.
-            serializer = serializer_class(queryset, many=True, context={"request": None}, force_csv=True)
-            csv_data = renderer.render(serializer.data)
-            self.create_file(filename + ".csv", csv_data)
+
+            def records():
+                exported_count = 0
+                for chunk in chunked_queryset(queryset, chunk_size=self.csv_chunk_size):
+                    # The force_csv=True attribute is a hack, but much easier than trying to construct a valid
+                    # HttpRequest object from scratch that passes all implicit and explicit assumptions in Django/DRF.
+                    data = serializer_class(chunk, many=True, context={"request": None}, force_csv=True).data
+                    yield from data
+                    exported_count += len(data)
+                    self.logger.debug("Exported %d of %d objects", exported_count, object_count)
+
+            custom_field_keys = None
+            if hasattr(model, "_custom_field_data"):
+                custom_field_keys = renderer.get_custom_field_keys(model)
+
+            # Write the CSV rows to a temporary file as they're rendered, rather than building the whole file in memory
+            with tempfile.TemporaryFile() as csv_file:
+                for line in renderer.render_stream(records(), custom_field_keys=custom_field_keys):
+                    csv_file.write(line.encode("utf-8"))
+                self.create_file(filename + ".csv", csv_file)
 
 
 class ImportObjects(Job):
@@ -331,5 +362,13 @@ class ImportObjects(Job):
             raise RunJobTaskFailed("CSV import not fully successful, see logs")
 
 
-jobs = [ExportObjectList, GitRepositorySync, GitRepositoryDryRun, ImportObjects, LogsCleanup, RefreshDynamicGroupCaches]
+jobs = [
+    ExportObjectList,
+    GitRepositorySync,
+    GitRepositoryDryRun,
+    ImportObjects,
+    LogsCleanup,
+    ProvisionDevices,
+    RefreshDynamicGroupCaches,
+]
 register_jobs(*jobs)
@@ -1,13 +1,22 @@
 from datetime import timedelta
+import gzip
+import json
+import tempfile
 
+from django.conf import settings
 from django.core.exceptions import PermissionDenied
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage, get_storage_class
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models.signals import pre_delete
 from django.utils import timezone
 
 from nautobot.core.choices import ChoiceSet
+from nautobot.core.utils import partitions
 from nautobot.core.utils.config import get_settings_or_config
-from nautobot.extras.jobs import IntegerVar, Job, MultiChoiceVar
-from nautobot.extras.models import JobResult, ObjectChange
+from nautobot.core.utils.permissions import get_compiled_constraints, permission_is_exempt
+from nautobot.extras.jobs import BooleanVar, IntegerVar, Job, MultiChoiceVar
+from nautobot.extras.models import JobLogEntry, JobResult, ObjectChange
 from nautobot.extras.signals import _handle_deleted_object
 
 name = "System Jobs"
@@ -26,6 +35,11 @@ class CleanupTypes(ChoiceSet):
 class LogsCleanup(Job):
     """
     System job to clean up ObjectChange and/or JobResult (and JobLogEntry) records older than a given age.
+
+    Records are deleted in batches, each in its own transaction, rather than all at once. If the table of the
+    ObjectChange or JobLogEntry records has been partitioned (see `nautobot.core.utils.partitions`), the partitions
+    holding only expired records are dropped instead, as long as the user may delete all of these records, and the
+    partitions of the upcoming months are created.
     """
 
     cleanup_types = MultiChoiceVar(
@@ -43,12 +57,23 @@ class LogsCleanup(Job):
         required=False,
     )
 
+    archive = BooleanVar(
+        description=(
+            "Save the records to compressed JSON Lines files, one per month, in the storage configured by the "
+            "LOGS_CLEANUP_ARCHIVE_STORAGE setting, before deleting them."
+        ),
+        label="Archive",
+    )
+
     class Meta:
         name = "Logs Cleanup"
         description = "Delete ObjectChange and/or JobResult/JobLogEntry records older than a specified cutoff."
         has_sensitive_variables = False
 
-    def run(self, *, cleanup_types, max_age=None):
+    # Number of records to delete in each transaction, and to retrieve at a time when archiving them
+    batch_size = 1000
+
+    def run(self, *, cleanup_types, max_age=None, archive=False):
         if max_age in (None, ""):
             max_age = get_settings_or_config("CHANGELOG_RETENTION")
             if max_age == 0:
@@ -76,25 +101,144 @@ class LogsCleanup(Job):
             result = {}
 
             if CleanupTypes.JOB_RESULT in cleanup_types:
+                queryset = JobResult.objects.restrict(self.user, "delete").filter(date_done__lt=cutoff)
+                if archive:
+                    self.archive_records(
+                        JobLogEntry.objects.filter(job_result__in=queryset), "job_log_entries", "created"
+                    )
+                    self.archive_records(queryset, "job_results", "date_done")
                 self.logger.info("Deleting JobResult records prior to %s", cutoff)
-                _, deleted_dict = JobResult.objects.restrict(self.user, "delete").filter(date_done__lt=cutoff).delete()
-                result.setdefault("extras.JobResult", 0)
-                result.setdefault("extras.JobLogEntry", 0)
-                result.update(**deleted_dict)
+                result["extras.JobResult"] = 0
+                result["extras.JobLogEntry"] = 0
+                if self.can_drop_partitions(JobLogEntry, JobResult):
+                    result["extras.JobLogEntry"] += self.drop_expired_job_log_entry_partitions(cutoff)
+                for label, count in self.delete_in_batches(queryset).items():
+                    result[label] = result.get(label, 0) + count
                 self.logger.info(
                     "Deleted %d JobResult records and their associated %d JobLogEntry records",
                     result["extras.JobResult"],
                     result["extras.JobLogEntry"],
                 )
+                if partitions.is_partitioned(JobLogEntry):
+                    self.create_upcoming_partitions(JobLogEntry)
 
             if CleanupTypes.OBJECT_CHANGE in cleanup_types:
+                queryset = ObjectChange.objects.restrict(self.user, "delete").filter(time__lt=cutoff)
+                if archive:
+                    self.archive_records(queryset, "object_changes", "time")
                 self.logger.info("Deleting ObjectChange records prior to %s", cutoff)
-                deleted_count, _ = ObjectChange.objects.restrict(self.user, "delete").filter(time__lt=cutoff).delete()
+                deleted_count = 0
+                if self.can_drop_partitions(ObjectChange, ObjectChange):
+                    for partition in partitions.get_expired_partitions(ObjectChange, cutoff):
+                        deleted_count += partitions.drop_partition(ObjectChange, partition)
+                        self.logger.info("Dropped partition %s of the ObjectChange table", partition.name)
+                deleted_count += self.delete_in_batches(queryset).get("extras.ObjectChange", 0)
                 self.logger.info("Deleted %d ObjectChange records", deleted_count)
                 result["extras.ObjectChange"] = deleted_count
+                if partitions.is_partitioned(ObjectChange):
+                    self.create_upcoming_partitions(ObjectChange)
 
             return result
         finally:
             # Be sure to clean up after ourselves!
             self.logger.debug("Re-connecting signals")
             pre_delete.connect(_handle_deleted_object)
+
+    def get_archive_storage(self):
+        """Return the storage to archive records to, as configured by `settings.LOGS_CLEANUP_ARCHIVE_STORAGE`."""
+        storage_class = get_storage_class(settings.LOGS_CLEANUP_ARCHIVE_STORAGE)
+        if issubclass(storage_class, FileSystemStorage):
+            return storage_class(location=settings.LOGS_CLEANUP_ARCHIVE_ROOT)
+        return storage_class()
+
+    def archive_records(self, queryset, name, date_field):
+        """
+        Save the given records to gzip-compressed JSON Lines files in the archive storage, one per month of their
+        `date_field`, matching the monthly partitions of the ObjectChange and JobLogEntry tables.
+        """
+        dates = queryset.order_by().values_list(date_field, flat=True)
+        first, last = dates.order_by(date_field).first(), dates.order_by(f"-{date_field}").first()
+        if first is None:
+            return
+        self.logger.info("Archiving %s records", queryset.model.__name__)
+        storage = self.get_archive_storage()
+        lower = partitions.get_month_start(first)
+        while lower <= last:
+            upper = partitions.get_month_start(lower, 1)
+            records = queryset.filter(**{f"{date_field}__gte": lower, f"{date_field}__lt": upper})
+            count = 0
+            # Write the records to a temporary file as they're retrieved, rather than holding them all in memory
+            with tempfile.TemporaryFile() as archive_file:
+                with gzip.GzipFile(fileobj=archive_file, mode="wb") as gzip_file:
+                    for record in records.order_by().values().iterator(chunk_size=self.batch_size):
+                        gzip_file.write(json.dumps(record, cls=DjangoJSONEncoder).encode("utf-8") + b"\n")
+                        count += 1
+                if count:
+                    archive_file.seek(0)
+                    filename = storage.save(f"{name}/nautobot_{name}_{lower:%Y-%m}.jsonl.gz", File(archive_file))
+                    self.logger.info("Archived %d %s records to %s", count, queryset.model.__name__, filename)
+            lower = upper
+
+    def delete_in_batches(self, queryset):
+        """
+        Delete the given records `batch_size` at a time, each batch in its own transaction, so as not to lock the
+        table for long.
+
+        Returns:
+            (dict): the number of records deleted of each model, as returned by `QuerySet.delete()`
+        """
+        deleted = {}
+        pk_queryset = queryset.order_by().values_list("pk", flat=True)
+        while True:
+            pks = list(pk_queryset[: self.batch_size])
+            if not pks:
+                return deleted
+            _, deleted_dict = queryset.model.objects.filter(pk__in=pks).delete()
+            for label, count in deleted_dict.items():
+                deleted[label] = deleted.get(label, 0) + count
+
+    def can_drop_partitions(self, model, permission_model):
+        """
+        Return whether records of the given model can be deleted by dropping partitions of its table, that is, if it is
+        partitioned and if the user may delete all objects of the given permission model.
+        """
+        if not partitions.is_partitioned(model):
+            return False
+        permission = f"{permission_model._meta.app_label}.delete_{permission_model._meta.model_name}"
+        if self.user.is_superuser or permission_is_exempt(permission):
+            return True
+        return (
+            permission in self.user.get_all_permissions()
+            and get_compiled_constraints(self.user, permission).unrestricted
+        )
+
+    def drop_expired_job_log_entry_partitions(self, cutoff):
+        """
+        Drop the partitions of the JobLogEntry table that only hold records older than the cutoff, except for those
+        holding records of any JobResult that is not being deleted, such as one that ran for a long time.
+
+        Returns:
+            (int): the number of JobLogEntry records dropped
+        """
+        retained_job_results = JobResult.objects.exclude(date_done__lt=cutoff)
+        dropped_count = 0
+        for partition in partitions.get_expired_partitions(JobLogEntry, cutoff):
+            retained_job_log_entries = JobLogEntry.objects.filter(
+                created__lt=partition.upper,
+                job_result__in=retained_job_results.filter(date_created__lt=partition.upper),
+            )
+            if partition.lower is not None:
+                retained_job_log_entries = retained_job_log_entries.filter(created__gte=partition.lower)
+            if retained_job_log_entries.exists():
+                self.logger.info(
+                    "Not dropping partition %s of the JobLogEntry table, as it is still in use", partition.name
+                )
+                continue
+            dropped_count += partitions.drop_partition(JobLogEntry, partition)
+            self.logger.info("Dropped partition %s of the JobLogEntry table", partition.name)
+        return dropped_count
+
+    def create_upcoming_partitions(self, model):
+        """Create the partitions of the table of the given model for the upcoming months, if not already done."""
+        for name in partitions.create_monthly_partitions(model):
+            self.logger.info("Created partition %s of the %s table", name, model.__name__)
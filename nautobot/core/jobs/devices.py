@@ -0,0 +1,99 @@
+from django.core.exceptions import PermissionDenied
+
+from nautobot.dcim.models import Device, DeviceType, Location, Platform, Rack
+from nautobot.dcim.models.devices import deferred_component_creation
+from nautobot.extras.context_managers import deferred_change_logging_for_bulk_operation
+from nautobot.extras.jobs import IntegerVar, Job, ObjectVar, RunJobTaskFailed, StringVar
+from nautobot.extras.models import Role, Status
+from nautobot.tenancy.models import Tenant
+
+name = "System Jobs"
+
+
+class ProvisionDevices(Job):
+    """
+    System job to create many Devices of a DeviceType at once.
+
+    The components of all of the Devices are created from the component templates of the DeviceType at once, rather
+    than one Device at a time, and the changes to the Devices are logged in bulk.
+    """
+
+    device_type = ObjectVar(description="Type of the devices to create", model=DeviceType)
+    count = IntegerVar(description="Number of devices to create", min_value=1)
+    name_template = StringVar(
+        description=(
+            'Name of each device, in which "{index}" is replaced by its number, optionally formatted, '
+            'such as "leaf-{index:03d}"'
+        ),
+        label="Name Template",
+    )
+    start_index = IntegerVar(description="Number of the first device", label="Start Index", default=1, required=False)
+    location = ObjectVar(model=Location, query_params={"content_type": Device._meta.label_lower})
+    status = ObjectVar(model=Status, query_params={"content_types": Device._meta.label_lower})
+    role = ObjectVar(model=Role, query_params={"content_types": Device._meta.label_lower})
+    rack = ObjectVar(model=Rack, query_params={"location": "$location"}, required=False)
+    tenant = ObjectVar(model=Tenant, required=False)
+    platform = ObjectVar(model=Platform, required=False)
+
+    class Meta:
+        name = "Provision Devices"
+        description = "Create many devices of a device type at once, along with their components."
+        has_sensitive_variables = False
+
+    def run(
+        self,
+        *,
+        device_type,
+        count,
+        name_template,
+        location,
+        status,
+        role,
+        start_index=1,
+        rack=None,
+        tenant=None,
+        platform=None,
+    ):
+        if not self.user.has_perm("dcim.add_device"):
+            self.logger.error('User "%s" does not have permission to create Device objects', self.user)
+            raise PermissionDenied("User does not have create permissions on Device objects")
+
+        if start_index is None:
+            start_index = 1
+        try:
+            names = [name_template.format(index=index) for index in range(start_index, start_index + count)]
+        except (IndexError, KeyError, ValueError) as exc:
+            raise RunJobTaskFailed(f"Invalid name template {name_template!r}: {exc}")
+        if len(set(names)) != len(names):
+            raise RunJobTaskFailed(f"Name template {name_template!r} doesn't give each device a unique name")
+
+        devices = []
+        with deferred_change_logging_for_bulk_operation(), deferred_component_creation():
+            for device_name in names:
+                device = Device(
+                    name=device_name,
+                    device_type=device_type,
+                    location=location,
+                    status=status,
+                    role=role,
+                    rack=rack,
+                    tenant=tenant,
+                    platform=platform,
+                )
+                device.validated_save()
+                devices.append(device)
+
+            # Enforce object-level permissions, rolling back the creation of all of the devices if any isn't permitted
+            permitted_devices = Device.objects.restrict(self.user, "add").filter(
+                pk__in=[device.pk for device in devices]
+            )
+            if permitted_devices.count() != len(devices):
+                self.logger.error(
+                    'User "%s" does not have permission to create devices with these attributes', self.user
+                )
+                raise PermissionDenied("User does not have permission to create devices with these attributes")
+
+        self.logger.info(
+            "Created %d devices of device type %s", len(devices), device_type, extra={"object": device_type}
+        )
+        return len(devices)
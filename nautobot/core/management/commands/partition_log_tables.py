@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot.core.utils import partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert the tables of the ObjectChange and JobLogEntry records to tables partitioned by month (PostgreSQL only), "
+        "and create the partitions of the upcoming months."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            dest="months_ahead",
+            help="Number of months after the current one to create the partitions of (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--create-only",
+            action="store_true",
+            dest="create_only",
+            help="Only create the partitions of the upcoming months of the tables already partitioned",
+        )
+
+    def handle(self, *args, **options):
+        if not partitions.supports_partitioning():
+            raise CommandError("Partitioning of the log tables is only supported with PostgreSQL")
+        if options["months_ahead"] < 0:
+            raise CommandError("--months-ahead must not be negative")
+
+        for model in partitions.get_partitioned_models():
+            table = model._meta.db_table
+            if partitions.is_partitioned(model):
+                created = partitions.create_monthly_partitions(model, months_ahead=options["months_ahead"])
+                self.stdout.write(self.style.SUCCESS(f"Created {len(created)} partitions of {table}"))
+            elif options["create_only"]:
+                self.stdout.write(self.style.NOTICE(f"{table} is not partitioned; skipping"))
+            else:
+                self.stdout.write(f"Partitioning {table}, which may take some time...")
+                partitions.partition_table(model, months_ahead=options["months_ahead"])
+                self.stdout.write(self.style.SUCCESS(f"Partitioned {table}"))
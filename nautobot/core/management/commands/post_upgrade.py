@@ -1,5 +1,6 @@
 import argparse
 
+from django.conf import settings
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
 
@@ -83,6 +84,27 @@ class Command(BaseCommand):
             default=True,
             help="Do not automatically refresh dynamic group member caches.",
         )
+        parser.add_argument(
+            "--no-refresh-config-contexts",
+            action="store_false",
+            dest="refresh_config_contexts",
+            default=True,
+            help="Do not automatically refresh rendered config contexts (if CONFIG_CONTEXT_MATERIALIZATION_ENABLED).",
+        )
+        parser.add_argument(
+            "--no-refresh-tree-closures",
+            action="store_false",
+            dest="refresh_tree_closures",
+            default=True,
+            help="Do not automatically refresh tree closure tables (if TREE_CLOSURE_ENABLED).",
+        )
+        parser.add_argument(
+            "--no-refresh-search-index",
+            action="store_false",
+            dest="refresh_search_index",
+            default=True,
+            help="Do not automatically refresh the search index (if SEARCH_INDEX_ENABLED).",
+        )
 
     def handle(self, *args, **options):
         # Run migrate
@@ -141,3 +163,21 @@ class Command(BaseCommand):
             self.stdout.write("Refreshing dynamic group member caches...")
             call_command("refresh_dynamic_group_member_caches")
             self.stdout.write()
+
+        # Run refresh_config_contexts
+        if options.get("refresh_config_contexts") and settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+            self.stdout.write("Refreshing rendered config contexts...")
+            call_command("refresh_config_contexts")
+            self.stdout.write()
+
+        # Run refresh_tree_closures
+        if options.get("refresh_tree_closures") and settings.TREE_CLOSURE_ENABLED:
+            self.stdout.write("Refreshing tree closure tables...")
+            call_command("refresh_tree_closures")
+            self.stdout.write()
+
+        # Run refresh_search_index
+        if options.get("refresh_search_index") and settings.SEARCH_INDEX_ENABLED:
+            self.stdout.write("Refreshing search index...")
+            call_command("refresh_search_index")
+            self.stdout.write()
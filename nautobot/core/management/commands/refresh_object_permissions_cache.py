@@ -0,0 +1,46 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from nautobot.core.authentication import clear_object_permissions_cache, ObjectPermissionBackend
+
+
+class Command(BaseCommand):
+    help = "Populate the cache of the ObjectPermissions granted to users, such as those with an API token."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "usernames",
+            nargs="*",
+            help="Usernames of the users whose permissions to cache (default: all active users with an unexpired API token)",
+        )
+
+    def handle(self, *args, **options):
+        if settings.OBJECT_PERMISSIONS_CACHE_TIMEOUT == 0:
+            self.stdout.write(
+                self.style.NOTICE("OBJECT_PERMISSIONS_CACHE_TIMEOUT is set to 0; clearing the cache instead")
+            )
+            clear_object_permissions_cache()
+            return
+
+        users = get_user_model().objects.filter(is_active=True)
+        if options["usernames"]:
+            users = users.filter(username__in=options["usernames"])
+        else:
+            users = users.filter(
+                Q(tokens__expires__isnull=True) | Q(tokens__expires__gt=timezone.now()), tokens__isnull=False
+            ).distinct()
+
+        backend = ObjectPermissionBackend()
+        count = 0
+        for user in users.iterator():
+            cache.set(
+                backend.get_object_permissions_cache_key(user.pk),
+                dict(backend.query_object_permissions(user)),
+                settings.OBJECT_PERMISSIONS_CACHE_TIMEOUT,
+            )
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"Cached the object permissions of {count} users"))
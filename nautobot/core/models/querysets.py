@@ -1,4 +1,4 @@
-from django.db.models import Count, OuterRef, Q, QuerySet, Subquery
+from django.db.models import Count, OuterRef, QuerySet, Subquery
 from django.db.models.functions import Coalesce
 
 from nautobot.core.models.utils import deconstruct_composite_key
@@ -33,6 +33,78 @@ def count_related(model, field, *, filter_dict=None, manager_name="objects", dis
     return Coalesce(subquery, 0)
 
 
+def chunked_queryset(queryset, chunk_size=1000):
+    """
+    Split a queryset into a series of smaller querysets, each matching at most `chunk_size` records.
+
+    The primary keys of the queryset are streamed from the database via `.iterator()`, so that a very large queryset
+    can be processed (e.g. serialized or rendered) one chunk at a time without ever holding all of its records in
+    memory at once. The ordering of the original queryset is preserved across and within the chunks.
+
+    Args:
+        queryset (QuerySet): The queryset to split
+        chunk_size (int): Maximum number of records in each chunk
+
+    Yields:
+        (QuerySet): A queryset filtered to the next chunk of records
+    """
+    chunk = []
+    for pk in queryset.values_list("pk", flat=True).iterator(chunk_size=chunk_size):
+        chunk.append(pk)
+        if len(chunk) >= chunk_size:
+            yield queryset.filter(pk__in=chunk)
+            chunk = []
+    if chunk:
+        yield queryset.filter(pk__in=chunk)
+
+
+class ChunkedQuerySetProxy:
+    """
+    Wrapper around a queryset that is iterated over via `chunked_queryset()`, `chunk_size` records at a time.
+
+    All other attributes and methods (such as `count()`, `filter()`, `model`, or indexing and slicing) are passed through
+    to the wrapped queryset, so that the wrapper can be used in place of the queryset by code such as a Jinja2 template that iterates
+    over it, without loading all of its records into memory at once.
+
+    Args:
+        queryset (QuerySet): The queryset to wrap
+        chunk_size (int): Maximum number of records to retrieve at a time
+        progress_callback (callable): Function, if any, to call with the number of records iterated over so far
+            each time another chunk is retrieved
+    """
+
+    def __init__(self, queryset, chunk_size=1000, progress_callback=None):
+        self._queryset = queryset
+        self._chunk_size = chunk_size
+        self._progress_callback = progress_callback
+
+    def __iter__(self):
+        count = 0
+        for chunk in chunked_queryset(self._queryset, chunk_size=self._chunk_size):
+            records = list(chunk)
+            yield from records
+            count += len(records)
+            if self._progress_callback is not None:
+                self._progress_callback(count)
+
+    def __len__(self):
+        return self._queryset.count()
+
+    def __bool__(self):
+        return self._queryset.exists()
+
+    def __getitem__(self, key):
+        return self._queryset[key]
+
+    def __contains__(self, item):
+        if isinstance(item, self._queryset.model):
+            return self._queryset.filter(pk=item.pk).exists()
+        return any(record == item for record in self)
+
+    def __getattr__(self, name):
+        return getattr(self._queryset, name)
+
+
 class CompositeKeyQuerySetMixin:
     """
     Mixin to extend a base queryset class with support for filtering by `composite_key=...` as a virtual parameter.
@@ -130,13 +202,7 @@ class RestrictedQuerySet(CompositeKeyQuerySetMixin, QuerySet):
 
         # Filter the queryset to include only objects with allowed attributes
         else:
-            attrs = Q()
-            tokens = {
-                "$user": user,
-            }
-
-            attrs = permissions.qs_filter_from_constraints(user._object_perm_cache[permission_required], tokens)
-            qs = self.filter(attrs)
+            qs = self.filter(permissions.get_compiled_constraints(user, permission_required).q)
 
         return qs
 
@@ -166,6 +232,41 @@ class RestrictedQuerySet(CompositeKeyQuerySetMixin, QuerySet):
 
         return self.restrict(user, action).filter(pk=pk).exists()
 
+    def check_perms_many(self, user, instances, action="view"):
+        """
+        Check whether the given user can perform the given action with regard to each of the given instances of this model.
+
+        Instances are checked in memory where the constraints of the user's permissions allow it, and all others are
+        checked with a single database query.
+
+        Args:
+          user (User): User instance
+          instances (list): Instances of this queryset's model to check
+          action (str): The action which must be permitted (e.g. "view" for "dcim.view_location"); default is 'view'
+
+        Returns:
+            (dict): Mapping of the primary key of each instance to whether the action is permitted or not
+        """
+        for instance in instances:
+            if not isinstance(instance, self.model):
+                raise TypeError(f"{instance} is not a {self.model}")
+        permission_required = f"{self.model._meta.app_label}.{action}_{self.model._meta.model_name}"
+
+        if user.is_superuser or permissions.permission_is_exempt(permission_required):
+            return {instance.pk: True for instance in instances}
+        if not user.is_authenticated or permission_required not in user.get_all_permissions():
+            return {instance.pk: False for instance in instances}
+
+        constraints = permissions.get_compiled_constraints(user, permission_required)
+        results = {instance.pk: constraints.matches(instance) for instance in instances}
+        unresolved_pks = [pk for pk, permitted in results.items() if permitted is None]
+        if unresolved_pks:
+            permitted_pks = set(
+                self.filter(constraints.q, pk__in=unresolved_pks).order_by().values_list("pk", flat=True)
+            )
+            results.update({pk: pk in permitted_pks for pk in unresolved_pks})
+        return results
+
     def distinct_values_list(self, *fields, flat=False, named=False):
         """Wrapper for `QuerySet.values_list()` that adds the `distinct()` query to return a list of unique values.
 
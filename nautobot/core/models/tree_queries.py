@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.core.cache import cache
 from django.db.models import Case, When
 from tree_queries.models import TreeNode
@@ -15,7 +16,8 @@ class TreeQuerySet(TreeQuerySet_, querysets.RestrictedQuerySet):
         """Custom ancestors method for optimization purposes.
 
         Dynamically computes ancestors either through the tree or through the `parent` foreign key depending on whether
-        tree fields are present on `of`.
+        tree fields are present on `of`, using the closure table of the tree instead of the latter if
+        `settings.TREE_CLOSURE_ENABLED` is True.
         """
         # If `of` has `tree_depth` defined, i.e. if it was retrieved from the database on a queryset where tree fields
         # were enabled (see `TreeQuerySet.with_tree_fields` and `TreeQuerySet.without_tree_fields`), use the default
@@ -24,14 +26,25 @@ class TreeQuerySet(TreeQuerySet_, querysets.RestrictedQuerySet):
         # will then annotate the tree fields and proceed as usual.
         if hasattr(of, "tree_depth") or not hasattr(of, "parent"):
             return super().ancestors(of, include_self=include_self)
-        # In the other case, traverse the `parent` foreign key until the root.
         model_class = of._meta.concrete_model
-        ancestor_pks = []
-        if include_self:
-            ancestor_pks.append(of.pk)
-        while of := of.parent:
-            # Insert in reverse order so that the root is the first element
-            ancestor_pks.insert(0, of.pk)
+        ancestor_pks = None
+        if settings.TREE_CLOSURE_ENABLED:
+            # If `of` is in the closure table of its tree, look up all of its ancestors at once.
+            from nautobot.extras.models import TreeClosure  # avoid circular import
+
+            closures = (
+                TreeClosure.objects.filter(descendant_id=of.pk).order_by("-depth").values_list("ancestor_id", "depth")
+            )
+            if closures:
+                ancestor_pks = [pk for pk, depth in closures if include_self or depth > 0]
+        if ancestor_pks is None:
+            # In the other case, traverse the `parent` foreign key until the root.
+            ancestor_pks = []
+            if include_self:
+                ancestor_pks.append(of.pk)
+            while of := of.parent:
+                # Insert in reverse order so that the root is the first element
+                ancestor_pks.insert(0, of.pk)
         # Maintain API compatibility by returning a queryset instead of a list directly.
         # Reference:
         # https://stackoverflow.com/questions/4916851/django-get-a-queryset-from-array-of-ids-in-specific-order
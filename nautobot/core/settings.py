@@ -81,10 +81,26 @@ if "NAUTOBOT_BANNER_TOP" in os.environ and os.environ["NAUTOBOT_BANNER_TOP"] !=
 if "NAUTOBOT_CHANGELOG_RETENTION" in os.environ and os.environ["NAUTOBOT_CHANGELOG_RETENTION"] != "":
     CHANGELOG_RETENTION = int(os.environ["NAUTOBOT_CHANGELOG_RETENTION"])
 
+# When to serialize and save the change log entries of object changes: "immediate" (as each change is made), "on_commit"
+# (in bulk once the transaction the changes were made in is committed), or "celery" (likewise, but serialized in bulk by
+# a Celery worker).
+CHANGELOG_WRITE_MODE = os.getenv("NAUTOBOT_CHANGELOG_WRITE_MODE", "immediate")
+
 # Disable linking of Config Context objects via Dynamic Groups by default. This could cause performance impacts
 # when a large number of dynamic groups are present
 CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED = is_truthy(os.getenv("NAUTOBOT_CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED", "False"))
 
+# Store the rendered config context of each Device and VirtualMachine, refreshing it whenever it may have changed,
+# rather than computing it every time that it's retrieved
+CONFIG_CONTEXT_MATERIALIZATION_ENABLED = is_truthy(
+    os.getenv("NAUTOBOT_CONFIG_CONTEXT_MATERIALIZATION_ENABLED", "False")
+)
+
+# Incrementally update the cached members of dynamic groups whenever an object is saved
+DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_ENABLED = is_truthy(
+    os.getenv("NAUTOBOT_DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_ENABLED", "False")
+)
+
 # UUID uniquely but anonymously identifying this Nautobot deployment.
 if "NAUTOBOT_DEPLOYMENT_ID" in os.environ and os.environ["NAUTOBOT_DEPLOYMENT_ID"] != "":
     DEPLOYMENT_ID = os.environ["NAUTOBOT_DEPLOYMENT_ID"]
@@ -116,6 +132,9 @@ HTTP_PROXIES = None
 # Send anonymized installation metrics when post_upgrade or send_installation_metrics management commands are run
 INSTALLATION_METRICS_ENABLED = is_truthy(os.getenv("NAUTOBOT_INSTALLATION_METRICS_ENABLED", "True"))
 
+# Maximum number of compiled Jinja2 templates (such as those of computed fields) to cache. Set to 0 to disable caching.
+JINJA2_TEMPLATE_CACHE_SIZE = int(os.getenv("NAUTOBOT_JINJA2_TEMPLATE_CACHE_SIZE", "512"))
+
 # Maximum file size (in bytes) that as running Job can create in a call to `Job.create_file()`. Default is 10 << 20
 if "NAUTOBOT_JOB_CREATE_FILE_MAX_SIZE" in os.environ and os.environ["NAUTOBOT_JOB_CREATE_FILE_MAX_SIZE"] != "":
     JOB_CREATE_FILE_MAX_SIZE = int(os.environ["NAUTOBOT_JOB_CREATE_FILE_MAX_SIZE"])
@@ -123,6 +142,12 @@ if "NAUTOBOT_JOB_CREATE_FILE_MAX_SIZE" in os.environ and os.environ["NAUTOBOT_JO
 # The storage backend to use for Job input files and Job output files
 JOB_FILE_IO_STORAGE = os.getenv("NAUTOBOT_JOB_FILE_IO_STORAGE", "db_file_storage.storage.DatabaseFileStorage")
 
+# Maximum number of log entries of a running Job to buffer before storing them in the database in bulk
+JOB_LOG_BUFFER_SIZE = int(os.getenv("NAUTOBOT_JOB_LOG_BUFFER_SIZE", "100"))
+
+# Maximum age (in seconds) of the buffered log entries of a running Job past which they are stored in the database
+JOB_LOG_BUFFER_TIMEOUT = int(os.getenv("NAUTOBOT_JOB_LOG_BUFFER_TIMEOUT", "1"))
+
 # The file path to a directory where locally installed Jobs can be discovered
 JOBS_ROOT = os.getenv("NAUTOBOT_JOBS_ROOT", os.path.join(NAUTOBOT_ROOT, "jobs").rstrip("/"))
 
@@ -136,6 +161,16 @@ if "NAUTOBOT_LOCATION_NAME_AS_NATURAL_KEY" in os.environ and os.environ["NAUTOBO
 # Log Nautobot deprecation warnings. Note that this setting is ignored (deprecation logs always enabled) if DEBUG = True
 LOG_DEPRECATION_WARNINGS = is_truthy(os.getenv("NAUTOBOT_LOG_DEPRECATION_WARNINGS", "False"))
 
+# The file path to a directory where the LogsCleanup system Job saves the records it archives
+LOGS_CLEANUP_ARCHIVE_ROOT = os.getenv(
+    "NAUTOBOT_LOGS_CLEANUP_ARCHIVE_ROOT", os.path.join(NAUTOBOT_ROOT, "archive").rstrip("/")
+)
+
+# The storage backend to use for the records archived by the LogsCleanup system Job
+LOGS_CLEANUP_ARCHIVE_STORAGE = os.getenv(
+    "NAUTOBOT_LOGS_CLEANUP_ARCHIVE_STORAGE", "django.core.files.storage.FileSystemStorage"
+)
+
 # Setting this to True will display a "maintenance mode" banner at the top of every page.
 MAINTENANCE_MODE = is_truthy(os.getenv("NAUTOBOT_MAINTENANCE_MODE", "False"))
 
@@ -270,6 +305,14 @@ FILTERS_NULL_CHOICE_VALUE = "null"
 
 STRICT_FILTERING = is_truthy(os.getenv("NAUTOBOT_STRICT_FILTERING", "True"))
 
+# Maintain a search index of the searchable text of the objects of the models included in the global search, so that the
+# global search and the `q` filter of these models match against it rather than against each of their searched fields
+SEARCH_INDEX_ENABLED = is_truthy(os.getenv("NAUTOBOT_SEARCH_INDEX_ENABLED", "False"))
+
+# Maintain the closure table of the tree of each TreeModel (such as Location), so that filtering by the descendants or
+# looking up the ancestors of a node doesn't require walking the tree
+TREE_CLOSURE_ENABLED = is_truthy(os.getenv("NAUTOBOT_TREE_CLOSURE_ENABLED", "False"))
+
 #
 # Django REST framework (API)
 #
@@ -839,6 +882,8 @@ GRAPHENE = {
 GRAPHQL_CUSTOM_FIELD_PREFIX = "cf"
 GRAPHQL_RELATIONSHIP_PREFIX = "rel"
 GRAPHQL_COMPUTED_FIELD_PREFIX = "cpf"
+# Maximum number of parsed and validated GraphQL query documents to cache. Set to 0 to disable caching.
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.getenv("NAUTOBOT_GRAPHQL_DOCUMENT_CACHE_SIZE", "256"))
 
 
 #
@@ -864,6 +909,9 @@ CACHES = {
 # Number of seconds to cache ContentType lookups. Set to 0 to disable caching.
 CONTENT_TYPE_CACHE_TIMEOUT = int(os.getenv("NAUTOBOT_CONTENT_TYPE_CACHE_TIMEOUT", "0"))
 
+# Number of seconds to cache the ObjectPermissions granted to each user. Set to 0 to disable caching.
+OBJECT_PERMISSIONS_CACHE_TIMEOUT = int(os.getenv("NAUTOBOT_OBJECT_PERMISSIONS_CACHE_TIMEOUT", "0"))
+
 #
 # Celery (used for background processing)
 #
@@ -7,7 +7,7 @@ import logging
 
 from django.contrib.auth.signals import user_logged_in, user_logged_out
 from django.core.cache import cache
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver, Signal
 import redis.exceptions
 
@@ -73,3 +73,50 @@ def invalidate_max_depth_cache(sender, **kwargs):
 
     with contextlib.suppress(redis.exceptions.ConnectionError):
         cache.delete(sender.objects.max_depth_cache_key)
+
+
+@receiver(post_save, sender="users.ObjectPermission")
+@receiver(post_delete, sender="users.ObjectPermission")
+@receiver(post_delete, sender="auth.Group")
+def invalidate_object_permissions_cache_for_all_users(sender, **kwargs):
+    """Clear the cached ObjectPermissions of all users, as an ObjectPermission or group was changed or deleted."""
+    from nautobot.core.authentication import invalidate_object_permissions_cache
+
+    invalidate_object_permissions_cache()
+
+
+@receiver(post_save, sender="users.User")
+@receiver(post_delete, sender="users.User")
+def invalidate_object_permissions_cache_for_user(sender, instance, **kwargs):
+    """Clear the cached ObjectPermissions of a user that was changed or deleted."""
+    from nautobot.core.authentication import invalidate_object_permissions_cache
+
+    invalidate_object_permissions_cache([instance.pk])
+
+
+@receiver(m2m_changed)
+def invalidate_object_permissions_cache_on_m2m_change(sender, instance, action, pk_set, **kwargs):
+    """Clear the cached ObjectPermissions of the affected users when ObjectPermission or group assignments change."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    from django.contrib.auth import get_user_model
+
+    from nautobot.core.authentication import invalidate_object_permissions_cache
+    from nautobot.users.models import ObjectPermission
+
+    User = get_user_model()
+    if sender in (
+        ObjectPermission.users.through,
+        ObjectPermission.groups.through,
+        ObjectPermission.object_types.through,
+    ):
+        invalidate_object_permissions_cache()
+    elif sender is User.groups.through:
+        if isinstance(instance, User):
+            invalidate_object_permissions_cache([instance.pk])
+        elif pk_set is None:
+            # All users were removed from the group
+            invalidate_object_permissions_cache()
+        else:
+            invalidate_object_permissions_cache(pk_set)
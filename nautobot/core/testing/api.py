@@ -574,12 +574,13 @@ class APIViewTestCases:
             # will likely be rendered incorrectly as an API URL, and that API URL *will* differ between the
             # two responses based on the inclusion or omission of the "?format=csv" parameter. If
             # you run into this, make sure all serializers have `Meta.fields = "__all__"` set.
+            # CSV list responses are streamed, so use getvalue() rather than content to retrieve the response data.
             self.assertEqual(
-                response_1.content.decode(response_1.charset), response_2.content.decode(response_2.charset)
+                response_1.getvalue().decode(response_1.charset), response_2.getvalue().decode(response_2.charset)
             )
 
             # Load the csv data back into a list of object dicts
-            reader = csv.DictReader(StringIO(response_1.content.decode(response_1.charset)))
+            reader = csv.DictReader(StringIO(response_1.getvalue().decode(response_1.charset)))
             rows = list(reader)
             # Should only have one entry (instance1) since we filtered out instance2 and permissions block instance3
             self.assertEqual(1, len(rows))
@@ -2,13 +2,14 @@ import csv
 from io import BytesIO, StringIO
 import json
 import os
-from unittest import skip
+from unittest import mock, skip
 
 from constance import config
 from constance.test import override_config
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db.models.query import QuerySet
 from django.test import override_settings, RequestFactory, TestCase
 from django.urls import reverse
 from rest_framework import status
@@ -30,6 +31,7 @@ from nautobot.extras import choices, models as extras_models
 from nautobot.ipam import models as ipam_models
 from nautobot.ipam.api import serializers as ipam_serializers, views as ipam_api_views
 from nautobot.tenancy import models as tenancy_models
+from nautobot.users import models as users_models
 
 User = get_user_model()
 
@@ -185,6 +187,136 @@ class APIPaginationTestCase(testing.APITestCase):
         self.assertHttpStatus(response, 200)
         self.assertEqual(len(response.data["results"]), config.MAX_PAGE_SIZE)
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=5, MAX_PAGE_SIZE=10)
+    def test_cursor_pagination(self):
+        """Walk through all records using keyset pagination and verify that each is seen exactly once, in order."""
+        expected_pks = [str(pk) for pk in Provider.objects.order_by("pk").values_list("pk", flat=True)]
+        self.assertGreater(len(expected_pks), 3, "Test requires at least four Provider instances")
+
+        seen_pks = []
+        url = f"{self.url}?cursor=&limit=3"
+        while url:
+            response = self.client.get(url, **self.header)
+            self.assertHttpStatus(response, 200)
+            self.assertIsNone(response.data["count"])
+            self.assertIsNone(response.data["previous"])
+            self.assertLessEqual(len(response.data["results"]), 3)
+            seen_pks.extend(str(result["id"]) for result in response.data["results"])
+            url = response.data["next"]
+            if url:
+                self.assertIn("cursor=", url)
+
+        self.assertEqual(seen_pks, expected_pks)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=5, MAX_PAGE_SIZE=10)
+    def test_cursor_pagination_invalid_cursor(self):
+        """An invalid cursor value results in a 404 response."""
+        for cursor in ["not-base64!", "bm90IGpzb24=", "WyJub3QtYS11dWlkIl0="]:
+            response = self.client.get(f"{self.url}?cursor={cursor}", **self.header)
+            self.assertHttpStatus(response, 404)
+
+
+class APIBulkOperationsTestCase(testing.APITestCase):
+    """Test the bulk update and bulk destroy operations of our ModelViewSet."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse("circuits-api:provider-list")
+        cls.providers = [Provider.objects.create(name=f"Bulk Operations Provider {i}") for i in range(3)]
+
+    def get_object_changes(self, action):
+        return extras_models.ObjectChange.objects.filter(
+            changed_object_type=ContentType.objects.get_for_model(Provider),
+            changed_object_id__in=[provider.pk for provider in self.providers],
+            action=action,
+        )
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_bulk_update_in_bulk(self):
+        """Updates of fields that can be updated in bulk are applied with a single bulk_update() query."""
+        self.add_permissions("circuits.change_provider")
+        data = [{"id": str(provider.pk), "account": f"Account {i}"} for i, provider in enumerate(self.providers)]
+
+        with mock.patch.object(QuerySet, "bulk_update", autospec=True, side_effect=QuerySet.bulk_update) as bulk_update:
+            response = self.client.patch(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        bulk_update.assert_called_once()
+        self.assertEqual(
+            sorted((result["id"], result["account"]) for result in response.data),
+            sorted((item["id"], item["account"]) for item in data),
+        )
+        for i, provider in enumerate(self.providers):
+            provider.refresh_from_db()
+            self.assertEqual(provider.account, f"Account {i}")
+            self.assertGreater(provider.last_updated, provider.created)
+
+        object_changes = self.get_object_changes(choices.ObjectChangeActionChoices.ACTION_UPDATE)
+        self.assertEqual(object_changes.count(), len(self.providers))
+        self.assertEqual(len(set(object_changes.values_list("request_id", flat=True))), 1)
+        self.assertEqual(object_changes.first().object_data["account"], object_changes.first().changed_object.account)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_bulk_update_one_at_a_time(self):
+        """Updates of unique fields are applied one object at a time."""
+        self.add_permissions("circuits.change_provider")
+        # Providers are updated in order of their names, so the second one can take the first one's former name
+        data = [
+            {"id": str(self.providers[1].pk), "name": self.providers[0].name},
+            {"id": str(self.providers[0].pk), "name": "Renamed Provider"},
+        ]
+
+        with mock.patch.object(QuerySet, "bulk_update", autospec=True, side_effect=QuerySet.bulk_update) as bulk_update:
+            response = self.client.patch(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        bulk_update.assert_not_called()
+        self.assertEqual(Provider.objects.get(pk=self.providers[0].pk).name, "Renamed Provider")
+        self.assertEqual(Provider.objects.get(pk=self.providers[1].pk).name, self.providers[0].name)
+        self.assertEqual(self.get_object_changes(choices.ObjectChangeActionChoices.ACTION_UPDATE).count(), 2)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_bulk_update_summary(self):
+        self.add_permissions("circuits.change_provider")
+        data = [{"id": str(provider.pk), "comments": "Bulk updated"} for provider in self.providers]
+
+        response = self.client.patch(f"{self.url}?summary=true", data, format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data, {"count": len(self.providers)})
+        self.assertEqual(Provider.objects.filter(comments="Bulk updated").count(), len(self.providers))
+
+        response = self.client.patch(f"{self.url}?summary=maybe", data, format="json", **self.header)
+        self.assertHttpStatus(response, 400)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_bulk_update_object_permissions(self):
+        """Updates resulting in objects that the user isn't permitted to change are rolled back."""
+        obj_perm = users_models.ObjectPermission.objects.create(
+            name="Test permission", constraints={"account": ""}, actions=["change"]
+        )
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Provider))
+        data = [{"id": str(provider.pk), "account": "Not permitted"} for provider in self.providers]
+
+        response = self.client.patch(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, 403)
+        self.assertFalse(Provider.objects.filter(account="Not permitted").exists())
+        self.assertFalse(self.get_object_changes(choices.ObjectChangeActionChoices.ACTION_UPDATE).exists())
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_bulk_destroy(self):
+        self.add_permissions("circuits.delete_provider")
+        data = [{"id": str(provider.pk)} for provider in self.providers[:2]]
+
+        response = self.client.delete(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, 204)
+        self.assertFalse(Provider.objects.filter(pk__in=[item["id"] for item in data]).exists())
+        self.assertEqual(self.get_object_changes(choices.ObjectChangeActionChoices.ACTION_DELETE).count(), 2)
+
+        data = [{"id": str(self.providers[2].pk)}]
+        response = self.client.delete(f"{self.url}?summary=true", data, format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data, {"count": 1})
+        self.assertFalse(Provider.objects.filter(pk=self.providers[2].pk).exists())
+
 
 class APIVersioningTestCase(testing.APITestCase):
     """
@@ -514,6 +646,29 @@ class NautobotCSVRendererTest(TestCase):
         self.assertIn("parent__name", read_data)
         self.assertEqual(read_data["parent__name"], location_type.parent.name)
 
+    def test_render_stream(self):
+        records = [
+            {"id": "1", "name": "first", "url": "http://example.com/1/", "custom_fields": {"b": None}},
+            {"id": "2", "name": "second", "url": "http://example.com/2/", "custom_fields": {"a": "x", "b": 3}},
+        ]
+        renderer = NautobotCSVRenderer()
+
+        lines = list(renderer.render_stream(iter(records), custom_field_keys=["b", "a"]))
+
+        # One line for the headers, then one line per record
+        self.assertEqual(len(lines), 3)
+        # Custom field headers come from the provided keys, not from the (incomplete) first record
+        self.assertEqual(lines[0], "name,id,cf_a,cf_b\r\n")
+        self.assertEqual(lines, renderer.render(records).splitlines(keepends=True))
+        self.assertEqual(
+            list(csv.DictReader(StringIO("".join(lines)))),
+            [
+                {"id": "1", "name": "first", "cf_a": "", "cf_b": ""},
+                {"id": "2", "name": "second", "cf_a": "x", "cf_b": "3"},
+            ],
+        )
+        self.assertEqual(list(renderer.render_stream(iter([]))), [])
+
 
 class BaseModelSerializerTest(TestCase):
     """
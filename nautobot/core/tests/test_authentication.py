@@ -1,14 +1,20 @@
+from io import StringIO
+from unittest import mock
 import uuid
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.db.models import Q
 from django.test.utils import override_settings
 from django.urls import reverse
 from netaddr import IPNetwork
 
+from nautobot.core.authentication import invalidate_object_permissions_cache, ObjectPermissionBackend
 from nautobot.core.settings_funcs import sso_auth_enabled
 from nautobot.core.testing import NautobotTestClient, TestCase
 from nautobot.core.utils import lookup
@@ -585,3 +591,143 @@ class ObjectPermissionAPIViewTestCase(TestCase):
             response_user2.data["count"], ObjectChange.objects.filter(Q(user=obj_user2) | Q(action="delete")).count()
         )
         self.assertEqual(response_user2.data["results"][0]["user"]["id"], obj_user2.pk)
+
+
+class ObjectPermissionBackendTestCase(TestCase):
+    """Tests for the evaluation of ObjectPermission constraints against individual objects."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.location_type = LocationType.objects.get(name="Campus")
+        cls.locations = list(Location.objects.filter(location_type=cls.location_type)[:2])
+        cls.other_locations = list(Location.objects.exclude(location_type=cls.location_type)[:2])
+
+    def setUp(self):
+        self.user = User.objects.create(username="testuser")
+
+    def add_constraints(self, constraints):
+        obj_perm = ObjectPermission.objects.create(name="Test permission", constraints=constraints, actions=["change"])
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Location))
+
+    def test_has_perm_evaluated_in_memory(self):
+        self.add_constraints(
+            [{"location_type": str(self.location_type.pk)}, {"pk__in": [str(self.other_locations[0].pk)]}]
+        )
+        # Cache the user's permissions
+        self.assertTrue(self.user.has_perm("dcim.change_location"))
+
+        with self.assertNumQueries(0):
+            for location in self.locations:
+                self.assertTrue(self.user.has_perm("dcim.change_location", location))
+            self.assertTrue(self.user.has_perm("dcim.change_location", self.other_locations[0]))
+            self.assertFalse(self.user.has_perm("dcim.change_location", self.other_locations[1]))
+
+        # Constraints on deferred fields are evaluated in the database
+        location = Location.objects.only("pk").get(pk=self.locations[0].pk)
+        with self.assertNumQueries(1):
+            self.assertTrue(self.user.has_perm("dcim.change_location", location))
+
+    def test_has_perm_evaluated_in_database(self):
+        self.add_constraints({"location_type__name": self.location_type.name})
+        self.assertTrue(self.user.has_perm("dcim.change_location"))
+
+        with self.assertNumQueries(1):
+            self.assertTrue(self.user.has_perm("dcim.change_location", self.locations[0]))
+        with self.assertNumQueries(1):
+            self.assertFalse(self.user.has_perm("dcim.change_location", self.other_locations[0]))
+
+    def test_check_perms_many(self):
+        self.add_constraints([{"location_type": str(self.location_type.pk)}, {"name": self.other_locations[0].name}])
+        self.assertTrue(self.user.has_perm("dcim.change_location"))
+        instances = self.locations + self.other_locations
+
+        # Constraints on CharFields are only evaluated in memory with PostgreSQL, and otherwise in a single query
+        with self.assertNumQueries(0 if connection.vendor == "postgresql" else 1):
+            results = Location.objects.check_perms_many(self.user, instances, action="change")
+        self.assertEqual(
+            results,
+            {
+                self.locations[0].pk: True,
+                self.locations[1].pk: True,
+                self.other_locations[0].pk: True,
+                self.other_locations[1].pk: False,
+            },
+        )
+        self.assertEqual(
+            Location.objects.check_perms_many(self.user, instances, action="delete"),
+            {instance.pk: False for instance in instances},
+        )
+        with self.assertRaises(TypeError):
+            Location.objects.check_perms_many(self.user, [LocationType.objects.first()])
+
+
+@override_settings(OBJECT_PERMISSIONS_CACHE_TIMEOUT=60, EXEMPT_VIEW_PERMISSIONS=[])
+class ObjectPermissionCacheTestCase(TestCase):
+    """Tests for the shared cache of the ObjectPermissions granted to users."""
+
+    def setUp(self):
+        self.user = User.objects.create(username="testuser")
+        self.group = Group.objects.create(name="Test group")
+        self.obj_perm = ObjectPermission.objects.create(name="Test permission", actions=["view"])
+        self.obj_perm.object_types.add(ContentType.objects.get_for_model(Location))
+        invalidate_object_permissions_cache()
+
+    def get_user(self):
+        """Get a new instance of the user, without any permissions cached on the instance itself."""
+        return User.objects.get(pk=self.user.pk)
+
+    def test_permissions_cached(self):
+        self.obj_perm.users.add(self.user)
+        self.assertTrue(self.get_user().has_perm("dcim.view_location"))
+        user = self.get_user()
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_perm("dcim.view_location"))
+            self.assertFalse(user.has_perm("dcim.change_location"))
+
+    def test_cache_invalidated_on_object_permission_change(self):
+        self.assertFalse(self.get_user().has_perm("dcim.view_location"))
+        self.obj_perm.users.add(self.user)
+        self.assertTrue(self.get_user().has_perm("dcim.view_location"))
+        self.obj_perm.actions = ["change"]
+        self.obj_perm.save()
+        self.assertFalse(self.get_user().has_perm("dcim.view_location"))
+        self.assertTrue(self.get_user().has_perm("dcim.change_location"))
+        self.obj_perm.delete()
+        self.assertFalse(self.get_user().has_perm("dcim.change_location"))
+
+    def test_cache_invalidated_on_group_membership_change(self):
+        self.obj_perm.groups.add(self.group)
+        self.assertFalse(self.get_user().has_perm("dcim.view_location"))
+        self.user.groups.add(self.group)
+        self.assertTrue(self.get_user().has_perm("dcim.view_location"))
+        self.group.user_set.remove(self.user)
+        self.assertFalse(self.get_user().has_perm("dcim.view_location"))
+        self.group.user_set.add(self.user)
+        self.assertTrue(self.get_user().has_perm("dcim.view_location"))
+        self.group.delete()
+        self.assertFalse(self.get_user().has_perm("dcim.view_location"))
+
+    def test_refresh_object_permissions_cache_command(self):
+        self.obj_perm.users.add(self.user)
+        Token.objects.create(user=self.user)
+        cache_key = ObjectPermissionBackend.get_object_permissions_cache_key(self.user.pk)
+        self.assertIsNone(cache.get(cache_key))
+
+        call_command("refresh_object_permissions_cache", stdout=StringIO())
+        self.assertEqual(cache.get(cache_key), {"dcim.view_location": [None]})
+
+        with override_settings(OBJECT_PERMISSIONS_CACHE_TIMEOUT=0):
+            call_command("refresh_object_permissions_cache", stdout=StringIO())
+        self.assertIsNone(cache.get(cache_key))
+
+    @override_settings(OBJECT_PERMISSIONS_CACHE_TIMEOUT=0)
+    def test_cache_not_invalidated_when_disabled(self):
+        with mock.patch.object(cache, "delete_pattern") as delete_pattern, mock.patch.object(
+            cache, "delete_many"
+        ) as delete_many:
+            self.obj_perm.users.add(self.user)
+            self.obj_perm.save()
+            self.user.save()
+        delete_pattern.assert_not_called()
+        delete_many.assert_not_called()
@@ -1,5 +1,9 @@
+import time
+from types import SimpleNamespace
+import uuid
+
 from django.contrib.contenttypes.models import ContentType
-from django.test import override_settings, RequestFactory, TestCase
+from django.test import override_settings, RequestFactory, SimpleTestCase, tag, TestCase
 from django.urls import reverse
 
 from nautobot.core.constants import CSV_NO_OBJECT, CSV_NULL_TYPE, VARBINARY_IP_FIELD_REPR_OF_CSV_NO_OBJECT
@@ -259,7 +263,7 @@ class CSVParsingRelatedTestCase(TestCase):
         self.client.force_login(user)
         response = self.client.get(reverse("dcim-api:device-list") + "?format=csv")
         self.assertEqual(response.status_code, 200)
-        response_data = response.content.decode(response.charset)
+        response_data = response.getvalue().decode(response.charset)
 
         # Replace Device Name
         import_data = response_data.replace("TestDevice1", "TestDevice3").replace("TestDevice2", "")
@@ -290,3 +294,30 @@ class CSVParsingRelatedTestCase(TestCase):
             tenant=self.device2.tenant,
         )
         self.assertEqual(device4.tags.count(), 0)
+
+
+@tag("performance")
+class CSVNaturalKeysValuesBenchmarkTestCase(SimpleTestCase):
+    """Benchmark of the lookup of the natural key values of the related objects of each object exported to CSV."""
+
+    # Running this with up to 1,000,000 rows takes about 1.5 microseconds per row at each size
+    row_counts = (10_000, 100_000)
+
+    def time_lookups(self, row_count):
+        serializer = DeviceSerializer(context={"request": None}, force_csv=True)
+        serializer.natural_keys_values = [
+            {"pk": uuid.uuid4(), "location__name": f"Location {i}"} for i in range(row_count)
+        ]
+        instances = [SimpleNamespace(pk=item["pk"]) for item in serializer.natural_keys_values]
+        start = time.perf_counter()
+        for instance in instances:
+            serializer._get_natural_keys_values_for_instance(instance)
+        return time.perf_counter() - start
+
+    def test_natural_keys_values_lookup_scales_linearly(self):
+        """Looking up the natural key values of n objects should take O(n) rather than O(n^2) time."""
+        smaller_time, larger_time = (
+            min(self.time_lookups(row_count) for _ in range(3)) for row_count in self.row_counts
+        )
+        # Ten times as many rows would take a hundred times as long if each lookup scanned the values of all rows
+        self.assertLess(larger_time / smaller_time, 30)
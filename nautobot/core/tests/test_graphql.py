@@ -8,9 +8,11 @@ from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.db.models import Q
 from django.test import override_settings, TestCase
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 import graphene.types
 from graphene_django.registry import get_global_registry
@@ -21,6 +23,7 @@ from rest_framework import status
 
 from nautobot.circuits.models import CircuitTermination, Provider
 from nautobot.core.graphql import execute_query, execute_saved_query
+from nautobot.core.graphql.backends import get_query_hash, NautobotGraphQLBackend
 from nautobot.core.graphql.generators import (
     generate_list_search_parameters,
     generate_schema_type,
@@ -66,6 +69,7 @@ from nautobot.extras.models import (
     ChangeLoggedModel,
     ConfigContext,
     CustomField,
+    DynamicGroup,
     GraphQLQuery,
     Relationship,
     RelationshipAssociation,
@@ -699,6 +703,39 @@ class GraphQLAPIPermissionTest(GraphQLTestCaseBase):
         location_list = list(Location.objects.values_list("name", flat=True))
         self.assertEqual(location_names, location_list)
 
+    def test_graphql_persisted_query(self):
+        """Validate that a query can be executed by its hash once it has been executed with its hash."""
+        query = 'query { racks(name: "Rack 2-1") { name } }'
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": get_query_hash(query)}}
+        get_default_backend().cache_clear()
+
+        response = self.clients[2].post(self.api_url, {"extensions": extensions}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"][0]["message"], "PersistedQueryNotFound")
+
+        response = self.clients[2].post(
+            self.api_url, {"query": query.replace("2-1", "2-2"), "extensions": extensions}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.clients[2].post(self.api_url, {"query": query, "extensions": extensions}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"]["racks"], [{"name": "Rack 2-1"}])
+
+        response = self.clients[2].post(self.api_url, {"extensions": extensions}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"]["racks"], [{"name": "Rack 2-1"}])
+
+    def test_graphql_persisted_saved_query(self):
+        """Validate that a saved GraphQLQuery can be executed by its hash."""
+        saved_query = GraphQLQuery.objects.create(name="Persisted racks", query=self.get_racks_query)
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": saved_query.query_hash}}
+        get_default_backend().cache_clear()
+
+        response = self.clients[2].post(self.api_url, {"extensions": extensions}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["data"]["racks"]), Rack.objects.count())
+
 
 class GraphQLQueryTest(GraphQLTestCaseBase):
     """Execute various GraphQL queries and verify their correct responses."""
@@ -1224,6 +1261,68 @@ query {
         self.assertEqual(custom_field_data[0], {})
         self.assertEqual(result.data["device"]["_custom_field_data"], {})
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_config_context_and_dynamic_groups_batched(self):
+        """Config contexts and dynamic groups of many objects should each be resolved with a single query."""
+        query = """
+            query {
+                locations {
+                    devices {
+                        name
+                        config_context
+                        dynamic_groups { name }
+                    }
+                }
+            }
+        """
+
+        with CaptureQueriesContext(connection) as queries:
+            result = self.execute_query(query)
+
+        self.assertIsNone(result.errors)
+        devices = [device for location in result.data["locations"] for device in location["devices"]]
+        self.assertEqual(len(devices), Device.objects.count())
+        for item in devices:
+            device = Device.objects.get(name=item["name"])
+            self.assertEqual(item["config_context"], device.get_config_context())
+            self.assertEqual(
+                sorted(group["name"] for group in item["dynamic_groups"]),
+                sorted(device.dynamic_groups.values_list("name", flat=True)),
+            )
+        self.assertEqual(
+            len([query for query in queries.captured_queries if '"extras_configcontext"' in query["sql"]]), 1
+        )
+        self.assertEqual(
+            len([query for query in queries.captured_queries if 'FROM "extras_dynamicgroup"' in query["sql"]]), 1
+        )
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED=True)
+    def test_query_config_context_dynamic_groups(self):
+        """Config contexts assigned to Dynamic Groups should be included when they're enabled."""
+        device = Device.objects.filter(name__isnull=False).first()
+        dynamic_group = DynamicGroup.objects.create(
+            name="Config Context Dynamic Group",
+            content_type=ContentType.objects.get_for_model(Device),
+            filter={"name": [device.name]},
+        )
+        dynamic_group.update_cached_members()
+        config_context = ConfigContext.objects.create(name="Dynamic Group Context", data={"dynamic_group": True})
+        config_context.dynamic_groups.add(dynamic_group)
+
+        for query in [
+            "query { devices { name config_context } }",
+            "query { locations { devices { name config_context } } }",
+        ]:
+            result = self.execute_query(query)
+            self.assertIsNone(result.errors)
+            if "locations" in result.data:
+                devices = [item for location in result.data["locations"] for item in location["devices"]]
+            else:
+                devices = result.data["devices"]
+            item = next(item for item in devices if item["name"] == device.name)
+            self.assertEqual(item["config_context"], device.get_config_context())
+            self.assertTrue(item["config_context"]["dynamic_group"])
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_query_console_ports_cable_peer(self):
         """Test querying console port terminations for their cable peers"""
@@ -2434,6 +2533,57 @@ query {
         self.assertEqual(result.data["device"]["interfaces"][0], expected_interfaces_first)
 
 
+class NautobotGraphQLBackendTestCase(UnitTestTestCase):
+    """Test the caching of parsed and validated documents by NautobotGraphQLBackend."""
+
+    class Query(graphene.ObjectType):
+        greeting = graphene.String(name=graphene.String(default_value="world"))
+
+        def resolve_greeting(self, info, name):
+            return f"Hello {name}"
+
+    schema = graphene.Schema(query=Query)
+
+    @override_settings(GRAPHQL_DOCUMENT_CACHE_SIZE=2)
+    def test_document_cache(self):
+        backend = NautobotGraphQLBackend()
+        query = '{ greeting(name: "you") }'
+        document = backend.document_from_string(self.schema, query)
+        self.assertIs(backend.document_from_string(self.schema, query), document)
+        self.assertIs(backend.get_cached_document(self.schema, get_query_hash(query)), document)
+        self.assertEqual(backend.cache_info(), (2, 1, 2, 1))
+        self.assertEqual(document.execute().data, {"greeting": "Hello you"})
+
+        # Documents are cached per schema
+        other_schema = graphene.Schema(query=self.Query)
+        self.assertIsNot(backend.document_from_string(other_schema, query), document)
+        self.assertIsNone(backend.get_cached_document(other_schema, get_query_hash("{ greeting }")))
+
+        # The least recently used document is evicted
+        backend.document_from_string(self.schema, "{ greeting }")
+        self.assertIsNone(backend.get_cached_document(self.schema, get_query_hash(query)))
+        self.assertEqual(backend.cache_info().currsize, 2)
+
+    @override_settings(GRAPHQL_DOCUMENT_CACHE_SIZE=2)
+    def test_invalid_document(self):
+        backend = NautobotGraphQLBackend()
+        with self.assertRaises(GraphQLError):
+            backend.document_from_string(self.schema, "{ greeting ")
+        document = backend.document_from_string(self.schema, "{ nonexistent }")
+        for _ in range(2):
+            result = document.execute()
+            self.assertTrue(result.invalid)
+            self.assertIn("nonexistent", str(result.errors[0]))
+
+    @override_settings(GRAPHQL_DOCUMENT_CACHE_SIZE=0)
+    def test_document_cache_disabled(self):
+        backend = NautobotGraphQLBackend()
+        document = backend.document_from_string(self.schema, "{ greeting }")
+        self.assertIsNot(backend.document_from_string(self.schema, "{ greeting }"), document)
+        self.assertEqual(document.execute().data, {"greeting": "Hello world"})
+        self.assertEqual(backend.cache_info(), (0, 0, 0, 0))
+
+
 class GraphQLTypeTestCase(UnitTestTestCase):
     def test_date_type(self):
         date_obj = datetime.date.today()
@@ -1,5 +1,8 @@
 from datetime import timedelta
+import gzip
+import json
 from pathlib import Path
+import tempfile
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
@@ -9,7 +12,19 @@ import yaml
 
 from nautobot.core.jobs.cleanup import CleanupTypes
 from nautobot.core.testing import create_job_result_and_run_job, TransactionTestCase
-from nautobot.dcim.models import Device, DeviceType, Location, LocationType, Manufacturer
+from nautobot.dcim.choices import InterfaceTypeChoices, PortTypeChoices
+from nautobot.dcim.models import (
+    Device,
+    DeviceType,
+    FrontPort,
+    FrontPortTemplate,
+    InterfaceTemplate,
+    Location,
+    LocationType,
+    Manufacturer,
+    RearPort,
+    RearPortTemplate,
+)
 from nautobot.extras.choices import JobResultStatusChoices, LogLevelChoices
 from nautobot.extras.factory import JobResultFactory, ObjectChangeFactory
 from nautobot.extras.models import (
@@ -535,3 +550,122 @@ class LogsCleanupTestCase(TransactionTestCase):
         self.assertTrue(JobResult.objects.filter(date_done__gte=cutoff).exists())
         self.assertFalse(ObjectChange.objects.filter(time__lt=cutoff).exists())
         self.assertTrue(ObjectChange.objects.filter(time__gte=cutoff).exists())
+
+    def test_cleanup_with_archive(self):
+        """With archive selected, the deleted records should be saved to monthly files in the archive storage."""
+        cutoff = timezone.now() - timedelta(days=60)
+        job_result_count = JobResult.objects.filter(date_done__lt=cutoff).count()
+        object_change_count = ObjectChange.objects.filter(time__lt=cutoff).count()
+        with tempfile.TemporaryDirectory() as archive_root:
+            with self.settings(LOGS_CLEANUP_ARCHIVE_ROOT=archive_root):
+                job_result = create_job_result_and_run_job(
+                    "nautobot.core.jobs.cleanup",
+                    "LogsCleanup",
+                    cleanup_types=[CleanupTypes.JOB_RESULT, CleanupTypes.OBJECT_CHANGE],
+                    max_age=60,
+                    archive=True,
+                )
+            self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+            self.assertEqual(job_result.result["extras.JobResult"], job_result_count)
+            self.assertEqual(job_result.result["extras.ObjectChange"], object_change_count)
+            # Archives aren't attached to the JobResult, so as not to be deleted along with it
+            self.assertFalse(job_result.files.exists())
+
+            for name, count in (("job_results", job_result_count), ("object_changes", object_change_count)):
+                with self.subTest(name=name):
+                    archive_files = sorted(Path(archive_root, name).glob(f"nautobot_{name}_*.jsonl.gz"))
+                    records = []
+                    for archive_file in archive_files:
+                        records.extend(
+                            json.loads(line) for line in gzip.decompress(archive_file.read_bytes()).splitlines()
+                        )
+                    self.assertEqual(len(records), count)
+                    self.assertTrue(all(record["id"] for record in records))
+        self.assertFalse(ObjectChange.objects.filter(time__lt=cutoff).exists())
+
+
+class ProvisionDevicesTestCase(TransactionTestCase):
+    """
+    Test the ProvisionDevices system job.
+    """
+
+    databases = ("default", "job_logs")
+
+    def setUp(self):
+        super().setUp()
+        manufacturer = Manufacturer.objects.create(name="Provisioning Manufacturer")
+        self.device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Provisioning Device Type")
+        rear_port_template = RearPortTemplate.objects.create(
+            device_type=self.device_type, name="Rear 1", type=PortTypeChoices.TYPE_8P8C, positions=2
+        )
+        for position in (1, 2):
+            FrontPortTemplate.objects.create(
+                device_type=self.device_type,
+                name=f"Front {position}",
+                type=PortTypeChoices.TYPE_8P8C,
+                rear_port_template=rear_port_template,
+                rear_port_position=position,
+            )
+        InterfaceTemplate.objects.create(
+            device_type=self.device_type, name="eth0", type=InterfaceTypeChoices.TYPE_1GE_FIXED
+        )
+        location_type = LocationType.objects.create(name="Provisioning Location Type")
+        location_type.content_types.add(ContentType.objects.get_for_model(Device))
+        status = Status.objects.create(name="Provisioning Status")
+        status.content_types.add(ContentType.objects.get_for_model(Device), ContentType.objects.get_for_model(Location))
+        self.location = Location.objects.create(
+            name="Provisioning Location", location_type=location_type, status=status
+        )
+        self.status = status
+        self.role = Role.objects.create(name="Provisioning Role")
+        self.role.content_types.add(ContentType.objects.get_for_model(Device))
+        self.job_kwargs = {
+            "device_type": self.device_type.pk,
+            "count": 3,
+            "name_template": "leaf-{index:02d}",
+            "location": self.location.pk,
+            "status": self.status.pk,
+            "role": self.role.pk,
+        }
+
+    def test_provision_devices_without_permission(self):
+        """Job should enforce user permissions on the devices being created."""
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs", "ProvisionDevices", username=self.user.username, **self.job_kwargs
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+        self.assertFalse(Device.objects.filter(device_type=self.device_type).exists())
+
+        obj_perm = ObjectPermission(name="Test permission", constraints={"name": "leaf-01"}, actions=["add"])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Device))
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs", "ProvisionDevices", username=self.user.username, **self.job_kwargs
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+        self.assertFalse(Device.objects.filter(device_type=self.device_type).exists())
+
+    def test_provision_devices(self):
+        """All of the devices should be created along with their components."""
+        job_result = create_job_result_and_run_job("nautobot.core.jobs", "ProvisionDevices", **self.job_kwargs)
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        self.assertEqual(job_result.result, 3)
+
+        devices = Device.objects.filter(device_type=self.device_type)
+        self.assertEqual(sorted(device.name for device in devices), ["leaf-01", "leaf-02", "leaf-03"])
+        for device in devices:
+            rear_port = RearPort.objects.get(device=device)
+            self.assertEqual(FrontPort.objects.filter(device=device, rear_port=rear_port).count(), 2)
+            self.assertEqual(device.interfaces.count(), 1)
+            self.assertEqual(ObjectChange.objects.filter(changed_object_id=device.pk).count(), 1)
+
+    def test_provision_devices_with_invalid_name_template(self):
+        """Job should fail without creating any devices if the names aren't valid and unique."""
+        for name_template in ("leaf-{number}", "leaf"):
+            with self.subTest(name_template=name_template):
+                job_result = create_job_result_and_run_job(
+                    "nautobot.core.jobs", "ProvisionDevices", **{**self.job_kwargs, "name_template": name_template}
+                )
+                self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+                self.assertFalse(Device.objects.filter(device_type=self.device_type).exists())
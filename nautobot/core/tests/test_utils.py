@@ -1,3 +1,4 @@
+from unittest import skipUnless
 import uuid
 
 from django import forms as django_forms
@@ -5,19 +6,24 @@ from django.apps import apps
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import connection, transaction
 from django.db.models import Q
 from django.http import QueryDict
+from django.test import override_settings, SimpleTestCase
+from django.utils import timezone
+from django.utils.safestring import SafeString
 
 from nautobot.circuits import models as circuits_models
 from nautobot.core import exceptions, forms, settings_funcs
 from nautobot.core.api import utils as api_utils
 from nautobot.core.models import fields as core_fields, utils as models_utils, validators
 from nautobot.core.testing import TestCase
-from nautobot.core.utils import data as data_utils, filtering, lookup, requests
+from nautobot.core.utils import data as data_utils, filtering, lookup, partitions, requests, transactions
 from nautobot.core.utils.migrations import update_object_change_ct_for_replaced_models
 from nautobot.dcim import filters as dcim_filters, forms as dcim_forms, models as dcim_models, tables
 from nautobot.extras import models as extras_models, utils as extras_utils
 from nautobot.extras.choices import ObjectChangeActionChoices, RelationshipTypeChoices
+from nautobot.extras.factory import ObjectChangeFactory
 from nautobot.extras.models import ObjectChange
 from nautobot.extras.registry import registry
 
@@ -758,6 +764,40 @@ class MergeDictsWithoutCollisionTest(TestCase):
         self.assertEqual(str(err.exception), 'Conflicting values for key "a": (1, 2)')
 
 
+class RenderJinja2Test(SimpleTestCase):
+    """Test the render_jinja2() data utility function and its compiled template cache."""
+
+    def setUp(self):
+        data_utils.jinja2_template_cache.cache_clear()
+        self.addCleanup(data_utils.jinja2_template_cache.cache_clear)
+
+    @override_settings(JINJA2_TEMPLATE_CACHE_SIZE=2)
+    def test_template_cache(self):
+        self.assertEqual(data_utils.render_jinja2("{{ a }}", {"a": 1}), "1")
+        self.assertEqual(data_utils.render_jinja2("{{ a }}", {"a": 2}), "2")
+        self.assertEqual(data_utils.jinja2_template_cache.cache_info(), (1, 1, 2, 1))
+
+        data_utils.render_jinja2("{{ b }}", {})
+        data_utils.render_jinja2("{{ a }}", {})
+        # The least recently used template, "{{ b }}", is evicted
+        data_utils.render_jinja2("{{ c }}", {})
+        self.assertEqual(data_utils.jinja2_template_cache.cache_info(), (2, 3, 2, 2))
+        data_utils.render_jinja2("{{ a }}", {})
+        data_utils.render_jinja2("{{ b }}", {})
+        self.assertEqual(data_utils.jinja2_template_cache.cache_info(), (3, 4, 2, 2))
+
+    @override_settings(JINJA2_TEMPLATE_CACHE_SIZE=0)
+    def test_template_cache_disabled(self):
+        self.assertEqual(data_utils.render_jinja2("{{ a }}", {"a": 1}), "1")
+        self.assertEqual(data_utils.render_jinja2("{{ a }}", {"a": 2}), "2")
+        self.assertEqual(data_utils.jinja2_template_cache.cache_info(), (0, 0, 0, 0))
+
+    def test_rendered_content_is_not_safe(self):
+        self.assertNotIsInstance(data_utils.render_jinja2("<b>{{ a }}</b>", {"a": 1}), SafeString)
+        # Also when the template is retrieved from the cache
+        self.assertNotIsInstance(data_utils.render_jinja2("<b>{{ a }}</b>", {"a": 1}), SafeString)
+
+
 class NavigationRelatedUtils(TestCase):
     def get_all_new_ui_ready_route(self):
         ui_ready_routes = [
@@ -809,3 +849,79 @@ class TestMigrationUtils(TestCase):
             )
             self.assertEqual(ObjectChange.objects.get(request_id=request_id).changed_object_type, location_ct)
             self.assertEqual(ObjectChange.objects.get(request_id=request_id).related_object_type, location_ct)
+
+
+@skipUnless(connection.vendor == "postgresql", "Partitioning of the log tables is only supported with PostgreSQL")
+class PartitionsTest(TestCase):
+    """Tests for the monthly partitioning of the log tables."""
+
+    def test_partition_table(self):
+        object_change_count = ObjectChange.objects.count()
+        self.assertFalse(partitions.is_partitioned(ObjectChange))
+
+        partitions.partition_table(ObjectChange, months_ahead=1)
+        self.assertTrue(partitions.is_partitioned(ObjectChange))
+        next_month = partitions.get_month_start(timezone.now(), 1)
+        self.assertEqual(
+            partitions.get_partitions(ObjectChange),
+            [
+                partitions.Partition("extras_objectchange_legacy", None, next_month, False),
+                partitions.Partition(
+                    f"extras_objectchange_p{next_month:%Y%m}",
+                    next_month,
+                    partitions.get_month_start(next_month, 1),
+                    False,
+                ),
+                partitions.Partition("extras_objectchange_default", None, None, True),
+            ],
+        )
+        self.assertEqual(ObjectChange.objects.count(), object_change_count)
+
+        # Records of months without a partition are stored in the default partition until the partition is created
+        object_change = ObjectChangeFactory.create()
+        ObjectChange.objects.filter(pk=object_change.pk).update(time=partitions.get_month_start(next_month, 3))
+        self.assertEqual(
+            partitions.create_monthly_partitions(ObjectChange, months_ahead=4),
+            [f"extras_objectchange_p{partitions.get_month_start(next_month, months):%Y%m}" for months in (1, 2, 3)],
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT id FROM extras_objectchange_p{partitions.get_month_start(next_month, 3):%Y%m}"  # noqa: S608
+            )
+            self.assertEqual([row[0] for row in cursor.fetchall()], [object_change.pk])
+
+        expired_partitions = partitions.get_expired_partitions(ObjectChange, next_month)
+        self.assertEqual([partition.name for partition in expired_partitions], ["extras_objectchange_legacy"])
+        self.assertEqual(partitions.drop_partition(ObjectChange, expired_partitions[0]), object_change_count)
+        self.assertEqual(list(ObjectChange.objects.values_list("pk", flat=True)), [object_change.pk])
+
+
+class TransactionsTest(TestCase):
+    class Callback:
+        def __init__(self):
+            self.values = []
+
+        def __call__(self):
+            TransactionsTest.calls.append(self.values)
+
+    def test_get_on_commit_callback(self):
+        TransactionsTest.calls = []
+        with self.captureOnCommitCallbacks(execute=True):
+            transactions.get_on_commit_callback("test", self.Callback).values.append(1)
+            transactions.get_on_commit_callback("test", self.Callback).values.append(2)
+            # Callbacks registered within a savepoint that's rolled back are replaced
+            with self.assertRaises(ValueError):
+                with transaction.atomic():
+                    transactions.get_on_commit_callback("rolled_back", self.Callback).values.append(3)
+                    transactions.get_on_commit_callback("savepoint", self.Callback, per_savepoint=True).values.append(4)
+                    raise ValueError
+            transactions.get_on_commit_callback("rolled_back", self.Callback).values.append(5)
+            with transaction.atomic():
+                transactions.get_on_commit_callback("savepoint", self.Callback, per_savepoint=True).values.append(6)
+            transactions.get_on_commit_callback("savepoint", self.Callback, per_savepoint=True).values.append(7)
+        self.assertEqual(TransactionsTest.calls, [[1, 2], [5], [6], [7]])
+
+        # Once called, a new callback is registered
+        with self.captureOnCommitCallbacks(execute=True):
+            transactions.get_on_commit_callback("test", self.Callback).values.append(8)
+        self.assertEqual(TransactionsTest.calls, [[1, 2], [5], [6], [7], [8]])
@@ -1,15 +1,26 @@
 from collections import namedtuple, OrderedDict
 from decimal import Decimal
+import hashlib
+import threading
 import uuid
 
+from django.conf import settings
 from django.core import validators
 from django.template import engines
+from prometheus_client import Counter
 
 from nautobot.dcim import choices  # TODO move dcim.choices.CableLengthUnitChoices into core
 
 # Setup UtilizationData named tuple for use by multiple methods
 UtilizationData = namedtuple("UtilizationData", ["numerator", "denominator"])
 
+# Statistics of the compiled Jinja2 template cache, in the same form as `functools.lru_cache().cache_info()`
+Jinja2TemplateCacheInfo = namedtuple("Jinja2TemplateCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+JINJA2_TEMPLATE_CACHE_METRIC = Counter(
+    "nautobot_jinja2_template_cache_lookups", "Lookups of compiled Jinja2 templates by render_jinja2().", ["result"]
+)
+
 
 def deepmerge(original, new):
     """
@@ -92,12 +103,73 @@ def merge_dicts_without_collision(d1, d2):
     return {**d1, **d2}
 
 
+class Jinja2TemplateCache:
+    """
+    Thread-safe LRU cache of compiled Jinja2 templates, keyed by a hash of their source code.
+
+    The maximum number of templates cached is given by the `JINJA2_TEMPLATE_CACHE_SIZE` setting; `0` disables caching.
+    """
+
+    def __init__(self):
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_template(self, template_code):
+        """Get the compiled template for the given source code, compiling and caching it if not already cached."""
+        rendering_engine = engines["jinja"]
+        maxsize = settings.JINJA2_TEMPLATE_CACHE_SIZE
+        if not maxsize:
+            return rendering_engine.from_string(template_code)
+
+        # The rendering engine is part of the key as it's replaced whenever the TEMPLATES setting is changed
+        key = (rendering_engine, hashlib.sha256(template_code.encode("utf-8")).hexdigest())
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                JINJA2_TEMPLATE_CACHE_METRIC.labels(result="hit").inc()
+                return template
+
+        # Compile outside of the lock; a concurrent compilation of the same template is harmless
+        template = rendering_engine.from_string(template_code)
+        with self._lock:
+            self.misses += 1
+            JINJA2_TEMPLATE_CACHE_METRIC.labels(result="miss").inc()
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > maxsize:
+                self._templates.popitem(last=False)
+        return template
+
+    def cache_info(self):
+        """Return the hits, misses, maximum size and current size of the cache."""
+        with self._lock:
+            return Jinja2TemplateCacheInfo(
+                self.hits, self.misses, settings.JINJA2_TEMPLATE_CACHE_SIZE, len(self._templates)
+            )
+
+    def cache_clear(self):
+        """Remove all templates from the cache and reset its statistics."""
+        with self._lock:
+            self._templates.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+jinja2_template_cache = Jinja2TemplateCache()
+
+
 def render_jinja2(template_code, context):
     """
     Render a Jinja2 template with the provided context. Return the rendered content.
+
+    The compiled template is cached (see `Jinja2TemplateCache`), so that repeatedly rendering the same template code,
+    such as that of a computed field for each object in a list, only compiles it once.
     """
-    rendering_engine = engines["jinja"]
-    template = rendering_engine.from_string(template_code)
+    template = jinja2_template_cache.get_template(template_code)
     # For reasons unknown to me, django-jinja2 `template.render()` implicitly calls `mark_safe()` on the rendered text.
     # This is a security risk in general, especially so in our case because we're often using this function to render
     # a user-provided template and don't want to open ourselves up to script injection or similar issues.
@@ -105,6 +177,19 @@ def render_jinja2(template_code, context):
     return "" + template.render(context=context)
 
 
+def stream_jinja2(template_code, context):
+    """
+    Render a Jinja2 template with the provided context, yielding the rendered content a piece at a time.
+
+    Unlike `render_jinja2()`, the entire rendered content is never held in memory at once, making this suitable for
+    rendering very large output, such as an export template applied to a large queryset.
+    """
+    template = jinja2_template_cache.get_template(template_code)
+    for output in template.stream(context=context):
+        # As in render_jinja2(), make sure we don't return "safe" strings
+        yield str(output)
+
+
 def shallow_compare_dict(source_dict, destination_dict, exclude=None):
     """
     Return a new dictionary of the different keys. The values of `destination_dict` are returned. Only the equality of
@@ -0,0 +1,265 @@
+"""
+Monthly range partitioning of the tables of the log models, such as ObjectChange, on PostgreSQL.
+
+Once a table is partitioned (see `partition_table()`), records older than a cutoff can be removed by dropping the
+partitions that they are stored in (see `get_expired_partitions()` and `drop_partition()`), which is nearly
+instantaneous and leaves no dead rows behind, as opposed to deleting each record. Rows are stored in the partition of
+the month that their partitioning field falls in, or in a default partition if that partition doesn't exist (yet);
+`create_monthly_partitions()` is used to create the partitions of the upcoming months ahead of time.
+
+Other database backends are not supported; the records of those are always deleted one by one instead.
+"""
+
+from collections import namedtuple
+from datetime import timezone as dt_timezone
+import hashlib
+import re
+
+from django.apps import apps
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# Models whose tables can be partitioned, and the (non-nullable) datetime field that their records are partitioned by
+PARTITIONED_MODEL_FIELDS = {
+    "extras.objectchange": "time",
+    "extras.joblogentry": "created",
+}
+
+# A partition of a table, covering the records from `lower` (inclusive) to `upper` (exclusive), where None stands for an
+# unbounded range; the default partition, if any, covers all of the records that no other partition does
+Partition = namedtuple("Partition", ["name", "lower", "upper", "is_default"])
+
+PARTITION_BOUND_RE = re.compile(r"^FOR VALUES FROM \((?P<lower>.+)\) TO \((?P<upper>.+)\)$")
+
+
+def get_partitioned_models():
+    """Return a dict of the models whose tables can be partitioned to the field that they are partitioned by."""
+    return {apps.get_model(label): field_name for label, field_name in PARTITIONED_MODEL_FIELDS.items()}
+
+
+def supports_partitioning():
+    """Return whether the database backend supports partitioning of the log tables."""
+    return connection.vendor == "postgresql"
+
+
+def is_partitioned(model):
+    """Return whether the table of the given model has been partitioned."""
+    if not supports_partitioning():
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)", [model._meta.db_table])
+        return cursor.fetchone() is not None
+
+
+def _parse_partition_bound(value):
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    return parse_datetime(value.strip("'"))
+
+
+def get_partitions(model):
+    """Return the list of `Partition`s of the (partitioned) table of the given model, ordered by their lower bound."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+            FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(%s)
+            """,
+            [model._meta.db_table],
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, bound in rows:
+        match = PARTITION_BOUND_RE.match(bound)
+        if match is None:
+            partitions.append(Partition(name, None, None, True))
+        else:
+            partitions.append(
+                Partition(
+                    name,
+                    _parse_partition_bound(match.group("lower")),
+                    _parse_partition_bound(match.group("upper")),
+                    False,
+                )
+            )
+    return sorted(
+        partitions, key=lambda partition: (partition.is_default, partition.lower is not None, partition.lower or 0)
+    )
+
+
+def get_expired_partitions(model, cutoff):
+    """Return the list of `Partition`s of the table of the given model that only hold records older than `cutoff`."""
+    return [
+        partition
+        for partition in get_partitions(model)
+        if not partition.is_default and partition.upper is not None and partition.upper <= cutoff
+    ]
+
+
+def get_month_start(value, months=0):
+    """Return the start of the month of the given datetime (in UTC), offset by the given number of months."""
+    value = value.astimezone(dt_timezone.utc)
+    month = value.month - 1 + months
+    return value.replace(
+        year=value.year + month // 12, month=month % 12 + 1, day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def create_partition(model, lower, upper, name=None):
+    """
+    Create the partition of the table of the given model holding the records from `lower` to `upper`.
+
+    Any such records already stored in the default partition are moved to the new partition.
+
+    Returns:
+        (str): the name of the created partition
+    """
+    table = model._meta.db_table
+    column = model._meta.get_field(PARTITIONED_MODEL_FIELDS[model._meta.label_lower]).column
+    if name is None:
+        name = f"{table}_p{lower:%Y%m}"
+    default_partition = next((partition for partition in get_partitions(model) if partition.is_default), None)
+    qn = connection.ops.quote_name
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        if default_partition is None:
+            cursor.execute(
+                f"CREATE TABLE {qn(name)} PARTITION OF {qn(table)} FOR VALUES FROM (%s) TO (%s)", [lower, upper]
+            )
+        else:
+            # The partition can't be created while the default partition holds any of its records, so create it as a
+            # separate table, move the records to it and then attach it
+            cursor.execute(f"CREATE TABLE {qn(name)} (LIKE {qn(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+            cursor.execute(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {qn(default_partition.name)} WHERE {qn(column)} >= %s AND {qn(column)} < %s RETURNING *
+                )
+                INSERT INTO {qn(name)} SELECT * FROM moved
+                """,  # noqa: S608  # quoted identifiers
+                [lower, upper],
+            )
+            cursor.execute(
+                f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(name)} FOR VALUES FROM (%s) TO (%s)", [lower, upper]
+            )
+    return name
+
+
+def create_monthly_partitions(model, months_ahead=3):
+    """
+    Create the monthly partitions of the table of the given model from the current month up to `months_ahead` months
+    ahead, except for those overlapping existing partitions.
+
+    Returns:
+        (list): the names of the created partitions
+    """
+    partitions = get_partitions(model)
+    now = timezone.now()
+    created = []
+    for months in range(months_ahead + 1):
+        lower, upper = get_month_start(now, months), get_month_start(now, months + 1)
+        if any(
+            not partition.is_default
+            and (partition.lower is None or partition.lower < upper)
+            and (partition.upper is None or partition.upper > lower)
+            for partition in partitions
+        ):
+            continue
+        created.append(create_partition(model, lower, upper))
+    return created
+
+
+def drop_partition(model, partition):
+    """
+    Drop the given partition of the table of the given model, along with all of the records that it holds.
+
+    Returns:
+        (int): the number of records dropped
+    """
+    qn = connection.ops.quote_name
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM {qn(partition.name)}")  # noqa: S608  # quoted identifier
+        count = cursor.fetchone()[0]
+        cursor.execute(f"DROP TABLE {qn(partition.name)}")
+    return count
+
+
+def _get_legacy_name(name):
+    """Return the name to rename a constraint or index of a table being partitioned to, to free up its own name."""
+    return f"{name[:40]}_{hashlib.sha256(name.encode('utf-8')).hexdigest()[:8]}_legacy"
+
+
+def partition_table(model, months_ahead=3):
+    """
+    Convert the table of the given model to a partitioned table, partitioned by month.
+
+    The existing table becomes the partition holding all of the records up to the start of the next month, so that no
+    records need to be copied, and is dropped once all of these have expired. The partitions of the following months,
+    up to `months_ahead` months ahead, and the default partition are created along with it.
+
+    As PostgreSQL requires the primary key and unique constraints of a partitioned table to include the partitioning
+    column, the column is added to these. The existing table is locked while it is converted, which includes validating
+    that all of its records belong in its partition, so this can take some time for large tables.
+    """
+    table = model._meta.db_table
+    column = model._meta.get_field(PARTITIONED_MODEL_FIELDS[model._meta.label_lower]).column
+    legacy_table = f"{table}_legacy"
+    qn = connection.ops.quote_name
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {qn(table)} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(
+            "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = to_regclass(%s)",
+            [table],
+        )
+        constraints = cursor.fetchall()
+        constraint_names = {name for name, _, _ in constraints}
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes WHERE schemaname = current_schema() AND tablename = %s",
+            [table],
+        )
+        indexes = [(name, definition) for name, definition in cursor.fetchall() if name not in constraint_names]
+
+        # Keep the names of the constraints and indexes for the partitioned table, as migrations may refer to them
+        for name, constraint_type, _ in constraints:
+            if constraint_type == "n":
+                continue
+            cursor.execute(f"ALTER TABLE {qn(table)} RENAME CONSTRAINT {qn(name)} TO {qn(_get_legacy_name(name))}")
+        for name, _ in indexes:
+            cursor.execute(f"ALTER INDEX {qn(name)} RENAME TO {qn(_get_legacy_name(name))}")
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(legacy_table)}")
+
+        cursor.execute(
+            f"CREATE TABLE {qn(table)} (LIKE {qn(legacy_table)} INCLUDING DEFAULTS INCLUDING STORAGE INCLUDING COMMENTS) "
+            f"PARTITION BY RANGE ({qn(column)})"
+        )
+        for name, constraint_type, definition in constraints:
+            if constraint_type == "n":
+                # NOT NULL constraints (as listed by PostgreSQL 18+) were copied along with the columns
+                continue
+            if constraint_type in ("p", "u"):
+                columns = [
+                    constraint_column.strip().strip('"')
+                    for constraint_column in definition[definition.index("(") + 1 : definition.rindex(")")].split(",")
+                ]
+                if column not in columns:
+                    columns.append(column)
+                definition = (
+                    f"{'PRIMARY KEY' if constraint_type == 'p' else 'UNIQUE'} "
+                    f"({', '.join(qn(constraint_column) for constraint_column in columns)})"
+                )
+            cursor.execute(f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}")
+        for _, definition in indexes:
+            # These refer to the table by name, which is now that of the partitioned table
+            cursor.execute(definition)
+
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(legacy_table)} FOR VALUES FROM (MINVALUE) TO (%s)",
+            [get_month_start(timezone.now(), 1)],
+        )
+        cursor.execute(f"CREATE TABLE {qn(f'{table}_default')} PARTITION OF {qn(table)} DEFAULT")
+
+        create_monthly_partitions(model, months_ahead=months_ahead)
@@ -1,5 +1,7 @@
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connection, models
 from django.db.models import Q
 
 
@@ -97,3 +99,134 @@ def qs_filter_from_constraints(constraints, tokens=None):
             return Q()
 
     return params
+
+
+def _replace_constraint_tokens(constraint, tokens):
+    """Return a copy of the given constraint with any tokens (such as "$user") replaced by their values."""
+
+    def _replace_tokens(value):
+        if isinstance(value, list):
+            return [tokens.get(v, v) for v in value]
+        return tokens.get(value, value)
+
+    return {key: _replace_tokens(value) for key, value in constraint.items()}
+
+
+class CompiledConstraints:
+    """
+    The constraints of the ObjectPermissions granting a user a given permission, compiled for repeated evaluation.
+
+    Besides the QuerySet filter (`q`) matching the permitted objects, simple constraints can be evaluated against the
+    field values of an instance that are already loaded, avoiding a database query per object. Constraints that span
+    relationships, use other lookups, or involve deferred fields can only be evaluated in the database.
+
+    Note that the in-memory evaluation considers the field values of the instance as given, not those of the database
+    record representing it; they only differ if the instance has been modified but not yet saved.
+    """
+
+    # Lookups that can be evaluated in memory
+    lookups = ("exact", "in", "isnull")
+
+    # Types of fields whose values can be compared in memory
+    field_types = (models.BooleanField, models.CharField, models.IntegerField, models.UUIDField)
+
+    # Types of fields whose values can be compared in memory only if the database compares them the same way as Python,
+    # which isn't the case for the case-insensitive default collations of MySQL
+    case_sensitive_field_types = (models.CharField,)
+
+    def __init__(self, constraints, tokens=None):
+        if tokens is None:
+            tokens = {}
+        self.q = qs_filter_from_constraints(constraints, tokens)
+        # A null constraint (or none at all) permits model-level access
+        self.unrestricted = not constraints or not all(constraints)
+        self.constraints = [_replace_constraint_tokens(constraint, tokens) for constraint in constraints if constraint]
+
+    def matches(self, obj):
+        """
+        Return whether the given instance is permitted by the constraints.
+
+        Returns:
+            (bool): whether the instance is permitted, or None if this can't be determined without a database query
+        """
+        if self.unrestricted:
+            return True
+        if obj.pk is None or obj._state.adding:
+            return None
+
+        result = False
+        for constraint in self.constraints:
+            constraint_result = True
+            for lookup, value in constraint.items():
+                lookup_result = self._lookup_matches(obj, lookup, value)
+                if lookup_result is False:
+                    constraint_result = False
+                    break
+                if lookup_result is None:
+                    constraint_result = None
+            if constraint_result:
+                return True
+            if constraint_result is None:
+                result = None
+        return result
+
+    def _lookup_matches(self, obj, lookup, value):
+        """Return whether the given field lookup matches the instance, or None if it can't be evaluated in memory."""
+        parts = lookup.split("__")
+        lookup_type = "exact"
+        if len(parts) > 1 and parts[-1] in self.lookups:
+            lookup_type = parts.pop()
+
+        try:
+            field = obj._meta.pk if parts[0] == "pk" else obj._meta.get_field(parts[0])
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.many_to_many:
+            return None
+        if len(parts) == 2 and (field.many_to_one or field.one_to_one) and parts[1] in ("pk", field.target_field.name):
+            # For example "location__id", which is the same as "location_id"
+            parts.pop()
+        if len(parts) != 1:
+            return None
+
+        value_field = field.target_field if field.is_relation else field
+        if not isinstance(value_field, self.field_types):
+            return None
+        if isinstance(value_field, self.case_sensitive_field_types) and connection.vendor != "postgresql":
+            return None
+        if field.attname not in obj.__dict__:
+            # Deferred field
+            return None
+        obj_value = obj.__dict__[field.attname]
+
+        if lookup_type == "isnull":
+            return (obj_value is None) == bool(value)
+        if lookup_type == "in":
+            if not isinstance(value, (list, tuple)):
+                return None
+            values = value
+        elif value is None:
+            return obj_value is None
+        else:
+            values = [value]
+
+        try:
+            values = [v.pk if isinstance(v, models.Model) else value_field.to_python(v) for v in values]
+        except (TypeError, ValueError, ValidationError):
+            return None
+        return obj_value in values
+
+
+def get_compiled_constraints(user, permission):
+    """
+    Return the `CompiledConstraints` of the ObjectPermissions granting the given user the given permission.
+
+    The user must have been granted the permission, that is, it must be in `user.get_all_permissions()`. The compiled
+    constraints are memoized on the user object alongside its cached permissions, which typically last for one request.
+    """
+    compiled_cache = getattr(user, "_object_perm_compiled_cache", None)
+    if compiled_cache is None:
+        compiled_cache = user._object_perm_compiled_cache = {}
+    if permission not in compiled_cache:
+        compiled_cache[permission] = CompiledConstraints(user._object_perm_cache[permission], {"$user": user})
+    return compiled_cache[permission]
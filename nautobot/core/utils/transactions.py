@@ -0,0 +1,63 @@
+"""
+Utilities for deferring work, such as processing the changes made to objects in bulk, until the current database
+transaction is committed.
+"""
+
+from django.db import transaction
+from django.db.transaction import TransactionManagementError
+
+
+def get_on_commit_callback(name, factory, per_savepoint=False, using=None):
+    """
+    Get the callback of the given name to be called once the current database transaction is committed, creating it
+    with `factory()` and registering it with `transaction.on_commit()` if there is none yet.
+
+    This allows the changes made throughout a transaction to be recorded to a single callback, to be processed at once.
+    Once the callback has been called, or if the transaction (or the savepoint) it was registered in is rolled back,
+    along with the changes recorded to it, a new callback is created the next time.
+
+    As `transaction.on_commit()` calls the callback immediately outside of a transaction, this must be called within
+    one (see `connection.in_atomic_block`).
+
+    Args:
+        name (str): Name identifying the callback among those of the connection
+        factory (callable): Function returning a new callback
+        per_savepoint (bool): Whether to register a separate callback for each savepoint, so that the changes recorded
+            within a savepoint that is rolled back are discarded along with it
+        using (str): Alias of the database connection, or None for the default one
+
+    Returns:
+        (callable): the callback returned by `factory()`
+    """
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        raise TransactionManagementError("On-commit callbacks can only be looked up within a transaction.")
+
+    if not hasattr(connection, "_on_commit_callbacks"):
+        connection._on_commit_callbacks = {}
+    callbacks = connection._on_commit_callbacks
+    key = (name, tuple(connection.savepoint_ids)) if per_savepoint else (name,)
+    registered = _get_registered_functions(connection)
+    if key in callbacks and callbacks[key][0] in registered:
+        return callbacks[key][1]
+
+    # Forget the callbacks that were rolled back or called since
+    for stale_key in [stale_key for stale_key, (func, _) in callbacks.items() if func not in registered]:
+        del callbacks[stale_key]
+
+    callback = factory()
+
+    def on_commit():
+        if key in callbacks and callbacks[key][0] is on_commit:
+            del callbacks[key]
+        callback()
+
+    transaction.on_commit(on_commit, using=using, robust=True)
+    callbacks[key] = (on_commit, callback)
+    return callback
+
+
+def _get_registered_functions(connection):
+    """Return the set of the functions that are still to be called once the transaction of the connection is committed."""
+    # Functions registered within a savepoint are removed from `run_on_commit` when the savepoint is rolled back
+    return {func for _, func, _ in connection.run_on_commit}
@@ -44,6 +44,7 @@ from nautobot.core.forms import SearchForm
 from nautobot.core.releases import get_latest_release
 from nautobot.core.utils.lookup import get_route_for_model
 from nautobot.core.utils.permissions import get_permission_for_model
+from nautobot.extras import search_index
 from nautobot.extras.forms import GraphQLQueryForm
 from nautobot.extras.models import FileProxy, GraphQLQuery, Status
 from nautobot.extras.registry import registry
@@ -280,38 +281,64 @@ class SearchView(AccessMixin, View):
                 # Searching all object types
                 obj_types = [model_info[1] for model_info in searchable_models]
 
+            # Based on the label and modelname, reverse-lookup the list URL, then the view or UIViewSet corresponding
+            # to that URL, and finally the queryset, filterset, and table classes needed to find and display the model
+            # search results.
+            search_views = []
             for label, modelname in searchable_models:
                 if modelname not in obj_types:
                     continue
-                # Based on the label and modelname, reverse-lookup the list URL, then the view or UIViewSet
-                # corresponding to that URL, and finally the queryset, filterset, and table classes needed
-                # to find and display the model search results.
                 url = get_route_for_model(f"{label}.{modelname}", "list")
                 try:
                     view_func = resolve(reverse(url)).func
-                    # For UIViewSet, view_func.cls gets what we need; for an ObjectListView, view_func.view_class is it.
-                    view_or_viewset = getattr(view_func, "cls", getattr(view_func, "view_class", None))
-                    queryset = view_or_viewset.queryset.restrict(request.user, "view")
-                    # For a UIViewSet, .filterset_class, for an ObjectListView, .filterset.
-                    filterset = getattr(view_or_viewset, "filterset_class", getattr(view_or_viewset, "filterset", None))
-                    # For a UIViewSet, .table_class, for an ObjectListView, .table.
-                    table = getattr(view_or_viewset, "table_class", getattr(view_or_viewset, "table", None))
-
-                    # Construct the results table for this object type
-                    filtered_queryset = filterset({"q": form.cleaned_data["q"]}, queryset=queryset).qs
-                    table = table(filtered_queryset, hide_hierarchy_ui=True, orderable=False)
-                    table.paginate(per_page=SEARCH_MAX_RESULTS)
-
-                    if table.page:
-                        results.append(
-                            {
-                                "name": queryset.model._meta.verbose_name_plural,
-                                "table": table,
-                                "url": f"{reverse(url)}?q={form.cleaned_data.get('q')}",
-                            }
-                        )
                 except NoReverseMatch:
                     messages.error(request, f'Missing URL "{url}" - unable to show search results for {modelname}.')
+                    continue
+                # For UIViewSet, view_func.cls gets what we need; for an ObjectListView, view_func.view_class is it.
+                view_or_viewset = getattr(view_func, "cls", getattr(view_func, "view_class", None))
+                queryset = view_or_viewset.queryset.restrict(request.user, "view")
+                # For a UIViewSet, .filterset_class, for an ObjectListView, .filterset.
+                filterset = getattr(view_or_viewset, "filterset_class", getattr(view_or_viewset, "filterset", None))
+                # For a UIViewSet, .table_class, for an ObjectListView, .table.
+                table = getattr(view_or_viewset, "table_class", getattr(view_or_viewset, "table", None))
+                search_views.append((url, queryset, filterset, table))
+
+            # If the search index is enabled, look up the first matching objects of all of the indexed models at once,
+            # among those that the user may view
+            indexed_models = []
+            indexed_results = {}
+            if settings.SEARCH_INDEX_ENABLED and search_index.is_searchable(form.cleaned_data["q"]):
+                indexed_querysets = [
+                    queryset
+                    for _, queryset, _, _ in search_views
+                    if queryset.model in search_index.get_indexed_models()
+                ]
+                indexed_models = [queryset.model for queryset in indexed_querysets]
+                if indexed_querysets:
+                    indexed_results = search_index.search(
+                        form.cleaned_data["q"], indexed_querysets, limit=SEARCH_MAX_RESULTS
+                    )
+
+            for url, queryset, filterset, table in search_views:
+                # Construct the results table for this object type
+                if queryset.model in indexed_models:
+                    if queryset.model not in indexed_results:
+                        # No matching objects
+                        continue
+                    filtered_queryset = queryset.filter(pk__in=indexed_results[queryset.model])
+                else:
+                    filtered_queryset = filterset({"q": form.cleaned_data["q"]}, queryset=queryset).qs
+                table = table(filtered_queryset, hide_hierarchy_ui=True, orderable=False)
+                table.paginate(per_page=SEARCH_MAX_RESULTS)
+
+                if table.page:
+                    results.append(
+                        {
+                            "name": queryset.model._meta.verbose_name_plural,
+                            "table": table,
+                            "url": f"{reverse(url)}?q={form.cleaned_data.get('q')}",
+                        }
+                    )
 
         return render(
             request,
@@ -20,6 +20,7 @@ from nautobot.core.api.utils import (
     nested_serializers_for_models,
     return_nested_serializer_data_based_on_depth,
 )
+from nautobot.core.constants import CHARFIELD_MAX_LENGTH
 from nautobot.core.models.utils import get_all_concrete_models
 from nautobot.core.utils.config import get_settings_or_config
 from nautobot.core.utils.deprecation import class_deprecated_in_favor_of
@@ -692,6 +693,22 @@ class DeviceNAPALMSerializer(serializers.Serializer):
     method = serializers.DictField()
 
 
+class DeviceProvisioningSerializer(serializers.Serializer):
+    """
+    Input serializer for POST to /api/dcim/devices/provision/, i.e. creating many Devices at once.
+
+    Aside from the `names` of the Devices, this accepts the same fields as `DeviceSerializer` (except for `name`), which
+    are shared by all of the Devices.
+    """
+
+    names = serializers.ListField(child=serializers.CharField(max_length=CHARFIELD_MAX_LENGTH), allow_empty=False)
+
+    def validate_names(self, value):
+        if len(set(value)) != len(value):
+            raise serializers.ValidationError("Device names must be unique.")
+        return value
+
+
 class ConsoleServerPortSerializer(
     ModularDeviceComponentSerializerMixin,
     TaggedModelSerializerMixin,
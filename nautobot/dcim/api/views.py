@@ -9,6 +9,7 @@ from django.shortcuts import get_object_or_404
 from django.views.decorators.clickjacking import xframe_options_sameorigin
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.mixins import ListModelMixin
 from rest_framework.permissions import IsAuthenticated
@@ -68,11 +69,13 @@ from nautobot.dcim.models import (
     SoftwareVersion,
     VirtualChassis,
 )
+from nautobot.dcim.models.devices import deferred_component_creation
 from nautobot.extras.api.views import (
     ConfigContextQuerySetMixin,
     NautobotModelViewSet,
 )
 from nautobot.extras.choices import SecretsGroupAccessTypeChoices, SecretsGroupSecretTypeChoices
+from nautobot.extras.context_managers import deferred_change_logging_for_bulk_operation
 from nautobot.extras.secrets.exceptions import SecretError
 from nautobot.ipam.models import Prefix, VLAN
 from nautobot.virtualization.models import VirtualMachine
@@ -401,6 +404,31 @@ class DeviceViewSet(ConfigContextQuerySetMixin, NautobotModelViewSet):
     serializer_class = serializers.DeviceSerializer
     filterset_class = filters.DeviceFilterSet
 
+    @extend_schema(
+        filters=False,
+        request=serializers.DeviceProvisioningSerializer,
+        responses={201: serializers.DeviceSerializer(many=True)},
+    )
+    @action(detail=False, methods=["post"], url_path="provision")
+    def provision(self, request):
+        """
+        Create many Devices at once, with the given names and otherwise the same attributes, such as their DeviceType.
+
+        The components of all of the Devices are created from the component templates of their DeviceType at once,
+        rather than one Device at a time, and the changes to the Devices are logged in bulk.
+        """
+        provisioning_serializer = serializers.DeviceProvisioningSerializer(data=request.data)
+        provisioning_serializer.is_valid(raise_exception=True)
+        attributes = {key: value for key, value in request.data.items() if key not in ("name", "names")}
+        serializer = self.get_serializer(
+            data=[{**attributes, "name": name} for name in provisioning_serializer.validated_data["names"]]
+        )
+        serializer.is_valid(raise_exception=True)
+
+        with deferred_change_logging_for_bulk_operation(), deferred_component_creation():
+            self.perform_create(serializer)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
     @extend_schema(
         filters=False,
         parameters=[OpenApiParameter(name="method", location="query", required=True, type=OpenApiTypes.STR)],
@@ -0,0 +1,381 @@
+"""Batched tracing and storage of CablePaths."""
+
+from collections import defaultdict, namedtuple
+import logging
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
+
+from nautobot.circuits.models import CircuitTermination
+from nautobot.dcim.models import Cable, CablePath, FrontPort, PathEndpoint, RearPort
+from nautobot.dcim.utils import compile_path_node
+
+logger = logging.getLogger(__name__)
+
+# The result of tracing a single origin; `destination` is a (content type ID, object ID) tuple, or None.
+TracedPath = namedtuple("TracedPath", ["path", "destination", "is_active", "is_split"])
+
+RetraceResult = namedtuple("RetraceResult", ["created", "updated", "deleted"])
+
+
+class _NotLoaded(Exception):
+    """Raised while tracing when the graph is missing some data; `kind` and `key` identify what needs to be loaded."""
+
+    def __init__(self, kind, key):
+        super().__init__(kind, key)
+        self.kind = kind
+        self.key = key
+
+
+def path_origin_key(obj):
+    """Return the (content type ID, object ID) key used by `CablePathTracer` for the given path origin."""
+    return (ContentType.objects.get_for_model(obj).pk, obj.pk)
+
+
+class CablePathTracer:
+    """
+    Trace the CablePaths of many origins at once, using an in-memory graph of cable terminations.
+
+    `CablePath.from_origin()` follows a path one hop at a time, issuing a query for every cable peer and every
+    RearPort-to-FrontPort lookup along the way. This tracer instead traces all of the given origins in lockstep: each
+    time some origins need a part of the graph that hasn't been loaded yet, the missing terminations, front ports and
+    circuit terminations needed by *all* of them are fetched together, with a single query per model. Retracing every
+    path through a 288-port patch panel thus takes a handful of queries rather than thousands.
+
+    The graph is cached on the tracer instance, so a tracer should not outlive the transaction in which it's used.
+    """
+
+    def __init__(self):
+        self.cable_ct_id = ContentType.objects.get_for_model(Cable).pk
+        self.front_port_ct_id = ContentType.objects.get_for_model(FrontPort).pk
+        self.rear_port_ct_id = ContentType.objects.get_for_model(RearPort).pk
+        self.circuit_termination_ct_id = ContentType.objects.get_for_model(CircuitTermination).pk
+        self.connected_status_id = Cable.STATUS_CONNECTED.pk if Cable.STATUS_CONNECTED else None
+
+        # (content type ID, object ID) -> termination dict, or None if the object doesn't exist
+        self._terminations = {}
+        # RearPort ID -> {position: FrontPort key}
+        self._front_ports = {}
+        # Circuit ID -> {term_side: CircuitTermination key}
+        self._circuit_terminations = {}
+
+    #
+    # Graph loading
+    #
+
+    def _get_fields(self, model):
+        fields = ["pk", "cable_id", "cable__status_id", "_cable_peer_type_id", "_cable_peer_id"]
+        if issubclass(model, PathEndpoint):
+            fields.append("_path_id")
+        if model is FrontPort:
+            fields += ["rear_port_id", "rear_port_position"]
+        elif model is RearPort:
+            fields.append("positions")
+        elif model is CircuitTermination:
+            fields += ["circuit_id", "term_side"]
+        return fields
+
+    def _load(self, model, queryset_filter):
+        """Load the terminations of the given model matching the given filter into the graph."""
+        ct_id = ContentType.objects.get_for_model(model).pk
+        rows = model.objects.filter(queryset_filter).values(*self._get_fields(model))
+        loaded = []
+        for row in rows:
+            if row["_cable_peer_type_id"] is not None and row["_cable_peer_id"] is not None:
+                row["peer"] = (row["_cable_peer_type_id"], row["_cable_peer_id"])
+            else:
+                row["peer"] = None
+            row["is_connected"] = row["cable__status_id"] == self.connected_status_id
+            self._terminations[(ct_id, row["pk"])] = row
+            loaded.append(row)
+        return loaded
+
+    def load_terminations(self, keys):
+        """Load the terminations with the given (content type ID, object ID) keys into the graph."""
+        pks_by_ct = defaultdict(set)
+        for ct_id, pk in keys:
+            pks_by_ct[ct_id].add(pk)
+        for ct_id, pks in pks_by_ct.items():
+            model = ContentType.objects.get_for_id(ct_id).model_class()
+            self._load(model, Q(pk__in=pks))
+            for pk in pks:
+                self._terminations.setdefault((ct_id, pk), None)
+
+    def load_front_ports(self, rear_port_ids):
+        """Load all FrontPorts mapped to the given RearPorts into the graph."""
+        for rear_port_id in rear_port_ids:
+            self._front_ports[rear_port_id] = {}
+        for row in self._load(FrontPort, Q(rear_port_id__in=rear_port_ids)):
+            self._front_ports[row["rear_port_id"]][row["rear_port_position"]] = (self.front_port_ct_id, row["pk"])
+
+    def load_circuit_terminations(self, circuit_ids):
+        """Load all CircuitTerminations of the given Circuits into the graph."""
+        for circuit_id in circuit_ids:
+            self._circuit_terminations[circuit_id] = {}
+        for row in self._load(CircuitTermination, Q(circuit_id__in=circuit_ids)):
+            self._circuit_terminations[row["circuit_id"]][row["term_side"]] = (
+                self.circuit_termination_ct_id,
+                row["pk"],
+            )
+
+    def _get_termination(self, key):
+        try:
+            return self._terminations[key]
+        except KeyError:
+            raise _NotLoaded("termination", key)
+
+    def _get_front_port(self, rear_port_id, position):
+        try:
+            return self._front_ports[rear_port_id].get(position)
+        except KeyError:
+            raise _NotLoaded("front_port", rear_port_id)
+
+    def _get_circuit_peer(self, circuit_termination):
+        peer_side = "Z" if circuit_termination["term_side"] == "A" else "A"
+        try:
+            return self._circuit_terminations[circuit_termination["circuit_id"]].get(peer_side)
+        except KeyError:
+            raise _NotLoaded("circuit_termination", circuit_termination["circuit_id"])
+
+    #
+    # Tracing
+    #
+
+    def _trace(self, origin_key):
+        """
+        Trace the path from the given origin through the loaded graph; this mirrors `CablePath.from_origin()`.
+
+        Raises `_NotLoaded` if some part of the graph needed to complete the trace hasn't been loaded yet.
+        """
+        origin = self._get_termination(origin_key)
+        if origin is None or origin["cable_id"] is None:
+            return None
+
+        destination = None
+        path = []
+        position_stack = []
+        is_active = True
+        is_split = False
+
+        node = origin
+        visited_nodes = set()
+        while node is not None and node["cable_id"] is not None:
+            if node["pk"] in visited_nodes:
+                raise ValidationError("a loop is detected in the path")
+            visited_nodes.add(node["pk"])
+            if not node["is_connected"]:
+                is_active = False
+
+            # Follow the cable to its far-end termination
+            path.append(compile_path_node(self.cable_ct_id, node["cable_id"]))
+            peer_key = node["peer"]
+            if peer_key is None:
+                break
+            peer_ct_id, peer_id = peer_key
+
+            # Follow a FrontPort to its corresponding RearPort
+            if peer_ct_id == self.front_port_ct_id:
+                peer = self._get_termination(peer_key)
+                if peer is None:
+                    break
+                path.append(compile_path_node(peer_ct_id, peer_id))
+                node = self._get_termination((self.rear_port_ct_id, peer["rear_port_id"]))
+                if node["positions"] > 1:
+                    position_stack.append(peer["rear_port_position"])
+                path.append(compile_path_node(self.rear_port_ct_id, node["pk"]))
+
+            # Follow a RearPort to its corresponding FrontPort (if any)
+            elif peer_ct_id == self.rear_port_ct_id:
+                peer = self._get_termination(peer_key)
+                if peer is None:
+                    break
+                path.append(compile_path_node(peer_ct_id, peer_id))
+
+                # Determine the peer FrontPort's position
+                if peer["positions"] == 1:
+                    position = 1
+                elif position_stack:
+                    position = position_stack.pop()
+                else:
+                    # No position indicated: path has split, so we stop at the RearPort
+                    is_split = True
+                    break
+
+                front_port_key = self._get_front_port(peer_id, position)
+                if front_port_key is None:
+                    # No corresponding FrontPort found for the RearPort
+                    break
+                node = self._get_termination(front_port_key)
+                path.append(compile_path_node(*front_port_key))
+
+            # Follow a Circuit Termination if there is a corresponding Circuit Termination
+            elif peer_ct_id == self.circuit_termination_ct_id:
+                peer = self._get_termination(peer_key)
+                if peer is None:
+                    break
+                node_key = self._get_circuit_peer(peer)
+                # A Circuit Termination does not require a peer.
+                if node_key is None:
+                    destination = peer_key
+                    break
+                path.append(compile_path_node(peer_ct_id, peer_id))
+                path.append(compile_path_node(*node_key))
+                node = self._get_termination(node_key)
+
+            # Anything else marks the end of the path
+            else:
+                destination = peer_key
+                break
+
+        if destination is None:
+            is_active = False
+
+        return TracedPath(path=path, destination=destination, is_active=is_active, is_split=is_split)
+
+    def trace(self, origin_keys):
+        """
+        Trace the paths originating from each of the given origins.
+
+        Args:
+            origin_keys (iterable): (content type ID, object ID) tuples identifying the path origins.
+
+        Returns:
+            (dict): Mapping of each origin key to its `TracedPath`, or to None if the origin isn't cabled.
+        """
+        results = {}
+        pending = list(dict.fromkeys(origin_keys))
+        while pending:
+            missing = defaultdict(set)
+            still_pending = []
+            for origin_key in pending:
+                try:
+                    results[origin_key] = self._trace(origin_key)
+                except _NotLoaded as exc:
+                    missing[exc.kind].add(exc.key)
+                    still_pending.append(origin_key)
+
+            # Load everything needed to advance the incomplete traces, then restart them
+            if missing["termination"]:
+                self.load_terminations(missing["termination"])
+            if missing["front_port"]:
+                self.load_front_ports(missing["front_port"])
+            if missing["circuit_termination"]:
+                self.load_circuit_terminations(missing["circuit_termination"])
+            pending = still_pending
+
+        return results
+
+    #
+    # Storage
+    #
+
+    def retrace(self, origin_keys, batch_size=1000):
+        """
+        Trace the paths originating from the given origins and update the stored CablePaths to match.
+
+        Existing CablePaths are updated in place (only if they've changed), new ones are created, and the paths of
+        origins which are no longer cabled are deleted; each with a single bulk operation.
+
+        Args:
+            origin_keys (iterable): (content type ID, object ID) tuples identifying the path origins.
+            batch_size (int): Batch size for the bulk database operations.
+
+        Returns:
+            (RetraceResult): The number of CablePaths created, updated and deleted.
+        """
+        traced = self.trace(origin_keys)
+        if not traced:
+            return RetraceResult(created=0, updated=0, deleted=0)
+
+        origin_ids_by_ct = defaultdict(list)
+        for ct_id, pk in traced:
+            origin_ids_by_ct[ct_id].append(pk)
+        origins_filter = Q()
+        for ct_id, pks in origin_ids_by_ct.items():
+            origins_filter |= Q(origin_type_id=ct_id, origin_id__in=pks)
+        existing = {
+            (cp.origin_type_id, cp.origin_id): cp
+            for cp in CablePath.objects.filter(origins_filter).only(
+                "id", "origin_type", "origin_id", "destination_type", "destination_id", "path", "is_active", "is_split"
+            )
+        }
+
+        to_create = []
+        to_update = []
+        to_delete = []
+        origin_paths = defaultdict(dict)
+        for origin_key, traced_path in traced.items():
+            cablepath = existing.get(origin_key)
+            if traced_path is None:
+                if cablepath is not None:
+                    to_delete.append(cablepath.pk)
+                continue
+
+            destination_type_id, destination_id = traced_path.destination or (None, None)
+            if cablepath is None:
+                cablepath = CablePath(origin_type_id=origin_key[0], origin_id=origin_key[1])
+                to_create.append(cablepath)
+            elif (
+                cablepath.path != traced_path.path
+                or cablepath.destination_type_id != destination_type_id
+                or cablepath.destination_id != destination_id
+                or cablepath.is_active != traced_path.is_active
+                or cablepath.is_split != traced_path.is_split
+            ):
+                to_update.append(cablepath)
+            cablepath.path = traced_path.path
+            cablepath.destination_type_id = destination_type_id
+            cablepath.destination_id = destination_id
+            cablepath.is_active = traced_path.is_active
+            cablepath.is_split = traced_path.is_split
+
+            # Record a direct reference to the CablePath on its originating object, if not already present
+            if self._terminations[origin_key].get("_path_id") != cablepath.pk:
+                origin_paths[origin_key[0]][origin_key[1]] = cablepath.pk
+
+        with transaction.atomic():
+            if to_delete:
+                CablePath.objects.filter(pk__in=to_delete).delete()
+            CablePath.objects.bulk_create(to_create, batch_size=batch_size)
+            CablePath.objects.bulk_update(
+                to_update,
+                ["path", "destination_type", "destination_id", "is_active", "is_split"],
+                batch_size=batch_size,
+            )
+            for ct_id, path_ids in origin_paths.items():
+                model = ContentType.objects.get_for_id(ct_id).model_class()
+                origins = list(model.objects.filter(pk__in=path_ids.keys()).only("pk", "_path"))
+                for origin in origins:
+                    origin._path_id = path_ids[origin.pk]
+                model.objects.bulk_update(origins, ["_path"], batch_size=batch_size)
+
+        # Keep the cached graph consistent with the database
+        for ct_id, path_ids in origin_paths.items():
+            for pk, path_id in path_ids.items():
+                self._terminations[(ct_id, pk)]["_path_id"] = path_id
+
+        logger.debug(
+            "Retraced %d cable path origins: %d paths created, %d updated, %d deleted",
+            len(traced),
+            len(to_create),
+            len(to_update),
+            len(to_delete),
+        )
+        return RetraceResult(created=len(to_create), updated=len(to_update), deleted=len(to_delete))
+
+
+def retrace_cable_paths(origins, batch_size=1000):
+    """
+    Retrace and store the CablePaths originating from the given path origins using a `CablePathTracer`.
+
+    Args:
+        origins (iterable): Path origin instances, or (content type ID, object ID) tuples identifying them.
+        batch_size (int): Batch size for the bulk database operations.
+
+    Returns:
+        (RetraceResult): The number of CablePaths created, updated and deleted.
+    """
+    origin_keys = [origin if isinstance(origin, tuple) else path_origin_key(origin) for origin in origins]
+    return CablePathTracer().retrace(origin_keys, batch_size=batch_size)
@@ -1,6 +1,7 @@
 import graphene
 
 from nautobot.circuits.graphql.types import CircuitTerminationType
+from nautobot.core.graphql.loaders import load_dynamic_groups
 from nautobot.core.graphql.types import OptimizedNautobotObjectType
 from nautobot.core.graphql.utils import construct_resolver
 from nautobot.dcim.filters import (
@@ -35,7 +36,6 @@ from nautobot.dcim.models import (
     Rack,
     RearPort,
 )
-from nautobot.extras.models import DynamicGroup
 
 
 class LocationType(OptimizedNautobotObjectType):
@@ -57,8 +57,8 @@ class DeviceType(OptimizedNautobotObjectType):
 
     dynamic_groups = graphene.List("nautobot.extras.graphql.types.DynamicGroupType")
 
-    def resolve_dynamic_groups(self, args):
-        return DynamicGroup.objects.get_for_object(self)
+    def resolve_dynamic_groups(self, info):
+        return load_dynamic_groups(self, info)
 
 
 class PlatformType(OptimizedNautobotObjectType):
@@ -81,8 +81,8 @@ class RackType(OptimizedNautobotObjectType):
 
     dynamic_groups = graphene.List("nautobot.extras.graphql.types.DynamicGroupType")
 
-    def resolve_dynamic_groups(self, args):
-        return DynamicGroup.objects.get_for_object(self)
+    def resolve_dynamic_groups(self, info):
+        return load_dynamic_groups(self, info)
 
 
 class CableType(OptimizedNautobotObjectType):
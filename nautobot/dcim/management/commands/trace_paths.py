@@ -1,8 +1,16 @@
-from django.core.management.base import BaseCommand
+from collections import defaultdict
+from concurrent.futures import as_completed, ProcessPoolExecutor
+import multiprocessing
+import os
+import time
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
 from django.core.management.color import no_style
-from django.db import connection
+from django.db import connection, connections
 
 from nautobot.circuits.models import CircuitTermination
+from nautobot.dcim.cable_paths import CablePathTracer
 from nautobot.dcim.models import (
     CablePath,
     ConsolePort,
@@ -12,7 +20,6 @@ from nautobot.dcim.models import (
     PowerOutlet,
     PowerPort,
 )
-from nautobot.dcim.signals import create_cablepath
 
 ENDPOINT_MODELS = (
     CircuitTermination,
@@ -24,6 +31,20 @@ ENDPOINT_MODELS = (
     PowerPort,
 )
 
+# Fields by which the origins of each model are grouped into chunks, so that paths sharing the same pass-through ports
+# (such as all of the ports of a device or patch panel) are traced together. The first non-null value is used.
+CHUNK_GROUP_FIELDS = {
+    CircuitTermination: ("circuit_id",),
+    PowerFeed: ("power_panel_id",),
+}
+DEFAULT_CHUNK_GROUP_FIELDS = ("device_id", "module_id")
+
+
+def trace_chunk(ct_id, origin_ids, batch_size):
+    """Retrace the paths of a chunk of origins of a single model; runs in a worker process when using `--workers`."""
+    CablePathTracer().retrace([(ct_id, pk) for pk in origin_ids], batch_size=batch_size)
+    return len(origin_ids)
+
 
 class Command(BaseCommand):
     help = "Generate any missing cable paths among all cable termination objects in Nautobot"
@@ -41,6 +62,25 @@ class Command(BaseCommand):
             dest="no_input",
             help="Do not prompt user for any input/confirmation",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of path origins to trace and save together (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes to trace paths in parallel (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            metavar="FILE",
+            help="File in which to record completed chunks of path origins. If the file already exists, resume the "
+            "interrupted run which created it, skipping the completed chunks. The file is removed upon completion.",
+        )
 
     def draw_progress_bar(self, percentage):
         """
@@ -49,9 +89,71 @@ class Command(BaseCommand):
         bar_size = int(percentage / 5)
         self.stdout.write(f"\r  [{'#' * bar_size}{' ' * (20-bar_size)}] {int(percentage)}%", ending="")
 
+    def get_chunks(self, model, origins, batch_size):
+        """
+        Split the given origins into chunks of about `batch_size` origins, keeping origins of the same parent together.
+
+        Returns:
+            (list): `(group_keys, origin_ids)` tuples, where `group_keys` identify the parent objects in the chunk.
+        """
+        group_fields = CHUNK_GROUP_FIELDS.get(model, DEFAULT_CHUNK_GROUP_FIELDS)
+        groups = defaultdict(list)
+        for pk, *parent_ids in origins.order_by().values_list("pk", *group_fields):
+            parent_id = next((parent_id for parent_id in parent_ids if parent_id is not None), None)
+            groups[f"{model._meta.label_lower}:{parent_id}"].append(pk)
+
+        chunks = []
+        group_keys = []
+        origin_ids = []
+        for group_key in sorted(groups):
+            group_keys.append(group_key)
+            origin_ids.extend(groups[group_key])
+            if len(origin_ids) >= batch_size:
+                chunks.append((group_keys, origin_ids))
+                group_keys = []
+                origin_ids = []
+        if origin_ids:
+            chunks.append((group_keys, origin_ids))
+        return chunks
+
+    def trace_chunks(self, ct_id, chunks, batch_size, workers):
+        """Trace the given chunks, yielding each chunk as it completes."""
+        if workers == 1:
+            for chunk in chunks:
+                trace_chunk(ct_id, chunk[1], batch_size)
+                yield chunk
+            return
+
+        # Worker processes are forked from this one; they must not share its database connections.
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+            futures = {executor.submit(trace_chunk, ct_id, chunk[1], batch_size): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                future.result()
+                yield futures[future]
+
     def handle(self, *model_names, **options):
-        # If --force was passed, first delete all existing CablePaths
-        if options["force"]:
+        batch_size = options["batch_size"]
+        workers = options["workers"]
+        checkpoint = options["checkpoint"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer")
+        if workers < 1:
+            raise CommandError("--workers must be a positive integer")
+
+        completed_groups = set()
+        resuming = checkpoint is not None and os.path.exists(checkpoint)
+        if resuming:
+            with open(checkpoint, "r") as checkpoint_file:
+                completed_groups = {line.strip() for line in checkpoint_file if line.strip()}
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Resuming from checkpoint {checkpoint}; skipping {len(completed_groups)} completed groups"
+                )
+            )
+
+        # If --force was passed, first delete all existing CablePaths (unless this was already done by the resumed run)
+        if options["force"] and not resuming:
             cable_paths = CablePath.objects.all()
             paths_count = cable_paths.count()
 
@@ -78,22 +180,56 @@ class Command(BaseCommand):
                 for sql in sequence_sql:
                     cursor.execute(sql)
 
-        # Retrace paths
-        for model in ENDPOINT_MODELS:
-            origins = model.objects.filter(cable__isnull=False)
-            if not options["force"]:
-                origins = origins.filter(_path__isnull=True)
-            origins_count = origins.count()
-            if not origins_count:
-                self.stdout.write(f"Found no missing {model._meta.verbose_name} paths; skipping")
-                continue
-            self.stdout.write(f"Retracing {origins_count} cabled {model._meta.verbose_name_plural}...")
-            i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepath(obj)
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
-            self.draw_progress_bar(100)
-            self.stdout.write(self.style.SUCCESS(f"\n  Retraced {i} {model._meta.verbose_name_plural}"))
-
-        self.stdout.write(self.style.SUCCESS("Finished."))
+        checkpoint_file = open(checkpoint, "a") if checkpoint else None
+        total_count = 0
+        start_time = time.monotonic()
+        try:
+            # Retrace paths
+            for model in ENDPOINT_MODELS:
+                origins = model.objects.filter(cable__isnull=False)
+                if not options["force"]:
+                    origins = origins.filter(_path__isnull=True)
+                chunks = [
+                    chunk
+                    for chunk in self.get_chunks(model, origins, batch_size)
+                    if not completed_groups.issuperset(chunk[0])
+                ]
+                origins_count = sum(len(origin_ids) for _, origin_ids in chunks)
+                if not origins_count:
+                    self.stdout.write(f"Found no missing {model._meta.verbose_name} paths; skipping")
+                    continue
+                self.stdout.write(
+                    f"Retracing {origins_count} cabled {model._meta.verbose_name_plural} in {len(chunks)} chunks..."
+                )
+                ct_id = ContentType.objects.get_for_model(model).pk
+                model_start_time = time.monotonic()
+                traced_count = 0
+                for group_keys, origin_ids in self.trace_chunks(ct_id, chunks, batch_size, workers):
+                    traced_count += len(origin_ids)
+                    if checkpoint_file is not None:
+                        checkpoint_file.writelines(f"{group_key}\n" for group_key in group_keys)
+                        checkpoint_file.flush()
+                    self.draw_progress_bar(traced_count * 100 / origins_count)
+                elapsed = time.monotonic() - model_start_time
+                total_count += traced_count
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"\n  Retraced {traced_count} {model._meta.verbose_name_plural} in {elapsed:.1f} seconds "
+                        f"({traced_count / elapsed if elapsed else traced_count:.1f} paths/sec)"
+                    )
+                )
+        finally:
+            if checkpoint_file is not None:
+                checkpoint_file.close()
+
+        # The run is complete, so there's nothing left to resume
+        if checkpoint is not None:
+            os.remove(checkpoint)
+
+        elapsed = time.monotonic() - start_time
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Finished retracing {total_count} paths in {elapsed:.1f} seconds "
+                f"({total_count / elapsed if elapsed else total_count:.1f} paths/sec)."
+            )
+        )
@@ -1,3 +1,5 @@
+import copy
+
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
@@ -53,6 +55,24 @@ __all__ = (
 )
 
 
+def get_default_custom_field_data(model):
+    """
+    Return the custom field data of a new instance of the given model, with each of its custom fields set to its default.
+    """
+    content_type = ContentType.objects.get_for_model(model)
+    return {field.key: field.default for field in CustomField.objects.filter(content_types=content_type)}
+
+
+def get_default_interface_status():
+    """
+    Return the Status of new Interfaces instantiated from InterfaceTemplates, preferably "Active".
+    """
+    try:
+        return Status.objects.get_for_model(Interface).get(name="Active")
+    except Status.DoesNotExist:
+        return Status.objects.get_for_model(Interface).first()
+
+
 # TODO: Changing ComponentTemplateModel to an OrganizationalModel would just involve adding Notes support...
 class ComponentTemplateModel(
     ContactMixin,
@@ -103,22 +123,23 @@ class ComponentTemplateModel(
             return self.device_type.get_absolute_url(api=api)
         return super().get_absolute_url(api=api)
 
-    def instantiate_model(self, model, device, **kwargs):
+    def instantiate_model(self, model, device, custom_field_data=None, **kwargs):
         """
         Helper method to self.instantiate().
+
+        Args:
+            custom_field_data (dict): the default custom field data of `model`, as returned by
+                `get_default_custom_field_data()`, to avoid looking it up again when instantiating many components
         """
-        custom_field_data = {}
-        content_type = ContentType.objects.get_for_model(model)
-        fields = CustomField.objects.filter(content_types=content_type)
-        for field in fields:
-            custom_field_data[field.key] = field.default
+        if custom_field_data is None:
+            custom_field_data = get_default_custom_field_data(model)
 
         return model(
             device=device,
             name=self.name,
             label=self.label,
             description=self.description,
-            _custom_field_data=custom_field_data,
+            _custom_field_data=copy.deepcopy(custom_field_data),
             **kwargs,
         )
 
@@ -179,11 +200,11 @@ class ModularComponentTemplateModel(ComponentTemplateModel):
             return self.parent.get_absolute_url(api=api)
         return super().get_absolute_url(api=api)
 
-    def instantiate_model(self, model, device, module=None, **kwargs):
+    def instantiate_model(self, model, device, module=None, custom_field_data=None, **kwargs):
         """
         Helper method to self.instantiate().
         """
-        return super().instantiate_model(model, device, module=module, **kwargs)
+        return super().instantiate_model(model, device, module=module, custom_field_data=custom_field_data, **kwargs)
 
     def clean(self):
         super().clean()
@@ -206,8 +227,10 @@ class ConsolePortTemplate(ModularComponentTemplateModel):
 
     type = models.CharField(max_length=50, choices=ConsolePortTypeChoices, blank=True)
 
-    def instantiate(self, device, module=None):
-        return self.instantiate_model(model=ConsolePort, device=device, module=module, type=self.type)
+    def instantiate(self, device, module=None, custom_field_data=None):
+        return self.instantiate_model(
+            model=ConsolePort, device=device, module=module, custom_field_data=custom_field_data, type=self.type
+        )
 
 
 @extras_features(
@@ -220,8 +243,10 @@ class ConsoleServerPortTemplate(ModularComponentTemplateModel):
 
     type = models.CharField(max_length=50, choices=ConsolePortTypeChoices, blank=True)
 
-    def instantiate(self, device, module=None):
-        return self.instantiate_model(model=ConsoleServerPort, device=device, module=module, type=self.type)
+    def instantiate(self, device, module=None, custom_field_data=None):
+        return self.instantiate_model(
+            model=ConsoleServerPort, device=device, module=module, custom_field_data=custom_field_data, type=self.type
+        )
 
 
 @extras_features(
@@ -246,11 +271,12 @@ class PowerPortTemplate(ModularComponentTemplateModel):
         help_text="Allocated power draw (watts)",
     )
 
-    def instantiate(self, device, module=None):
+    def instantiate(self, device, module=None, custom_field_data=None):
         return self.instantiate_model(
             model=PowerPort,
             device=device,
             module=module,
+            custom_field_data=custom_field_data,
             type=self.type,
             maximum_draw=self.maximum_draw,
             allocated_draw=self.allocated_draw,
@@ -303,8 +329,16 @@ class PowerOutletTemplate(ModularComponentTemplateModel):
                     f"Parent power port ({self.power_port_template}) must belong to the same module type"
                 )
 
-    def instantiate(self, device, module=None):
-        if self.power_port_template:
+    def instantiate(self, device, module=None, custom_field_data=None, power_ports=None):
+        """
+        Instantiate a new PowerOutlet on the specified Device or Module.
+
+        Args:
+            power_ports (dict): the PowerPorts of the Device or Module by name, to avoid looking up the one to assign
+        """
+        if self.power_port_template and power_ports is not None:
+            power_port = power_ports[self.power_port_template.name]
+        elif self.power_port_template:
             power_port = PowerPort.objects.get(device=device, module=module, name=self.power_port_template.name)
         else:
             power_port = None
@@ -312,6 +346,7 @@ class PowerOutletTemplate(ModularComponentTemplateModel):
             model=PowerOutlet,
             device=device,
             module=module,
+            custom_field_data=custom_field_data,
             type=self.type,
             power_port=power_port,
             feed_leg=self.feed_leg,
@@ -336,15 +371,21 @@ class InterfaceTemplate(ModularComponentTemplateModel):
     type = models.CharField(max_length=50, choices=InterfaceTypeChoices)
     mgmt_only = models.BooleanField(default=False, verbose_name="Management only")
 
-    def instantiate(self, device, module=None):
-        try:
-            status = Status.objects.get_for_model(Interface).get(name="Active")
-        except Status.DoesNotExist:
-            status = Status.objects.get_for_model(Interface).first()
+    def instantiate(self, device, module=None, custom_field_data=None, status=None):
+        """
+        Instantiate a new Interface on the specified Device or Module.
+
+        Args:
+            status (Status): the Status of the Interface, as returned by `get_default_interface_status()`, to avoid
+                looking it up again when instantiating many Interfaces
+        """
+        if status is None:
+            status = get_default_interface_status()
         return self.instantiate_model(
             model=Interface,
             device=device,
             module=module,
+            custom_field_data=custom_field_data,
             type=self.type,
             mgmt_only=self.mgmt_only,
             status=status,
@@ -402,8 +443,16 @@ class FrontPortTemplate(ModularComponentTemplateModel):
                 )
             )
 
-    def instantiate(self, device, module=None):
-        if self.rear_port_template:
+    def instantiate(self, device, module=None, custom_field_data=None, rear_ports=None):
+        """
+        Instantiate a new FrontPort on the specified Device or Module.
+
+        Args:
+            rear_ports (dict): the RearPorts of the Device or Module by name, to avoid looking up the one to assign
+        """
+        if self.rear_port_template and rear_ports is not None:
+            rear_port = rear_ports[self.rear_port_template.name]
+        elif self.rear_port_template:
             rear_port = RearPort.objects.get(device=device, module=module, name=self.rear_port_template.name)
         else:
             rear_port = None
@@ -411,6 +460,7 @@ class FrontPortTemplate(ModularComponentTemplateModel):
             model=FrontPort,
             device=device,
             module=module,
+            custom_field_data=custom_field_data,
             type=self.type,
             rear_port=rear_port,
             rear_port_position=self.rear_port_position,
@@ -434,11 +484,12 @@ class RearPortTemplate(ModularComponentTemplateModel):
         ],
     )
 
-    def instantiate(self, device, module=None):
+    def instantiate(self, device, module=None, custom_field_data=None):
         return self.instantiate_model(
             model=RearPort,
             device=device,
             module=module,
+            custom_field_data=custom_field_data,
             type=self.type,
             positions=self.positions,
         )
@@ -456,8 +507,8 @@ class DeviceBayTemplate(ComponentTemplateModel):
         ordering = ("device_type", "_name")
         unique_together = ("device_type", "name")
 
-    def instantiate(self, device):
-        return self.instantiate_model(model=DeviceBay, device=device)
+    def instantiate(self, device, custom_field_data=None):
+        return self.instantiate_model(model=DeviceBay, device=device, custom_field_data=custom_field_data)
 
     def clean(self):
         if self.device_type and self.device_type.subdevice_role != SubdeviceRoleChoices.ROLE_PARENT:
@@ -487,12 +538,9 @@ class ModuleBayTemplate(ModularComponentTemplateModel):
     def __str__(self):
         return f"{self.parent} ({self.name})"
 
-    def instantiate(self, device, module=None):
-        custom_field_data = {}
-        content_type = ContentType.objects.get_for_model(ModuleBay)
-        fields = CustomField.objects.filter(content_types=content_type)
-        for field in fields:
-            custom_field_data[field.key] = field.default
+    def instantiate(self, device, module=None, custom_field_data=None):
+        if custom_field_data is None:
+            custom_field_data = get_default_custom_field_data(ModuleBay)
 
         return ModuleBay(
             parent_device=device,
@@ -501,7 +549,7 @@ class ModuleBayTemplate(ModularComponentTemplateModel):
             position=self.position,
             label=self.label,
             description=self.description,
-            _custom_field_data=custom_field_data,
+            _custom_field_data=copy.deepcopy(custom_field_data),
         )
 
     def to_objectchange(self, action, **kwargs):
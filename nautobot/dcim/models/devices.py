@@ -1,4 +1,6 @@
-from collections import OrderedDict
+from collections import defaultdict, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.contenttypes.models import ContentType
@@ -30,6 +32,7 @@ from nautobot.extras.models import ChangeLoggedModel, ConfigContextModel, RoleFi
 from nautobot.extras.querysets import ConfigContextModelQuerySet
 from nautobot.extras.utils import extras_features
 
+from .device_component_templates import get_default_custom_field_data, get_default_interface_status
 from .device_components import (
     ConsolePort,
     ConsoleServerPort,
@@ -55,6 +58,108 @@ __all__ = (
 )
 
 
+#
+# Component instantiation
+#
+
+# The new Devices whose components are to be created on exiting `deferred_component_creation()`, while in use
+_deferred_component_creation_devices = ContextVar("deferred_component_creation_devices", default=None)
+
+
+def create_components_in_bulk(parents, batch_size=1000):
+    """
+    Create the components of the given new Devices or Modules from the component templates of their types.
+
+    This is equivalent to calling `create_components()` on each of them, but the components of each kind are created
+    for all of them at once, and the templates of each type, the default custom field data of each component model and
+    the status of new interfaces are looked up only once. Power outlets and front ports are assigned to the power ports
+    and rear ports created along with them without looking these up.
+
+    Args:
+        parents (list): the Devices, or the Modules, to create the components of
+        batch_size (int): the number of components of each kind to insert per query
+
+    Returns:
+        (list): the created components
+    """
+    parents_by_type = defaultdict(list)
+    for parent in parents:
+        parent_type = parent.module_type if isinstance(parent, Module) else parent.device_type
+        parents_by_type[parent_type].append(parent)
+
+    custom_field_data = {}
+    interface_status = None
+    instantiated_components = []
+    for parent_type, type_parents in parents_by_type.items():
+        # The order of these is significant as
+        # - PowerOutlet depends on PowerPort
+        # - FrontPort depends on RearPort
+        component_models = [
+            (ConsolePort, parent_type.console_port_templates.all()),
+            (ConsoleServerPort, parent_type.console_server_port_templates.all()),
+            (PowerPort, parent_type.power_port_templates.all()),
+            (PowerOutlet, parent_type.power_outlet_templates.select_related("power_port_template")),
+            (Interface, parent_type.interface_templates.all()),
+            (RearPort, parent_type.rear_port_templates.all()),
+            (FrontPort, parent_type.front_port_templates.select_related("rear_port_template")),
+            (ModuleBay, parent_type.module_bay_templates.all()),
+        ]
+        if isinstance(parent_type, DeviceType):
+            component_models.insert(-1, (DeviceBay, parent_type.device_bay_templates.all()))
+
+        power_ports = defaultdict(dict)
+        rear_ports = defaultdict(dict)
+        for model, templates in component_models:
+            templates = list(templates)
+            if not templates:
+                continue
+            if model not in custom_field_data:
+                custom_field_data[model] = get_default_custom_field_data(model)
+            if model is Interface and interface_status is None:
+                interface_status = get_default_interface_status()
+
+            components = []
+            for parent in type_parents:
+                kwargs = {"device": None, "module": parent} if isinstance(parent, Module) else {"device": parent}
+                kwargs["custom_field_data"] = custom_field_data[model]
+                if model is PowerOutlet:
+                    kwargs["power_ports"] = power_ports[parent.pk]
+                elif model is Interface:
+                    kwargs["status"] = interface_status
+                elif model is FrontPort:
+                    kwargs["rear_ports"] = rear_ports[parent.pk]
+                components.extend(template.instantiate(**kwargs) for template in templates)
+            model.objects.bulk_create(components, batch_size=batch_size)
+            instantiated_components.extend(components)
+
+            if model is PowerPort:
+                for component in components:
+                    power_ports[component.module_id or component.device_id][component.name] = component
+            elif model is RearPort:
+                for component in components:
+                    rear_ports[component.module_id or component.device_id][component.name] = component
+
+    return instantiated_components
+
+
+@contextmanager
+def deferred_component_creation():
+    """
+    Defer creating the components of the Devices created within this context until it's exited, then create the
+    components of all of them at once with `create_components_in_bulk()`, to speed up the creation of many Devices.
+
+    This should be used within a database transaction, so that the Devices aren't left without their components if
+    any error occurs in the meantime, in which case none are created.
+    """
+    devices = []
+    token = _deferred_component_creation_devices.set(devices)
+    try:
+        yield devices
+    finally:
+        _deferred_component_creation_devices.reset(token)
+    create_components_in_bulk(devices)
+
+
 #
 # Device Types
 #
@@ -838,7 +943,11 @@ class Device(PrimaryModel, ConfigContextModel):
 
         # If this is a new Device, instantiate all related components per the DeviceType definition
         if is_new:
-            self.create_components()
+            deferred_devices = _deferred_component_creation_devices.get()
+            if deferred_devices is None:
+                self.create_components()
+            else:
+                deferred_devices.append(self)
 
         # Update Location and Rack assignment for any child Devices
         devices = Device.objects.filter(parent_bay__device=self)
@@ -856,24 +965,7 @@ class Device(PrimaryModel, ConfigContextModel):
 
     def create_components(self):
         """Create device components from the device type definition."""
-        # The order of these is significant as
-        # - PowerOutlet depends on PowerPort
-        # - FrontPort depends on RearPort
-        component_models = [
-            (ConsolePort, self.device_type.console_port_templates.all()),
-            (ConsoleServerPort, self.device_type.console_server_port_templates.all()),
-            (PowerPort, self.device_type.power_port_templates.all()),
-            (PowerOutlet, self.device_type.power_outlet_templates.all()),
-            (Interface, self.device_type.interface_templates.all()),
-            (RearPort, self.device_type.rear_port_templates.all()),
-            (FrontPort, self.device_type.front_port_templates.all()),
-            (DeviceBay, self.device_type.device_bay_templates.all()),
-            (ModuleBay, self.device_type.module_bay_templates.all()),
-        ]
-        instantiated_components = []
-        for model, templates in component_models:
-            model.objects.bulk_create([x.instantiate(device=self) for x in templates])
-        return instantiated_components
+        return create_components_in_bulk([self])
 
     @property
     def display(self):
@@ -1768,23 +1860,7 @@ class Module(PrimaryModel):
 
     def create_components(self):
         """Create module components from the module type definition."""
-        # The order of these is significant as
-        # - PowerOutlet depends on PowerPort
-        # - FrontPort depends on RearPort
-        component_models = [
-            (ConsolePort, self.module_type.console_port_templates.all()),
-            (ConsoleServerPort, self.module_type.console_server_port_templates.all()),
-            (PowerPort, self.module_type.power_port_templates.all()),
-            (PowerOutlet, self.module_type.power_outlet_templates.all()),
-            (Interface, self.module_type.interface_templates.all()),
-            (RearPort, self.module_type.rear_port_templates.all()),
-            (FrontPort, self.module_type.front_port_templates.all()),
-            (ModuleBay, self.module_type.module_bay_templates.all()),
-        ]
-        instantiated_components = []
-        for model, templates in component_models:
-            model.objects.bulk_create([x.instantiate(device=None, module=self) for x in templates])
-        return instantiated_components
+        return create_components_in_bulk([self])
 
     def render_component_names(self):
         """
@@ -8,6 +8,7 @@ from django.dispatch import receiver
 
 from nautobot.core.signals import disable_for_loaddata
 
+from .cable_paths import retrace_cable_paths
 from .models import (
     Cable,
     CablePath,
@@ -30,13 +31,7 @@ def create_cablepath(node, rebuild=True):
 
     rebuild (bool) - Used to refresh paths where this node is not an endpoint.
     """
-    cp = CablePath.from_origin(node)
-    if cp:
-        try:
-            cp.save()
-        except Exception as e:
-            print(node, node.pk)
-            raise e
+    retrace_cable_paths([node])
     if rebuild:
         rebuild_paths(node)
 
@@ -45,13 +40,11 @@ def rebuild_paths(obj):
     """
     Rebuild all CablePaths which traverse the specified node
     """
-    cable_paths = CablePath.objects.filter(path__contains=obj)
+    origins = CablePath.objects.filter(path__contains=obj).values_list("origin_type_id", "origin_id")
 
     with transaction.atomic():
-        for cp in cable_paths:
-            cp.delete()
-            # Prevent looping back to rebuild_paths during the atomic transaction.
-            create_cablepath(cp.origin, rebuild=False)
+        # Retrace all affected paths together, updating them in place rather than deleting and recreating each one.
+        retrace_cable_paths(list(origins))
 
 
 #
@@ -260,19 +253,10 @@ def nullify_connected_endpoints(instance, **kwargs):
         instance.termination_b._cable_peer = None
         instance.termination_b.save()
 
-    # Delete and retrace any dependent cable paths
-    for cablepath in CablePath.objects.filter(path__contains=instance):
-        cp = CablePath.from_origin(cablepath.origin)
-        if cp:
-            CablePath.objects.filter(pk=cablepath.pk).update(
-                path=cp.path,
-                destination_type=ContentType.objects.get_for_model(cp.destination) if cp.destination else None,
-                destination_id=cp.destination.pk if cp.destination else None,
-                is_active=cp.is_active,
-                is_split=cp.is_split,
-            )
-        else:
-            cablepath.delete()
+    # Retrace any dependent cable paths, deleting those whose origin is no longer cabled
+    retrace_cable_paths(
+        list(CablePath.objects.filter(path__contains=instance).values_list("origin_type_id", "origin_id"))
+    )
 
 
 #
@@ -66,7 +66,7 @@ from nautobot.dcim.models import (
     SoftwareVersion,
     VirtualChassis,
 )
-from nautobot.extras.models import ConfigContextSchema, Role, SecretsGroup, Status
+from nautobot.extras.models import ConfigContextSchema, ObjectChange, Role, SecretsGroup, Status
 from nautobot.ipam.models import IPAddress, Namespace, Prefix, VLAN, VLANGroup
 from nautobot.tenancy.models import Tenant
 from nautobot.virtualization.models import Cluster, ClusterType
@@ -1698,6 +1698,48 @@ class DeviceTest(APIViewTestCases.APIViewTestCase):
         )
         self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
 
+    def test_provision_devices(self):
+        """
+        Check that many devices can be created at once, along with their components.
+        """
+        device_type = DeviceType.objects.create(manufacturer=Manufacturer.objects.first(), model="Provisioned Type")
+        power_port_template = PowerPortTemplate.objects.create(device_type=device_type, name="PSU 1")
+        PowerOutletTemplate.objects.create(
+            device_type=device_type, name="Outlet 1", power_port_template=power_port_template
+        )
+        for i in range(1, 4):
+            InterfaceTemplate.objects.create(
+                device_type=device_type, name=f"eth{i}", type=InterfaceTypeChoices.TYPE_1GE_FIXED
+            )
+        data = {
+            "names": ["leaf-01", "leaf-02"],
+            "device_type": device_type.pk,
+            "role": Role.objects.get_for_model(Device).first().pk,
+            "status": Status.objects.get_for_model(Device).first().pk,
+            "location": Location.objects.get_for_model(Device).first().pk,
+        }
+        url = reverse("dcim-api:device-provision")
+
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+        self.add_permissions("dcim.add_device")
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        self.assertEqual([device["name"] for device in response.json()], ["leaf-01", "leaf-02"])
+        for device in Device.objects.filter(name__in=["leaf-01", "leaf-02"]):
+            self.assertEqual(device.device_type, device_type)
+            self.assertEqual(sorted(device.interfaces.values_list("name", flat=True)), ["eth1", "eth2", "eth3"])
+            self.assertEqual(device.power_outlets.get().power_port, device.power_ports.get())
+            self.assertTrue(ObjectChange.objects.filter(changed_object_id=device.pk).exists())
+
+        # Nothing is created unless all of the devices are valid
+        for names in (["leaf-03", "leaf-03"], ["leaf-03", "leaf-01"]):
+            data["names"] = names
+            response = self.client.post(url, data, format="json", **self.header)
+            self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+            self.assertFalse(Device.objects.filter(name="leaf-03").exists())
+
 
 class ModuleTestCase(APIViewTestCases.APIViewTestCase):
     model = Module
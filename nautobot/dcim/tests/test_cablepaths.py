@@ -1,8 +1,16 @@
+from io import StringIO
+import os
+import tempfile
+
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider
+from nautobot.dcim.cable_paths import CablePathTracer, path_origin_key, retrace_cable_paths, RetraceResult
 from nautobot.dcim.models import (
     Cable,
     CablePath,
@@ -1494,3 +1502,79 @@ class CablePathTestCase(TestCase):
                 rearport1: 2,
             }
         )
+
+    def test_401_batched_retrace_of_patch_panel(self):
+        """
+        [IF1:n] --C1:n-- [FP1:n] [RP1] --C2-- [RP2] [FP2:n] --C3:n-- [IF2:n]
+
+        Validate that `CablePathTracer` produces the same paths as `CablePath.from_origin()` using a bounded number of
+        queries, and that retracing updates the existing paths in place.
+        """
+        positions = 8
+        rearport1 = RearPort.objects.create(device=self.device, name="Rear Port 1", positions=positions)
+        rearport2 = RearPort.objects.create(device=self.device, name="Rear Port 2", positions=positions)
+        interfaces = []
+        for position in range(1, positions + 1):
+            for side, rearport in ((1, rearport1), (2, rearport2)):
+                interface = Interface.objects.create(
+                    device=self.device, name=f"Interface {side}:{position}", status=self.interface_status
+                )
+                frontport = FrontPort.objects.create(
+                    device=self.device,
+                    name=f"Front Port {side}:{position}",
+                    rear_port=rearport,
+                    rear_port_position=position,
+                )
+                Cable.objects.create(termination_a=interface, termination_b=frontport, status=self.status)
+                interfaces.append(interface)
+        cable2 = Cable.objects.create(termination_a=rearport1, termination_b=rearport2, status=self.status)
+        self.assertEqual(CablePath.objects.filter(is_active=True).count(), positions * 2)
+
+        origin_keys = [path_origin_key(interface) for interface in interfaces]
+        with CaptureQueriesContext(connection) as queries:
+            traced = CablePathTracer().trace(origin_keys)
+        # The number of queries depends on the depth of the paths, not on the number of origins being traced
+        self.assertLess(len(queries), 10)
+        for interface, origin_key in zip(interfaces, origin_keys):
+            expected = CablePath.from_origin(interface)
+            self.assertEqual(traced[origin_key].path, expected.path)
+            self.assertEqual(traced[origin_key].destination, path_origin_key(expected.destination))
+            self.assertTrue(traced[origin_key].is_active)
+            self.assertFalse(traced[origin_key].is_split)
+
+        # Retracing in response to a status change must update the existing paths rather than recreating them
+        path_ids = set(CablePath.objects.values_list("pk", flat=True))
+        Cable.objects.filter(pk=cable2.pk).update(status=self.status_planned)
+        result = retrace_cable_paths(interfaces)
+        self.assertEqual(result, RetraceResult(created=0, updated=positions * 2, deleted=0))
+        self.assertEqual(set(CablePath.objects.values_list("pk", flat=True)), path_ids)
+        self.assertEqual(CablePath.objects.filter(is_active=True).count(), 0)
+        for interface in interfaces:
+            interface.refresh_from_db()
+            self.assertIn(interface._path_id, path_ids)
+
+        # Retracing unchanged paths is a no-op
+        self.assertEqual(retrace_cable_paths(interfaces), RetraceResult(created=0, updated=0, deleted=0))
+
+    def test_402_trace_paths_command_resumes_from_checkpoint(self):
+        """
+        [IF1] --C1-- [IF2]
+        """
+        interface1 = Interface.objects.create(device=self.device, name="Interface 1", status=self.interface_status)
+        interface2 = Interface.objects.create(device=self.device, name="Interface 2", status=self.interface_status)
+        Cable.objects.create(termination_a=interface1, termination_b=interface2, status=self.status)
+        CablePath.objects.all().delete()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint = os.path.join(tmpdir, "trace_paths.checkpoint")
+            # Simulate an interrupted run which already completed the chunk containing the device's interfaces
+            with open(checkpoint, "w") as checkpoint_file:
+                checkpoint_file.write(f"dcim.interface:{self.device.pk}\n")
+            call_command("trace_paths", "--force", "--no-input", "--checkpoint", checkpoint, stdout=StringIO())
+            self.assertEqual(CablePath.objects.count(), 0)
+            self.assertFalse(os.path.exists(checkpoint))
+
+            call_command("trace_paths", "--checkpoint", checkpoint, stdout=StringIO())
+            self.assertPathExists(origin=interface1, destination=interface2, is_active=True)
+            self.assertPathExists(origin=interface2, destination=interface1, is_active=True)
+            self.assertFalse(os.path.exists(checkpoint))
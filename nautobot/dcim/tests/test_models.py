@@ -62,6 +62,7 @@ from nautobot.dcim.models import (
     SoftwareImageFile,
     SoftwareVersion,
 )
+from nautobot.dcim.models.devices import deferred_component_creation
 from nautobot.extras import context_managers
 from nautobot.extras.choices import CustomFieldTypeChoices
 from nautobot.extras.models import CustomField, Role, SecretsGroup, Status
@@ -1545,6 +1546,49 @@ class DeviceTestCase(ModelTestCases.BaseModelTestCase):
         DeviceBay.objects.get(device=self.device, name="Device Bay 1")
         ModuleBay.objects.get(parent_device=self.device, position="1111")
 
+    def test_deferred_component_creation(self):
+        """
+        Ensure that the components of Devices created within deferred_component_creation() are created on exiting it.
+        """
+        devices = []
+        with deferred_component_creation():
+            for i in range(2, 5):
+                device = Device(
+                    location=self.location_3,
+                    device_type=self.device_type,
+                    role=self.device_role,
+                    status=self.device_status,
+                    name=f"Test Device {i}",
+                )
+                device.validated_save()
+                devices.append(device)
+            self.assertFalse(Interface.objects.filter(device__in=devices).exists())
+
+        for device in devices:
+            ConsolePort.objects.get(device=device, name="Console Port 1")
+            ConsoleServerPort.objects.get(device=device, name="Console Server Port 1")
+            pp = PowerPort.objects.get(device=device, name="Power Port 1", maximum_draw=1000, allocated_draw=500)
+            PowerOutlet.objects.get(device=device, name="Power Outlet 1", power_port=pp)
+            Interface.objects.get(device=device, name="Interface 1", mgmt_only=True, status__name="Active")
+            rp = RearPort.objects.get(device=device, name="Rear Port 1", positions=8)
+            FrontPort.objects.get(device=device, name="Front Port 1", rear_port=rp, rear_port_position=2)
+            DeviceBay.objects.get(device=device, name="Device Bay 1")
+            ModuleBay.objects.get(parent_device=device, position="1111")
+
+        # No components are created if the Devices aren't created successfully
+        with self.assertRaises(ValidationError):
+            with deferred_component_creation():
+                device = Device(
+                    location=self.location_3,
+                    device_type=self.device_type,
+                    role=self.device_role,
+                    status=self.device_status,
+                    name="Test Device 5",
+                )
+                device.validated_save()
+                Device(location=self.location_3, device_type=self.device_type, name="Test Device 5").validated_save()
+        self.assertFalse(Interface.objects.filter(device=device).exists())
+
     def test_multiple_unnamed_devices(self):
         device1 = Device(
             location=self.location_3,
@@ -1026,6 +1026,8 @@ class ObjectChangeViewSet(ReadOnlyModelViewSet):
     queryset = ObjectChange.objects.select_related("user")
     serializer_class = serializers.ObjectChangeSerializer
     filterset_class = filters.ObjectChangeFilterSet
+    # Walk the change log newest-first using the existing index on `time` when using keyset pagination
+    cursor_pagination_ordering = ("-time", "pk")
 
 
 #
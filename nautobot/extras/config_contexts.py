@@ -0,0 +1,245 @@
+"""Maintenance of the materialized config contexts (`RenderedConfigContext`) of Devices and VirtualMachines."""
+
+from collections import defaultdict
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+
+from nautobot.core.models.querysets import chunked_queryset
+from nautobot.core.utils.transactions import get_on_commit_callback
+from nautobot.extras.models import ConfigContext, RenderedConfigContext
+
+# For each model supporting config contexts, the lookup of the related object(s) that each ConfigContext qualifier field
+# is matched against, or None if the qualifier can never match objects of that model.
+# Dynamic Groups are omitted, as `ConfigContextModelQuerySet.annotate_config_context_data()` doesn't consider them; the
+# rendered config contexts are therefore not used if `CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED` is True.
+CONFIG_CONTEXT_QUALIFIER_LOOKUPS = {
+    "dcim.device": {
+        "locations": "location",
+        "roles": "role",
+        "device_types": "device_type",
+        "device_redundancy_groups": "device_redundancy_group",
+        "platforms": "platform",
+        "cluster_groups": "cluster__cluster_group",
+        "clusters": "cluster",
+        "tenant_groups": "tenant__tenant_group",
+        "tenants": "tenant",
+        "tags": "tags",
+    },
+    "virtualization.virtualmachine": {
+        "locations": "cluster__location",
+        "roles": "role",
+        "device_types": None,
+        "device_redundancy_groups": None,
+        "platforms": "platform",
+        "cluster_groups": "cluster__cluster_group",
+        "clusters": "cluster",
+        "tenant_groups": "tenant__tenant_group",
+        "tenants": "tenant",
+        "tags": "tags",
+    },
+}
+
+# Qualifier fields whose ConfigContexts also apply to objects assigned to descendants of the qualifying objects
+HIERARCHICAL_QUALIFIERS = ("locations", "tenant_groups")
+
+# Fields of qualifier models (by ConfigContext qualifier field) that affect which ConfigContexts apply to the objects
+# related to an instance of the model, such as the parent of a Location
+QUALIFIER_DEPENDENCY_FIELDS = {
+    "locations": ("parent",),
+    "tenant_groups": ("parent",),
+    "tenants": ("tenant_group",),
+    "clusters": ("cluster_group", "location"),
+}
+
+
+def get_config_context_models():
+    """Return the list of models that have materialized config contexts."""
+    return [apps.get_model(label) for label in CONFIG_CONTEXT_QUALIFIER_LOOKUPS]
+
+
+def get_qualifier_models():
+    """Return a dict of the model of each ConfigContext qualifier field to the name of the field."""
+    return {
+        ConfigContext._meta.get_field(field_name).related_model: field_name
+        for field_name in CONFIG_CONTEXT_QUALIFIER_LOOKUPS["dcim.device"]
+    }
+
+
+def get_object_ids_for_qualifiers(model, field_name, qualifiers):
+    """
+    Return the set of IDs of objects of the given model that match the given qualifiers of a ConfigContext.
+
+    Args:
+        model (Model): Device or VirtualMachine
+        field_name (str): ConfigContext qualifier field, such as "locations"
+        qualifiers (list): Qualifying objects of the type of the qualifier field
+
+    Returns:
+        (set): Primary keys of the matching objects
+    """
+    lookup = CONFIG_CONTEXT_QUALIFIER_LOOKUPS[model._meta.label_lower][field_name]
+    if lookup is None or not qualifiers:
+        return set()
+    if field_name in HIERARCHICAL_QUALIFIERS:
+        qualifier_ids = set()
+        for qualifier in qualifiers:
+            qualifier_ids.update(qualifier.descendants(include_self=True).values_list("pk", flat=True))
+    else:
+        qualifier_ids = {qualifier.pk for qualifier in qualifiers}
+    return set(model.objects.filter(**{f"{lookup}__in": qualifier_ids}).values_list("pk", flat=True))
+
+
+def get_object_ids_for_config_context(model, config_context):
+    """
+    Return the set of IDs of objects of the given model that the given ConfigContext (as saved) applies to.
+
+    This is the converse of `ConfigContext.objects.get_for_object()`.
+    """
+    if not config_context.is_active:
+        return set()
+    object_ids = None
+    for field_name in CONFIG_CONTEXT_QUALIFIER_LOOKUPS[model._meta.label_lower]:
+        qualifiers = list(getattr(config_context, field_name).all())
+        if not qualifiers:
+            continue
+        matching_ids = get_object_ids_for_qualifiers(model, field_name, qualifiers)
+        object_ids = matching_ids if object_ids is None else object_ids & matching_ids
+        if not object_ids:
+            return set()
+    if object_ids is None:
+        # No qualifiers, so the ConfigContext applies to all objects
+        return set(model.objects.values_list("pk", flat=True))
+    return object_ids
+
+
+def refresh_rendered_config_contexts(model, pks=None, chunk_size=1000):
+    """
+    Compute and store the rendered config context of the given objects of the given model.
+
+    Args:
+        model (Model): Device or VirtualMachine
+        pks (iterable): Primary keys of the objects to refresh, or None to refresh all objects of the model
+        chunk_size (int): Number of objects to compute and store at a time
+
+    Returns:
+        (int): the number of objects refreshed
+    """
+    if pks is None:
+        chunks = chunked_queryset(model.objects.order_by(), chunk_size=chunk_size)
+    else:
+        pks = list(pks)
+        chunks = (model.objects.filter(pk__in=pks[i : i + chunk_size]) for i in range(0, len(pks), chunk_size))
+    content_type = ContentType.objects.get_for_model(model)
+    bulk_create_kwargs = {"update_conflicts": True, "update_fields": ["data"]}
+    if transaction.get_connection().features.supports_update_conflicts_with_target:
+        bulk_create_kwargs["unique_fields"] = ["assigned_object_type", "assigned_object_id"]
+
+    count = 0
+    for chunk in chunks:
+        rendered_config_contexts = [
+            RenderedConfigContext(
+                assigned_object_type=content_type,
+                assigned_object_id=obj.pk,
+                data=obj.get_config_context(),
+            )
+            for obj in chunk.annotate_config_context_data(materialized=False)
+        ]
+        RenderedConfigContext.objects.bulk_create(rendered_config_contexts, **bulk_create_kwargs)
+        count += len(rendered_config_contexts)
+    return count
+
+
+class PendingRefresh:
+    """
+    Objects whose rendered config contexts are to be refreshed once the current database transaction is committed.
+
+    Changes to ConfigContexts are recorded in two steps: before the change, the objects that the ConfigContext applies
+    to (as of the start of the transaction) are recorded, and the ConfigContext itself is recorded so that the objects
+    that it applies to as of the end of the transaction are added when the refresh is performed. This way, repeated
+    changes to the same ConfigContext within a transaction, such as saving it and then setting each of its qualifiers,
+    only require the objects that it applies to to be looked up twice.
+    """
+
+    def __init__(self):
+        self.object_ids = defaultdict(set)
+        self.config_context_ids = set()
+        self.seen_config_context_ids = set()
+
+    def __call__(self):
+        for config_context in ConfigContext.objects.filter(pk__in=self.config_context_ids):
+            for model in get_config_context_models():
+                self.object_ids[model].update(get_object_ids_for_config_context(model, config_context))
+        with transaction.atomic():
+            for model, pks in self.object_ids.items():
+                refresh_rendered_config_contexts(model, pks)
+
+
+def get_pending_refresh():
+    """
+    Get the `PendingRefresh` for the current database transaction, creating it if necessary.
+
+    Outside of a transaction, the refresh is only performed by `schedule_pending_refresh()`, once the recorded changes
+    have been made.
+    """
+    connection = transaction.get_connection()
+    if connection.in_atomic_block:
+        return get_on_commit_callback("config_context_refresh", PendingRefresh)
+    if getattr(connection, "_pending_config_context_refresh", None) is None:
+        connection._pending_config_context_refresh = PendingRefresh()
+    return connection._pending_config_context_refresh
+
+
+def schedule_pending_refresh():
+    """
+    Perform the refresh pending outside of a transaction, as the refresh pending within one is performed once it's
+    committed.
+
+    This must be called *after* a recorded change has been made.
+    """
+    connection = transaction.get_connection()
+    pending = getattr(connection, "_pending_config_context_refresh", None)
+    connection._pending_config_context_refresh = None
+    if pending is None or not (pending.object_ids or pending.config_context_ids):
+        return
+    if connection.in_atomic_block:
+        # The changes were recorded before the current transaction was started
+        transaction.on_commit(pending, robust=True)
+    else:
+        pending()
+
+
+def record_object_change(model, pks):
+    """Record that the rendered config contexts of the given objects of the given model are to be refreshed."""
+    get_pending_refresh().object_ids[model].update(pks)
+
+
+def record_config_context_change(config_context_ids, created=False):
+    """
+    Record that the given ConfigContexts are about to be changed or deleted, or have just been created.
+
+    Unless the ConfigContexts were just created, the objects that each of them currently applies to are recorded, unless
+    they already were earlier in the current transaction. The ConfigContexts themselves are recorded so that the objects
+    that they apply to after the change are also refreshed.
+    """
+    pending = get_pending_refresh()
+    config_context_ids = set(config_context_ids)
+    unseen_config_context_ids = config_context_ids - pending.seen_config_context_ids
+    if not created:
+        for config_context in ConfigContext.objects.filter(pk__in=unseen_config_context_ids):
+            for model in get_config_context_models():
+                pending.object_ids[model].update(get_object_ids_for_config_context(model, config_context))
+    pending.config_context_ids.update(config_context_ids)
+    if transaction.get_connection().in_atomic_block:
+        pending.seen_config_context_ids.update(unseen_config_context_ids)
+
+
+def record_qualifier_change(field_name, qualifier):
+    """
+    Record that the given object, a potential qualifier of ConfigContexts through the given ConfigContext field, is
+    about to be changed or deleted in a way that may affect which ConfigContexts apply to the objects related to it.
+    """
+    pending = get_pending_refresh()
+    for model in get_config_context_models():
+        pending.object_ids[model].update(get_object_ids_for_qualifiers(model, field_name, [qualifier]))
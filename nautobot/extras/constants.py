@@ -1,6 +1,9 @@
 # Webhook content types
 HTTP_CONTENT_TYPE_JSON = "application/json"
 
+# Maximum number of events sent in a single request by a Webhook with batch_events enabled
+WEBHOOK_BATCH_MAX_EVENTS = 1000
+
 # Registerable extras features
 EXTRAS_FEATURES = [
     "cable_terminations",
@@ -7,10 +7,14 @@ from django.db import transaction
 from django.test.client import RequestFactory
 
 from nautobot.extras.choices import ObjectChangeEventContextChoices
-from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
 from nautobot.extras.models import ObjectChange
-from nautobot.extras.signals import change_context_state, get_user_if_authenticated
-from nautobot.extras.webhooks import enqueue_webhooks
+from nautobot.extras.signals import (
+    build_object_change,
+    change_context_state,
+    enqueue_object_changes_creation,
+    get_user_if_authenticated,
+)
+from nautobot.extras.webhooks import enqueue_webhooks_for_object_changes
 
 
 class ChangeContext:
@@ -28,11 +32,17 @@ class ChangeContext:
     """
 
     defer_object_changes = False  # advanced usage, for creating object changes in bulk
+    enqueues_hooks = False  # whether webhooks and job hooks are enqueued for the changes, by web_request_context()
+    hooks_enqueued = False  # whether they already have been, so those of any changes logged later must be as well
 
     def __init__(self, user=None, request=None, context=None, context_detail="", change_id=None):
         self.request = request
         self.user = user
         self.reset_deferred_object_changes()
+        # Changes buffered outside of a transaction, and those left to be saved by a Celery worker, with
+        # settings.CHANGELOG_WRITE_MODE set to "on_commit" or "celery"
+        self.pending_object_changes = None
+        self.unwritten_object_changes = []
 
         if self.request is None and self.user is None:
             raise TypeError("Either user or request must be provided")
@@ -89,19 +99,8 @@ class ChangeContext:
             create_object_changes = []
             for key in self._object_change_batch(batch_size):
                 for entry in self.deferred_object_changes[key]:
-                    objectchange = entry["instance"].to_objectchange(entry["action"])
+                    objectchange = build_object_change({"change_context": self, **entry})
                     if objectchange is not None:
-                        objectchange.user = entry["user"]
-                        objectchange.user_name = objectchange.user.username
-                        objectchange.request_id = self.change_id
-                        objectchange.change_context = self.context
-                        objectchange.change_context_detail = self.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
-                        if not objectchange.changed_object_id:  # changed_object was deleted
-                            # Clear out the GenericForeignKey to keep Django from complaining about an unsaved object:
-                            objectchange.changed_object = None
-                            # Set the component fields individually:
-                            objectchange.changed_object_id = entry.get("changed_object_id")
-                            objectchange.changed_object_type = entry.get("changed_object_type")
                         create_object_changes.append(objectchange)
                 self.deferred_object_changes.pop(key, None)
             ObjectChange.objects.bulk_create(create_object_changes, batch_size=batch_size)
@@ -149,6 +148,11 @@ def change_logging(change_context):
         # Reset change logging state. This is necessary to avoid recording any errant
         # changes during test cleanup.
         change_context_state.reset(prev_state)
+        # Log any changes made outside of a transaction that were buffered until now
+        pending_object_changes = change_context.pending_object_changes
+        if pending_object_changes is not None:
+            change_context.pending_object_changes = None
+            pending_object_changes()
 
 
 @contextmanager
@@ -179,7 +183,7 @@ def web_request_context(
         Valid choices are in nautobot.extras.choices.ObjectChangeEventContextChoices
     :param request: Optional web request instance, one will be generated if not supplied
     """
-    from nautobot.extras.jobs import enqueue_job_hooks  # prevent circular import
+    from nautobot.extras.jobs import enqueue_job_hooks_for_object_changes  # prevent circular import
 
     valid_contexts = {
         ObjectChangeEventContextChoices.CONTEXT_JOB: JobChangeContext,
@@ -198,14 +202,19 @@ def web_request_context(
         request = RequestFactory().request(SERVER_NAME="web_request_context")
         request.user = user
     change_context = valid_contexts[context](request=request, context_detail=context_detail, change_id=change_id)
+    change_context.enqueues_hooks = True
     try:
         with change_logging(change_context):
             yield request
     finally:
         # enqueue jobhooks and webhooks, use change_context.change_id in case change_id was not supplied
-        for object_change in ObjectChange.objects.filter(request_id=change_context.change_id).iterator():
-            enqueue_job_hooks(object_change)
-            enqueue_webhooks(object_change)
+        object_changes = ObjectChange.objects.filter(request_id=change_context.change_id).select_related("user")
+        enqueue_job_hooks_for_object_changes(object_changes.iterator())
+        enqueue_webhooks_for_object_changes(object_changes.iterator())
+        # Any changes logged from now on, such as when an enclosing transaction is committed, enqueue their own hooks
+        change_context.hooks_enqueued = True
+        enqueue_object_changes_creation(change_context, change_context.unwritten_object_changes)
+        change_context.unwritten_object_changes = []
 
 
 @contextmanager
@@ -1877,6 +1877,7 @@ class WebhookForm(BootstrapMixin, forms.ModelForm):
             "secret",
             "ssl_verification",
             "ca_file_path",
+            "batch_events",
         )
 
     def clean(self):
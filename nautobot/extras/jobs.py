@@ -18,8 +18,9 @@ from db_file_storage.form_widgets import DBClearableFileInput
 from django import forms
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.core.files.uploadedfile import UploadedFile
 from django.core.validators import RegexValidator
 from django.db.models import Model
@@ -30,6 +31,7 @@ import netaddr
 import yaml
 
 from nautobot.core.celery import import_jobs, nautobot_task
+from nautobot.core.celery.log import NautobotDatabaseHandler
 from nautobot.core.forms import (
     DynamicModelChoiceField,
     DynamicModelMultipleChoiceField,
@@ -275,6 +277,9 @@ class BaseJob:
         if status == JobResultStatusChoices.STATUS_SUCCESS:
             self.logger.info("Job completed", extra={"grouping": "post_run"})
 
+        # Store any buffered log entries before the JobResult is marked as completed
+        NautobotDatabaseHandler.flush_task(task_id)
+
     @final
     @classproperty
     def file_path(cls) -> str:  # pylint: disable=no-self-argument
@@ -709,7 +714,8 @@ class BaseJob:
 
         Args:
             filename (str): Name of the file to create, including extension
-            content (str, bytes): Content to populate the created file with.
+            content (str, bytes, file): Content to populate the created file with. Large content that has been
+                written incrementally may be passed as a seekable binary file object rather than held in memory.
 
         Raises:
             (ValueError): if the provided content exceeds JOB_CREATE_FILE_MAX_SIZE in length
@@ -720,12 +726,16 @@ class BaseJob:
         if isinstance(content, str):
             content = content.encode("utf-8")
         max_size = get_settings_or_config("JOB_CREATE_FILE_MAX_SIZE")
-        actual_size = len(content)
+        if hasattr(content, "read"):
+            actual_size = content.seek(0, os.SEEK_END)
+            content.seek(0)
+            file = File(content, name=filename)
+        else:
+            actual_size = len(content)
+            file = ContentFile(content, name=filename)
         if actual_size > max_size:
             raise ValueError(f"Provided {actual_size} bytes of content, but JOB_CREATE_FILE_MAX_SIZE is {max_size}")
-        fp = FileProxy.objects.create(
-            name=filename, job_result=self.job_result, file=ContentFile(content, name=filename)
-        )
+        fp = FileProxy.objects.create(name=filename, job_result=self.job_result, file=file)
         self.logger.info("Created file [%s](%s)", filename, fp.file.url)
         return fp
 
@@ -1142,22 +1152,23 @@ def run_job(self, job_class_path, *args, **kwargs):
         job.on_failure(exc, self.request.id, args, kwargs, einfo)
         job.after_return(JobResultStatusChoices.STATUS_FAILURE, exc, self.request.id, args, kwargs, einfo)
         raise
+    finally:
+        # Store any log entries logged by the Job after (or instead of) calling `BaseJob.after_return()`
+        NautobotDatabaseHandler.flush_task(self.request.id)
 
 
-def enqueue_job_hooks(object_change):
+def get_job_hooks_for_object_change(object_change):
     """
-    Find job hook(s) assigned to this changed object type + action and enqueue them
-    to be processed
+    Return the list of enabled job hooks applicable to the changed object type and action of the given ObjectChange.
     """
-
     # Job hooks cannot trigger other job hooks
     if object_change.change_context == ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK:
-        return
+        return []
 
     # Determine whether this type of object supports job hooks
-    content_type = object_change.changed_object_type
+    content_type = ContentType.objects.get_for_id(object_change.changed_object_type_id)
     if content_type not in change_logged_models_queryset():
-        return
+        return []
 
     # Retrieve any applicable job hooks
     action_flag = {
@@ -1165,10 +1176,12 @@ def enqueue_job_hooks(object_change):
         ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
         ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
     }[object_change.action]
-    job_hooks = JobHook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
+    return list(
+        JobHook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True}).select_related("job")
+    )
 
-    # Enqueue the jobs related to the job_hooks
-    get_jobs(reload=True)
+
+def _enqueue_job_hooks(object_change, job_hooks):
     for job_hook in job_hooks:
         job_model = job_hook.job
         if not job_model.installed or not job_model.enabled:
@@ -1179,3 +1192,36 @@ def enqueue_job_hooks(object_change):
             logger.error("JobHook %s is enabled, but the underlying Job implementation is missing", job_hook)
         else:
             JobResult.enqueue_job(job_model, object_change.user, object_change=object_change.pk)
+
+
+def enqueue_job_hooks(object_change):
+    """
+    Find job hook(s) assigned to this changed object type + action and enqueue them
+    to be processed
+    """
+    job_hooks = get_job_hooks_for_object_change(object_change)
+
+    # Enqueue the jobs related to the job_hooks
+    if job_hooks:
+        get_jobs(reload=True)
+    _enqueue_job_hooks(object_change, job_hooks)
+
+
+def enqueue_job_hooks_for_object_changes(object_changes):
+    """
+    Find and enqueue the job hook(s) applicable to each of the given ObjectChanges, such as all those of a request.
+
+    The applicable job hooks are looked up only once for each distinct change context, changed object type and action,
+    and the Job classes are reloaded at most once, rather than once per change.
+    """
+    job_hooks_by_group = {}
+    jobs_reloaded = False
+    for object_change in object_changes:
+        group = (object_change.change_context, object_change.changed_object_type_id, object_change.action)
+        if group not in job_hooks_by_group:
+            job_hooks_by_group[group] = get_job_hooks_for_object_change(object_change)
+        job_hooks = job_hooks_by_group[group]
+        if job_hooks and not jobs_reloaded:
+            get_jobs(reload=True)
+            jobs_reloaded = True
+        _enqueue_job_hooks(object_change, job_hooks)
@@ -0,0 +1,46 @@
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot.extras.config_contexts import get_config_context_models, refresh_rendered_config_contexts
+from nautobot.extras.models import RenderedConfigContext
+
+
+class Command(BaseCommand):
+    help = "Compute and store the rendered config contexts of all Devices and Virtual Machines."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of objects to compute and store the config contexts of at a time (default: %(default)s)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer")
+        if not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+            self.stdout.write(
+                self.style.WARNING(
+                    "CONFIG_CONTEXT_MATERIALIZATION_ENABLED is False; the rendered config contexts will not be used "
+                    "or kept up to date until it is enabled."
+                )
+            )
+
+        for model in get_config_context_models():
+            self.stdout.write(f"Refreshing rendered config contexts of {model._meta.verbose_name_plural}...")
+            # Remove those of any objects deleted while the rendered config contexts weren't being maintained
+            stale_rendered_config_contexts = RenderedConfigContext.objects.filter(
+                assigned_object_type=ContentType.objects.get_for_model(model)
+            ).exclude(assigned_object_id__in=model.objects.values("pk"))
+            deleted_count, _ = stale_rendered_config_contexts.delete()
+            count = refresh_rendered_config_contexts(model, chunk_size=batch_size)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"  Refreshed {count} and removed {deleted_count} stale rendered config contexts of "
+                    f"{model._meta.verbose_name_plural}"
+                )
+            )
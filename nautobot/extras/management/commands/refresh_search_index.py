@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot.extras.models import SearchIndexEntry
+from nautobot.extras.search_index import get_indexed_models, refresh_search_index
+
+
+class Command(BaseCommand):
+    help = "Compute and store the search index entries of all objects of the models included in the global search."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of objects to compute and store the search index entries of at a time (default: %(default)s)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer")
+        if not settings.SEARCH_INDEX_ENABLED:
+            self.stdout.write(
+                self.style.WARNING(
+                    "SEARCH_INDEX_ENABLED is False; the search index will not be used or kept up to date until it is "
+                    "enabled."
+                )
+            )
+
+        indexed_models = get_indexed_models()
+        # Remove the entries of any models no longer included in the global search
+        SearchIndexEntry.objects.exclude(
+            content_type__in=ContentType.objects.get_for_models(*indexed_models).values()
+        ).delete()
+        for model in indexed_models:
+            self.stdout.write(f"Refreshing search index entries of {model._meta.verbose_name_plural}...")
+            # Remove those of any objects deleted while the search index wasn't being maintained
+            stale_entries = SearchIndexEntry.objects.filter(
+                content_type=ContentType.objects.get_for_model(model)
+            ).exclude(object_id__in=model.objects.values("pk"))
+            deleted_count, _ = stale_entries.delete()
+            count = refresh_search_index(model, chunk_size=batch_size)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"  Refreshed {count} and removed {deleted_count} stale search index entries of "
+                    f"{model._meta.verbose_name_plural}"
+                )
+            )
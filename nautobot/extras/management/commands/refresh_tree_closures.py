@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot.extras.tree_closures import get_tree_models, refresh_tree_closure
+
+
+class Command(BaseCommand):
+    help = "Rebuild the closure tables of the trees of all tree models, such as Locations."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of closure records to store at a time (default: %(default)s)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer")
+        if not settings.TREE_CLOSURE_ENABLED:
+            self.stdout.write(
+                self.style.WARNING(
+                    "TREE_CLOSURE_ENABLED is False; the tree closure tables will not be used or kept up to date until "
+                    "it is enabled."
+                )
+            )
+
+        for model in get_tree_models():
+            self.stdout.write(f"Refreshing the tree closure table of {model._meta.verbose_name_plural}...")
+            count = refresh_tree_closure(model, batch_size=batch_size)
+            self.stdout.write(
+                self.style.SUCCESS(f"  Refreshed the closures of {count} {model._meta.verbose_name_plural}")
+            )
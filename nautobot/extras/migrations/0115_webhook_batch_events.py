@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2024-09-20 14:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0114_computedfield_grouping"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhook",
+            name="batch_events",
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2024-09-20 14:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0115_webhook_batch_events"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="objectchange",
+            index=models.Index(
+                fields=["changed_object_type", "changed_object_id", "time"], name="changed_object_time_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.16 on 2024-09-20 16:05
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def populate_graphqlquery_query_hash(apps, schema_editor):
+    """
+    Compute the query hash of all existing GraphQLQuery records.
+    """
+    GraphQLQuery = apps.get_model("extras", "GraphQLQuery")
+    for graphql_query in GraphQLQuery.objects.iterator():
+        graphql_query.query_hash = hashlib.sha256(graphql_query.query.encode("utf-8")).hexdigest()
+        graphql_query.save(update_fields=["query_hash"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0116_objectchange_changed_object_time_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="graphqlquery",
+            name="query_hash",
+            field=models.CharField(db_index=True, default="", editable=False, max_length=64),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_graphqlquery_query_hash, migrations.RunPython.noop),
+    ]
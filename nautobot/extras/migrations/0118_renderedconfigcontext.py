@@ -0,0 +1,39 @@
+# Generated by Django 4.2.16 on 2024-09-23 14:12
+
+import uuid
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("extras", "0117_graphqlquery_query_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RenderedConfigContext",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("assigned_object_id", models.UUIDField()),
+                ("data", models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                (
+                    "assigned_object_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="contenttypes.contenttype"
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("assigned_object_type", "assigned_object_id")},
+            },
+        ),
+    ]
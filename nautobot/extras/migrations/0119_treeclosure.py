@@ -0,0 +1,39 @@
+# Generated by Django 4.2.16 on 2024-09-27 09:41
+
+import uuid
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("extras", "0118_renderedconfigcontext"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TreeClosure",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("ancestor_id", models.UUIDField()),
+                ("descendant_id", models.UUIDField(db_index=True)),
+                ("depth", models.PositiveSmallIntegerField()),
+                (
+                    "tree_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="contenttypes.contenttype"
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("ancestor_id", "descendant_id")},
+            },
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 4.2.16 on 2024-09-30 11:02
+
+import uuid
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def create_trigram_index(apps, schema_editor):
+    """
+    On PostgreSQL, index the searchable text with trigrams, such that substring searches don't need to scan all entries.
+
+    The `pg_trgm` extension can only be created by a sufficiently privileged user; without it, the entries are scanned.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        """
+        DO $$
+        BEGIN
+            CREATE EXTENSION IF NOT EXISTS pg_trgm;
+            CREATE INDEX IF NOT EXISTS extras_searchindexentry_text_trgm
+                ON extras_searchindexentry USING gin (text gin_trgm_ops);
+        EXCEPTION WHEN insufficient_privilege OR undefined_file THEN
+            RAISE NOTICE 'pg_trgm is not available; the search index text will not be indexed with trigrams';
+        END
+        $$;
+        """
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS extras_searchindexentry_text_trgm")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("extras", "0119_treeclosure"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchIndexEntry",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("object_id", models.UUIDField()),
+                ("text", models.TextField()),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="contenttypes.contenttype"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "search index entries",
+                "unique_together": {("content_type", "object_id")},
+            },
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
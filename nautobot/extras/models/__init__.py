@@ -27,7 +27,10 @@ from .models import (
     HealthCheckTestModel,
     ImageAttachment,
     Note,
+    RenderedConfigContext,
     SavedView,
+    SearchIndexEntry,
+    TreeClosure,
     UserSavedViewAssociation,
     Webhook,
 )
@@ -74,6 +77,7 @@ __all__ = (
     "ObjectMetadata",
     "Relationship",
     "RelationshipModel",
+    "RenderedConfigContext",
     "RelationshipAssociation",
     "Role",
     "RoleField",
@@ -81,6 +85,7 @@ __all__ = (
     "SavedViewMixin",
     "ScheduledJob",
     "ScheduledJobs",
+    "SearchIndexEntry",
     "Secret",
     "SecretsGroup",
     "SecretsGroupAssociation",
@@ -91,6 +96,7 @@ __all__ = (
     "Tag",
     "TaggedItem",
     "Team",
+    "TreeClosure",
     "UserSavedViewAssociation",
     "Webhook",
 )
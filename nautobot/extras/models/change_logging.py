@@ -1,8 +1,11 @@
+from collections import defaultdict
+
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models.functions import Lead
 from django.urls import NoReverseMatch, reverse
 
 from nautobot.core.celery import NautobotKombuJSONEncoder
@@ -136,6 +139,10 @@ class ObjectChange(BaseModel):
                 name="changed_object_idx",
                 fields=["changed_object_type", "changed_object_id"],
             ),
+            models.Index(
+                name="changed_object_time_idx",
+                fields=["changed_object_type", "changed_object_id", "time"],
+            ),
             models.Index(
                 name="related_object_idx",
                 fields=["related_object_type", "related_object_id"],
@@ -150,6 +157,11 @@ class ObjectChange(BaseModel):
             ),
         ]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Cache of get_snapshots()
+        self._snapshots = None
+
     def __str__(self):
         return f"{self.changed_object_type} {self.object_repr} {self.get_action_display().lower()} by {self.user_name}"
 
@@ -194,6 +206,8 @@ class ObjectChange(BaseModel):
         Return a dictionary with the changed object's serialized data before and after this change
         occurred and a key with a shallow diff of those dictionaries.
 
+        The snapshots are computed only once per ObjectChange instance; see also `get_snapshots_for()`.
+
         Returns:
         {
             "prechange": dict(),
@@ -204,11 +218,59 @@ class ObjectChange(BaseModel):
             }
         }
         """
+        if self._snapshots is None:
+            self._snapshots = self._compute_snapshots(self.get_prev_change())
+        return self._snapshots
+
+    @classmethod
+    def get_snapshots_for(cls, object_changes):
+        """
+        Compute the snapshots of many ObjectChanges, retrieving all of their prior changes in a single query.
+
+        Rather than performing one `get_prev_change()` query per ObjectChange, a window function is used to find, among
+        all of the changes to the changed objects, those whose *next* change is one of the given ObjectChanges.
+        The snapshots are cached on each of the given instances, as by `get_snapshots()`.
+
+        Args:
+            object_changes (list): ObjectChange instances.
+
+        Returns:
+            (dict): Mapping of ObjectChange PK to the dictionary returned by its `get_snapshots()`.
+        """
+        pending = {
+            object_change.pk: object_change for object_change in object_changes if object_change._snapshots is None
+        }
+        prior_changes = {}
+        if pending:
+            object_ids_by_type = defaultdict(set)
+            for object_change in pending.values():
+                object_ids_by_type[object_change.changed_object_type_id].add(object_change.changed_object_id)
+            changed_objects = models.Q()
+            for changed_object_type_id, changed_object_ids in object_ids_by_type.items():
+                changed_objects |= models.Q(
+                    changed_object_type_id=changed_object_type_id, changed_object_id__in=changed_object_ids
+                )
+            queryset = (
+                cls.objects.filter(changed_objects, time__lte=max(oc.time for oc in pending.values()))
+                .annotate(
+                    next_change_id=models.Window(
+                        expression=Lead("pk"),
+                        partition_by=[models.F("changed_object_type_id"), models.F("changed_object_id")],
+                        order_by=models.F("time").asc(),
+                    )
+                )
+                .filter(next_change_id__in=list(pending))
+            )
+            prior_changes = {prior_change.next_change_id: prior_change for prior_change in queryset}
+
+        for pk, object_change in pending.items():
+            object_change._snapshots = object_change._compute_snapshots(prior_changes.get(pk))
+        return {object_change.pk: object_change.get_snapshots() for object_change in object_changes}
+
+    def _compute_snapshots(self, prior_change):
         prechange = None
         postchange = None
 
-        prior_change = self.get_prev_change()
-
         if self.action != ObjectChangeActionChoices.ACTION_CREATE and prior_change is not None:
             prechange = prior_change.object_data_v2
             if prechange is None:
@@ -21,7 +21,8 @@ from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.utils.data import is_uuid
 from nautobot.core.utils.deprecation import method_deprecated, method_deprecated_in_favor_of
 from nautobot.core.utils.lookup import get_filterset_for_model, get_form_for_model
-from nautobot.extras.choices import DynamicGroupOperatorChoices, DynamicGroupTypeChoices
+from nautobot.extras.choices import DynamicGroupOperatorChoices, DynamicGroupTypeChoices, ObjectChangeActionChoices
+from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
 from nautobot.extras.querysets import DynamicGroupMembershipQuerySet, DynamicGroupQuerySet
 from nautobot.extras.utils import extras_features, FeatureQuery
 
@@ -313,28 +314,14 @@ class DynamicGroup(PrimaryModel):
 
     def _set_members(self, value):
         """Internal API for updating the static/cached members of this group."""
-        if isinstance(value, models.QuerySet):
-            if value.model != self.model:
-                raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
-            to_remove = self.members.exclude(pk__in=value.values_list("pk", flat=True))
-            self._remove_members(to_remove)
-            to_add = value.exclude(pk__in=self.members.values_list("pk", flat=True))
-            self._add_members(to_add)
-        else:
-            for obj in value:
-                if not isinstance(obj, self.model):
-                    raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
-            to_remove = []
-            for member in self.members:
-                if member not in value:
-                    to_remove.append(member)
-            self._remove_members(to_remove)
-            to_add = []
-            members = self.members
-            for candidate in value:
-                if candidate not in members:
-                    to_add.append(candidate)
-            self._add_members(to_add)
+        target_pks = self._get_member_pks(value)
+        current_pks = set(
+            StaticGroupAssociation.all_objects.filter(
+                dynamic_group=self, associated_object_type=self.content_type
+            ).values_list("associated_object_id", flat=True)
+        )
+        self._delete_static_group_associations(current_pks - target_pks)
+        self._create_static_group_associations(target_pks - current_pks)
 
         return self.members
 
@@ -346,32 +333,13 @@ class DynamicGroup(PrimaryModel):
 
     def _add_members(self, objects_to_add):
         """Internal API for adding the given list or QuerySet of objects to the cached/static members of this group."""
-        if isinstance(objects_to_add, models.QuerySet):
-            if objects_to_add.model != self.model:
-                raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
-        else:
-            for obj in objects_to_add:
-                if not isinstance(obj, self.model):
-                    raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
-
-        if self.group_type == DynamicGroupTypeChoices.TYPE_STATIC:
-            for obj in objects_to_add:
-                # We don't use `.bulk_create()` currently because we want change logging for these creates.
-                # Might be a good future performance improvement though.
-                StaticGroupAssociation.all_objects.get_or_create(
-                    dynamic_group=self, associated_object_type=self.content_type, associated_object_id=obj.pk
-                )
-        else:
-            # Cached/hidden static group associations, so we can use bulk-create to bypass change logging.
-            existing_members = self.members
-            sgas = [
-                StaticGroupAssociation(
-                    dynamic_group=self, associated_object_type=self.content_type, associated_object_id=obj.pk
-                )
-                for obj in objects_to_add
-                if obj not in existing_members
-            ]
-            StaticGroupAssociation.all_objects.bulk_create(sgas)
+        pks_to_add = self._get_member_pks(objects_to_add)
+        existing_pks = set(
+            StaticGroupAssociation.all_objects.filter(
+                dynamic_group=self, associated_object_type=self.content_type, associated_object_id__in=pks_to_add
+            ).values_list("associated_object_id", flat=True)
+        )
+        self._create_static_group_associations(pks_to_add - existing_pks)
 
     def remove_members(self, objects_to_remove):
         """Remove the given list or QuerySet of objects from this staticly defined group."""
@@ -381,24 +349,122 @@ class DynamicGroup(PrimaryModel):
 
     def _remove_members(self, objects_to_remove):
         """Internal API for removing the given list or QuerySet from the cached/static members of this Group."""
-        if isinstance(objects_to_remove, models.QuerySet):
-            if objects_to_remove.model != self.model:
+        self._delete_static_group_associations(self._get_member_pks(objects_to_remove))
+
+    def _get_member_pks(self, objects):
+        """Return the set of primary keys of the given list or QuerySet of objects, which must be of this group's type."""
+        if isinstance(objects, models.QuerySet):
+            if objects.model != self.model:
                 raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
-            StaticGroupAssociation.all_objects.filter(
-                dynamic_group=self,
-                associated_object_type=self.content_type,
-                associated_object_id__in=objects_to_remove.values_list("pk", flat=True),
-            ).delete()
-        else:
-            pks_to_remove = set()
-            for obj in objects_to_remove:
-                if not isinstance(obj, self.model):
-                    raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
-                pks_to_remove.add(obj.pk)
+            return set(objects.order_by().values_list("pk", flat=True))
+
+        pks = set()
+        for obj in objects:
+            if not isinstance(obj, self.model):
+                raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
+            pks.add(obj.pk)
+        return pks
+
+    def _create_static_group_associations(self, pks, batch_size=1000):
+        """Associate the objects with the given primary keys, which must not be members already, with this group."""
+        if not pks:
+            return
+        sgas = [
+            StaticGroupAssociation(
+                dynamic_group=self, associated_object_type=self.content_type, associated_object_id=pk
+            )
+            for pk in pks
+        ]
+        StaticGroupAssociation.all_objects.bulk_create(sgas, batch_size=batch_size)
+        # Cached/hidden static group associations aren't change-logged, but those of static groups are
+        if self.group_type == DynamicGroupTypeChoices.TYPE_STATIC:
+            self._log_static_group_association_changes(sgas, ObjectChangeActionChoices.ACTION_CREATE, batch_size)
+
+    def _delete_static_group_associations(self, pks, batch_size=1000):
+        """Remove the objects with the given primary keys from the members of this group."""
+        if not pks:
+            return
+        sgas = StaticGroupAssociation.all_objects.filter(
+            dynamic_group=self, associated_object_type=self.content_type, associated_object_id__in=pks
+        )
+        if self.group_type != DynamicGroupTypeChoices.TYPE_STATIC:
+            sgas.delete()
+            return
+
+        from nautobot.extras.signals import change_context_state
+
+        change_context = change_context_state.get()
+        if change_context is None or change_context.defer_object_changes:
+            # Nothing to log, or the deletions are recorded by the change logging signal handler to be logged in bulk
+            sgas.delete()
+            return
+
+        from nautobot.extras.signals import is_change_logging_buffered
+
+        sgas = list(sgas)
+        self._log_static_group_association_changes(sgas, ObjectChangeActionChoices.ACTION_DELETE, batch_size)
+        if is_change_logging_buffered(change_context):
+            # The deletions have just been recorded, so the signal handler skips them
+            StaticGroupAssociation.all_objects.filter(pk__in=[sga.pk for sga in sgas]).delete()
+            return
+        # The deletions have just been logged, so have the signal handler only record them in the change context
+        change_context.defer_object_changes = True
+        try:
+            StaticGroupAssociation.all_objects.filter(pk__in=[sga.pk for sga in sgas]).delete()
+        finally:
+            change_context.defer_object_changes = False
 
-            StaticGroupAssociation.all_objects.filter(
-                dynamic_group=self, associated_object_type=self.content_type, associated_object_id__in=pks_to_remove
-            ).delete()
+    def _log_static_group_association_changes(self, sgas, action, batch_size=1000):
+        """
+        Create the ObjectChanges for the given StaticGroupAssociations of this static group in bulk.
+
+        This stands in for the change logging signal handlers, which aren't triggered by bulk operations. If the active
+        change context defers its object changes, the changes are only recorded in it, to be logged when it's flushed,
+        and if change logging is buffered (see `settings.CHANGELOG_WRITE_MODE`), they're recorded to be logged along
+        with the other changes of the transaction instead.
+        """
+        from nautobot.extras.models import ObjectChange
+        from nautobot.extras.signals import change_context_state, get_pending_object_changes, is_change_logging_buffered
+
+        change_context = change_context_state.get()
+        if change_context is None:
+            return
+
+        pending = None
+        if is_change_logging_buffered(change_context):
+            pending = get_pending_object_changes(change_context)
+        content_type = ContentType.objects.get_for_model(StaticGroupAssociation)
+        members = self.model.objects.in_bulk([sga.associated_object_id for sga in sgas])
+        object_changes = []
+        for sga in sgas:
+            sga.dynamic_group = self
+            if sga.associated_object_id in members:
+                sga.associated_object = members[sga.associated_object_id]
+            user = change_context.get_user(sga)
+            if pending is not None:
+                if action == ObjectChangeActionChoices.ACTION_CREATE:
+                    pending.record_change(change_context, sga, action, user)
+                else:
+                    pending.record_deletion(change_context, sga, user)
+                continue
+            if action == ObjectChangeActionChoices.ACTION_CREATE:
+                # Deletions are recorded in the change context by the signal handler, as for any other deleted object
+                unique_object_change_id = f"{content_type.pk}__{sga.pk}"
+                if user is not None:
+                    unique_object_change_id += f"__{user.pk}"
+                change_context.deferred_object_changes[unique_object_change_id] = [
+                    {"action": action, "instance": sga, "user": user}
+                ]
+
+            if not change_context.defer_object_changes:
+                objectchange = sga.to_objectchange(action)
+                objectchange.user = user
+                objectchange.user_name = user.username if user is not None else "Undefined"
+                objectchange.request_id = change_context.change_id
+                objectchange.change_context = change_context.context
+                objectchange.change_context_detail = change_context.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
+                object_changes.append(objectchange)
+        ObjectChange.objects.bulk_create(object_changes, batch_size=batch_size)
 
     @property
     @method_deprecated("Members are now cached in the database via StaticGroupAssociations rather than in Redis.")
@@ -752,6 +752,24 @@ class JobResult(BaseModel, CustomFieldModel):
         level_choice (LogLevelChoices): Message severity level
         grouping (str): Grouping to store the log message under
         """
+        log = self.build_log_entry(message, obj=obj, level_choice=level_choice, grouping=grouping)
+        # If the override is provided, we want to use the default database(pass no using argument)
+        # Otherwise we want to use a separate database here so that the logs are created immediately
+        # instead of within transaction.atomic(). This allows us to be able to report logs when the jobs
+        # are running, and allow us to rollback the database without losing the log entries.
+        if not self.use_job_logs_db or not JOB_LOGS:
+            log.save()
+        else:
+            log.save(using=JOB_LOGS)
+
+    def build_log_entry(
+        self,
+        message,
+        obj=None,
+        level_choice=LogLevelChoices.LOG_INFO,
+        grouping="main",
+    ):
+        """Return the (unsaved) JobLogEntry for the given log message, as would be stored by `log()`."""
         if level_choice not in LogLevelChoices.as_dict():
             raise ValueError(f"Unknown logging level: {level_choice}")
 
@@ -779,14 +797,14 @@ class JobResult(BaseModel, CustomFieldModel):
                 log_object=str(obj)[:JOB_LOG_MAX_LOG_OBJECT_LENGTH] if obj else "",
                 absolute_url="",
             )
-        # If the override is provided, we want to use the default database(pass no using argument)
-        # Otherwise we want to use a separate database here so that the logs are created immediately
-        # instead of within transaction.atomic(). This allows us to be able to report logs when the jobs
-        # are running, and allow us to rollback the database without losing the log entries.
+        return log
+
+    def save_log_entries(self, log_entries):
+        """Store the given JobLogEntries, as built by `build_log_entry()`, in bulk, in the same database as `log()`."""
         if not self.use_job_logs_db or not JOB_LOGS:
-            log.save()
+            JobLogEntry.objects.bulk_create(log_entries)
         else:
-            log.save(using=JOB_LOGS)
+            JobLogEntry.objects.using(JOB_LOGS).bulk_create(log_entries)
 
 
 #
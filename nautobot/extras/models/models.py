@@ -25,7 +25,9 @@ from nautobot.core.constants import CHARFIELD_MAX_LENGTH
 from nautobot.core.models import BaseManager, BaseModel
 from nautobot.core.models.fields import ForeignKeyWithAutoRelatedName, LaxURLField
 from nautobot.core.models.generics import OrganizationalModel, PrimaryModel
-from nautobot.core.utils.data import deepmerge, render_jinja2
+from nautobot.core.models.querysets import ChunkedQuerySetProxy
+from nautobot.core.models.utils import is_taggable
+from nautobot.core.utils.data import deepmerge, render_jinja2, stream_jinja2
 from nautobot.extras.choices import (
     ButtonClassChoices,
     WebhookHttpMethodChoices,
@@ -202,7 +204,32 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
     def get_config_context(self):
         """
         Return the rendered configuration context for a device or VM.
+
+        If the `CONFIG_CONTEXT_MATERIALIZATION_ENABLED` setting is True, the rendered config context is retrieved from
+        its `RenderedConfigContext` if one exists, rather than being computed. Rendered config contexts don't include
+        the ConfigContexts assigned to Dynamic Groups, so they aren't used if `CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED` is
+        True as well.
         """
+        if getattr(self, "rendered_config_context", None) is not None:
+            # Materialized config context annotated by annotate_config_context_data()
+            return self.rendered_config_context
+        if (
+            settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED
+            and not settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED
+            and not hasattr(self, "rendered_config_context")
+            and not hasattr(self, "config_context_data")
+        ):
+            rendered_config_context = (
+                RenderedConfigContext.objects.filter(
+                    assigned_object_type=ContentType.objects.get_for_model(self),
+                    assigned_object_id=self.pk,
+                )
+                .values_list("data", flat=True)
+                .first()
+            )
+            if rendered_config_context is not None:
+                return rendered_config_context
+
         if not hasattr(self, "config_context_data"):
             # Annotation not available, so fall back to manually querying for the config context
             config_context_data = ConfigContext.objects.get_for_object(self).values_list("data", flat=True)
@@ -240,6 +267,83 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
         self._validate_with_schema("local_config_context_data", "local_config_context_schema")
 
 
+class RenderedConfigContext(BaseModel):
+    """
+    The materialized config context of a Device or VirtualMachine, as rendered by `get_config_context()`.
+
+    These are only maintained (by `nautobot.extras.config_contexts`) and used if the
+    `CONFIG_CONTEXT_MATERIALIZATION_ENABLED` setting is True, in which case they are refreshed whenever the assigned
+    object, or a ConfigContext or other object that affects which ConfigContexts apply to it, is changed.
+    """
+
+    assigned_object_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE, related_name="+")
+    assigned_object_id = models.UUIDField()
+    assigned_object = GenericForeignKey(ct_field="assigned_object_type", fk_field="assigned_object_id")
+    data = models.JSONField(encoder=DjangoJSONEncoder)
+
+    is_metadata_associable_model = False
+
+    natural_key_field_names = ["pk"]
+
+    class Meta:
+        unique_together = [["assigned_object_type", "assigned_object_id"]]
+
+    def __str__(self):
+        return f"Rendered config context of {self.assigned_object}"
+
+
+class SearchIndexEntry(BaseModel):
+    """
+    The searchable text of an object of a model included in the global search, such as a Device.
+
+    These are only maintained (by `nautobot.extras.search_index`) and used if the `SEARCH_INDEX_ENABLED` setting is
+    True, in which case the global search and the `q` filter of these models match the search value against them
+    rather than against each of the searched fields of each model.
+    """
+
+    content_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE, related_name="+")
+    object_id = models.UUIDField()
+    # Lowercase values of the searched fields of the object, one per line
+    text = models.TextField()
+
+    is_metadata_associable_model = False
+
+    natural_key_field_names = ["pk"]
+
+    class Meta:
+        unique_together = [["content_type", "object_id"]]
+        verbose_name_plural = "search index entries"
+
+    def __str__(self):
+        return f"Search index entry of {self.object_id}"
+
+
+class TreeClosure(BaseModel):
+    """
+    The relation between a node of a `TreeModel`, such as a Location, and one of its ancestors or itself.
+
+    These form the closure table of each tree, and are only maintained (by `nautobot.extras.tree_closures`) and used if
+    the `TREE_CLOSURE_ENABLED` setting is True, in which case the descendants or ancestors of a node are looked up with
+    a single indexed query rather than by walking the tree.
+    """
+
+    tree_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE, related_name="+")
+    ancestor_id = models.UUIDField()
+    descendant_id = models.UUIDField(db_index=True)
+    # Number of levels between the ancestor and the descendant, 0 being the node itself
+    depth = models.PositiveSmallIntegerField()
+
+    is_metadata_associable_model = False
+
+    natural_key_field_names = ["pk"]
+
+    class Meta:
+        unique_together = [["ancestor_id", "descendant_id"]]
+
+    def __str__(self):
+        return f"{self.ancestor_id} is an ancestor of {self.descendant_id} at depth {self.depth}"
+
+
 @extras_features(
     "custom_validators",
     "graphql",
@@ -437,6 +541,59 @@ class ExportTemplate(
 
         return output
 
+    def get_render_queryset(self, queryset):
+        """
+        Return the given queryset, augmented to efficiently retrieve the related objects commonly used by templates.
+
+        The objects referenced by the foreign keys of each object are retrieved alongside it, and its tags (if any) are
+        prefetched, to avoid performing additional queries for each object rendered.
+        """
+        model = queryset.model
+        # Django doesn't allow .select_related() on a QuerySet that had .values()/.values_list() or union() applied
+        if queryset._fields is not None or queryset.query.combinator:
+            return queryset
+        select_fields = [
+            field.name
+            for field in model._meta.concrete_fields
+            if field.is_relation and (field.many_to_one or field.one_to_one)
+        ]
+        if select_fields:
+            queryset = queryset.select_related(*select_fields)
+        if is_taggable(model):
+            queryset = queryset.prefetch_related("tags")
+        return queryset
+
+    def render_stream(self, queryset, chunk_size=1000, progress_callback=None):
+        """
+        Render the contents of the template, yielding the rendered content a piece at a time.
+
+        Unlike `render()`, the objects in the queryset are retrieved from the database `chunk_size` at a time as the
+        template iterates over them, and the rendered content is never held in memory all at once, so this is suitable
+        for rendering very large querysets.
+
+        Args:
+            queryset (QuerySet): The objects to render
+            chunk_size (int): Maximum number of objects to retrieve from the database at a time
+            progress_callback (callable): Function, if any, to call with the number of objects rendered so far
+                after each chunk of objects
+        """
+        context = {
+            "queryset": ChunkedQuerySetProxy(
+                self.get_render_queryset(queryset), chunk_size=chunk_size, progress_callback=progress_callback
+            )
+        }
+        # Replace CRLF-style line terminators, including any split across two pieces of output
+        pending_cr = ""
+        for output in stream_jinja2(self.template_code, context):
+            output = pending_cr + output
+            pending_cr = "\r" if output.endswith("\r") else ""
+            if pending_cr:
+                output = output[:-1]
+            if output:
+                yield output.replace("\r\n", "\n")
+        if pending_cr:
+            yield pending_cr
+
     def render_to_response(self, queryset):
         """
         Render the template to an HTTP response, delivered as a named file attachment
@@ -681,6 +838,12 @@ class GraphQLQuery(
     name = models.CharField(max_length=CHARFIELD_MAX_LENGTH, unique=True)
     query = models.TextField()
     variables = models.JSONField(encoder=DjangoJSONEncoder, default=dict, blank=True)
+    query_hash = models.CharField(
+        max_length=64,
+        editable=False,
+        db_index=True,
+        help_text="SHA-256 hash of the query, by which it can be executed as a persisted query",
+    )
 
     class Meta:
         ordering = ("name",)
@@ -688,10 +851,12 @@ class GraphQLQuery(
         verbose_name_plural = "GraphQL queries"
 
     def save(self, *args, **kwargs):
+        from nautobot.core.graphql.backends import get_query_hash
+
         variables = {}
         schema = graphene_settings.SCHEMA
         backend = get_default_backend()
-        # Load query into GraphQL backend
+        # Load query into GraphQL backend; this also pre-compiles it into the backend's document cache, if any
         document = backend.document_from_string(schema, self.query)
 
         # Inspect the parsed document tree (document.document_ast) to retrieve the query (operation) definition(s)
@@ -708,6 +873,7 @@ class GraphQLQuery(
                 variables[variable_definition.variable.name.value] = default
 
         self.variables = variables
+        self.query_hash = get_query_hash(self.query)
         return super().save(*args, **kwargs)
 
     def clean(self):
@@ -986,6 +1152,12 @@ class Webhook(
         "Leave blank to use the system defaults.",
         default="",
     )
+    batch_events = models.BooleanField(
+        default=False,
+        verbose_name="Batch events",
+        help_text="Send all of the events resulting from a single request or job in one request, whose body is a "
+        "JSON array of the individual event payloads, rather than one request per event.",
+    )
 
     class Meta:
         ordering = ("name",)
@@ -996,6 +1168,12 @@ class Webhook(
     def clean(self):
         super().clean()
 
+        # Batched events are sent as a JSON array
+        if self.batch_events and self.http_content_type != HTTP_CONTENT_TYPE_JSON:
+            raise ValidationError(
+                {"http_content_type": f"Batched events can only be sent with content type {HTTP_CONTENT_TYPE_JSON}."}
+            )
+
         # At least one action type must be selected
         if not self.type_create and not self.type_delete and not self.type_update:
             raise ValidationError("You must select at least one type: create, update, and/or delete.")
@@ -1,10 +1,11 @@
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import F, Model, OuterRef, Q, Subquery
+from django.db.models import Exists, F, Model, OuterRef, Q, Subquery
 from django.db.models.functions import JSONObject
 
 from nautobot.core.models.query_functions import EmptyGroupByJSONBAgg
 from nautobot.core.models.querysets import RestrictedQuerySet
+from nautobot.extras.choices import DynamicGroupTypeChoices
 from nautobot.extras.models.tags import TaggedItem
 
 
@@ -79,7 +80,7 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
     This allows the annotation to be entirely optional.
     """
 
-    def annotate_config_context_data(self):
+    def annotate_config_context_data(self, materialized=True):
         """
         Attach the subquery annotation to the base queryset.
 
@@ -87,9 +88,28 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
         unlike PostgreSQL's implementation. This is why we include "weight" and "name" into the result so that we can
         sort it within Python to ensure correctness.
 
+        If the `CONFIG_CONTEXT_MATERIALIZATION_ENABLED` setting is True, the `RenderedConfigContext` data of each object
+        is annotated instead (as `rendered_config_context`), unless `materialized` is False or the
+        `CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED` setting is True, as rendered config contexts don't include the
+        ConfigContexts assigned to Dynamic Groups.
+
         Do not use this method by itself, use get_config_context() method directly on ConfigContextModel instead.
         """
-        from nautobot.extras.models import ConfigContext
+        from nautobot.extras.models import ConfigContext, RenderedConfigContext
+
+        if (
+            materialized
+            and settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED
+            and not settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED
+        ):
+            return self.annotate(
+                rendered_config_context=Subquery(
+                    RenderedConfigContext.objects.filter(
+                        assigned_object_type=ContentType.objects.get_for_model(self.model),
+                        assigned_object_id=OuterRef("pk"),
+                    ).values("data")[:1]
+                )
+            )
 
         return self.annotate(
             config_context_data=Subquery(
@@ -199,6 +219,72 @@ class DynamicGroupQuerySet(RestrictedQuerySet):
             static_group_associations__associated_object_id=obj.id,
         )
 
+    def update_cached_memberships(self, model, pks, chunk_size=1000):
+        """
+        Update the cached memberships of the given objects in the filter-defined and set-defined groups in this queryset.
+
+        Rather than re-evaluating each group over all objects of its model, as `DynamicGroup.update_cached_members()`
+        does, only the given objects are evaluated against the query of each group, which is generated only once.
+        The membership of each chunk of objects in all of the groups is determined by a single query, and only the
+        `StaticGroupAssociation` records that differ from the result are added or removed.
+
+        Args:
+            model (Model): The model of the objects
+            pks (iterable): Primary keys of the objects to update the memberships of
+            chunk_size (int): Number of objects to evaluate at a time
+
+        Returns:
+            (tuple): the number of cached memberships added and removed
+        """
+        from nautobot.extras.models import StaticGroupAssociation
+
+        groups = list(
+            self.get_for_model(model).filter(
+                group_type__in=[DynamicGroupTypeChoices.TYPE_DYNAMIC_FILTER, DynamicGroupTypeChoices.TYPE_DYNAMIC_SET]
+            )
+        )
+        pks = list(pks)
+        if not groups or not pks:
+            return 0, 0
+
+        content_type = ContentType.objects.get_for_model(model._meta.concrete_model)
+        annotations = {
+            f"_is_member_{i}": Exists(model.objects.filter(group.generate_query(), pk=OuterRef("pk")))
+            for i, group in enumerate(groups)
+        }
+        added_count = removed_count = 0
+        for i in range(0, len(pks), chunk_size):
+            chunk_pks = pks[i : i + chunk_size]
+            memberships = set()
+            queryset = model.objects.filter(pk__in=chunk_pks).annotate(**annotations)
+            for pk, *is_member in queryset.values_list("pk", *annotations):
+                memberships.update((group.pk, pk) for group, member in zip(groups, is_member) if member)
+            cached_memberships = set(
+                StaticGroupAssociation.all_objects.filter(
+                    dynamic_group__in=groups, associated_object_id__in=chunk_pks
+                ).values_list("dynamic_group_id", "associated_object_id")
+            )
+
+            removed_memberships = cached_memberships - memberships
+            if removed_memberships:
+                query = Q()
+                for group_pk, pk in removed_memberships:
+                    query |= Q(dynamic_group_id=group_pk, associated_object_id=pk)
+                StaticGroupAssociation.all_objects.filter(query).delete()
+            # Cached/hidden static group associations, so we can use bulk-create to bypass change logging.
+            StaticGroupAssociation.all_objects.bulk_create(
+                [
+                    StaticGroupAssociation(
+                        dynamic_group_id=group_pk, associated_object_type=content_type, associated_object_id=pk
+                    )
+                    for group_pk, pk in memberships - cached_memberships
+                ],
+                ignore_conflicts=True,
+            )
+            added_count += len(memberships - cached_memberships)
+            removed_count += len(removed_memberships)
+        return added_count, removed_count
+
     def get_by_natural_key(self, slug):
         return self.get(slug=slug)
 
@@ -0,0 +1,245 @@
+"""
+Maintenance and use of the search index (`SearchIndexEntry`) of the models included in the global search.
+
+The searchable text of each object is built from the values of the fields that the `q` filter of its model's FilterSet
+matches by case-insensitive substring (`icontains`), including those of related objects (such as the name of the
+manufacturer of a Device's device type), so that searching objects of any number of models takes a single query against
+the index. Any other predicates of the `q` filters, such as the exact match of an object's ID, are matched against the
+objects themselves, as usual. Whenever an object is changed, the searchable text of the indexed objects that depend on it
+is refreshed as well.
+"""
+
+from collections import defaultdict
+from functools import lru_cache
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+
+from nautobot.core.filters import SearchFilter
+from nautobot.core.utils.lookup import get_filterset_for_model
+from nautobot.extras.models import SearchIndexEntry
+
+# Separates the values of the searchable text of an object, so that a search never matches across two values
+VALUE_SEPARATOR = "\n"
+
+# Lookup expressions of the `q` filter predicates whose values are stored in the searchable text of objects
+INDEXED_LOOKUP_EXPRS = ("icontains",)
+
+
+@lru_cache(maxsize=None)
+def get_search_filter(model):
+    """Return the `SearchFilter` that is the `q` filter of the FilterSet of the given model, or None."""
+    filterset = get_filterset_for_model(model)
+    search_filter = filterset.base_filters.get("q") if filterset is not None else None
+    return search_filter if isinstance(search_filter, SearchFilter) else None
+
+
+def get_indexed_field_lookups(search_filter):
+    """
+    Return the tuple of the field lookups of the given `SearchFilter`'s predicates that can be matched against the search
+    index, i.e. those matching the unaltered value by case-insensitive substring.
+    """
+    return tuple(
+        field_lookup
+        for field_lookup, lookup_info in search_filter.filter_predicates.items()
+        if isinstance(lookup_info, str)
+        and lookup_info in INDEXED_LOOKUP_EXPRS
+        and lookup_info in search_filter.preserve_whitespace
+    )
+
+
+def get_unindexed_query(search_filter, value):
+    """Return the `Q` object matching the given value against the predicates of the given `SearchFilter` not indexed."""
+    indexed_field_lookups = get_indexed_field_lookups(search_filter)
+    return search_filter.generate_predicates_query(
+        value,
+        {
+            field_lookup: lookup_info
+            for field_lookup, lookup_info in search_filter.filter_predicates.items()
+            if field_lookup not in indexed_field_lookups
+        },
+    )
+
+
+@lru_cache(maxsize=None)
+def get_search_fields(model):
+    """
+    Return the tuple of field lookups (such as "name" or "device_type__manufacturer__name") that the `q` filter of the
+    FilterSet of the given model matches by case-insensitive substring, or None if the model doesn't have such a filter.
+    """
+    search_filter = get_search_filter(model)
+    if search_filter is None:
+        return None
+    return get_indexed_field_lookups(search_filter) or None
+
+
+@lru_cache(maxsize=None)
+def get_indexed_models():
+    """Return the tuple of models included in the global search (see `searchable_models`) that can be indexed."""
+    indexed_models = []
+    for app_config in apps.get_app_configs():
+        for model_name in getattr(app_config, "searchable_models", []):
+            model = apps.get_model(app_config.label, model_name)
+            if get_search_fields(model) is not None:
+                indexed_models.append(model)
+    return tuple(indexed_models)
+
+
+@lru_cache(maxsize=None)
+def get_dependencies():
+    """
+    Return a dict of each model whose objects' changes can affect the searchable text of indexed objects, to the list of
+    `(indexed_model, lookup, is_reverse)` tuples, where `lookup` relates objects of the indexed model to an object of
+    the model, and `is_reverse` is whether it traverses a reverse or many-to-many relation, such that changing the
+    object can also change *which* indexed objects it's related to.
+    """
+    dependencies = defaultdict(list)
+    for indexed_model in get_indexed_models():
+        for field_lookup in get_search_fields(indexed_model):
+            model = indexed_model
+            is_reverse = False
+            names = field_lookup.split("__")
+            for index, name in enumerate(names[:-1]):
+                field = model._meta.get_field(name)
+                model = field.related_model
+                is_reverse = is_reverse or not field.concrete or field.many_to_many
+                dependency = (indexed_model, "__".join(names[: index + 1]), is_reverse)
+                if dependency not in dependencies[model]:
+                    dependencies[model].append(dependency)
+    return dict(dependencies)
+
+
+@lru_cache(maxsize=None)
+def get_many_to_many_through_models():
+    """Return the set of the through models of the many-to-many relations traversed by the indexed field lookups."""
+    through_models = set()
+    for indexed_model in get_indexed_models():
+        for field_lookup in get_search_fields(indexed_model):
+            model = indexed_model
+            for name in field_lookup.split("__")[:-1]:
+                field = model._meta.get_field(name)
+                if field.many_to_many:
+                    through_models.add(field.remote_field.through if field.concrete else field.through)
+                model = field.related_model
+    return through_models
+
+
+def get_dependent_ids(instance):
+    """Return a dict of each indexed model to the set of IDs of its objects whose searchable text depends on `instance`."""
+    dependent_ids = defaultdict(set)
+    for indexed_model, lookup, _ in get_dependencies().get(instance._meta.concrete_model, []):
+        dependent_ids[indexed_model].update(
+            indexed_model.objects.filter(**{lookup: instance.pk}).values_list("pk", flat=True)
+        )
+    return dependent_ids
+
+
+def get_searchable_text(values):
+    """Return the searchable text made up of the given field values of an object."""
+    return VALUE_SEPARATOR.join(dict.fromkeys(str(value).lower() for value in values if value not in (None, "")))
+
+
+def refresh_search_index(model, pks=None, chunk_size=1000):
+    """
+    Compute and store the searchable text of the given objects of the given model.
+
+    Args:
+        model (Model): Indexed model, such as Device
+        pks (iterable): Primary keys of the objects to refresh, or None to refresh all objects of the model; the entries
+            of those that no longer exist are removed
+        chunk_size (int): Number of objects to compute and store at a time
+
+    Returns:
+        (int): the number of objects refreshed
+    """
+    pks = list(model.objects.order_by().values_list("pk", flat=True)) if pks is None else list(pks)
+    content_type = ContentType.objects.get_for_model(model)
+    field_lookups = get_search_fields(model)
+    local_field_lookups = [field_lookup for field_lookup in field_lookups if "__" not in field_lookup]
+    related_field_lookups = [field_lookup for field_lookup in field_lookups if "__" in field_lookup]
+    bulk_create_kwargs = {"update_conflicts": True, "update_fields": ["text"]}
+    if transaction.get_connection().features.supports_update_conflicts_with_target:
+        bulk_create_kwargs["unique_fields"] = ["content_type", "object_id"]
+
+    count = 0
+    for i in range(0, len(pks), chunk_size):
+        chunk = pks[i : i + chunk_size]
+        queryset = model.objects.filter(pk__in=chunk).order_by()
+        values = {pk: list(rest) for pk, *rest in queryset.values_list("pk", *local_field_lookups)}
+        # Query each related field separately, as a single query would return the product of all of their values
+        for field_lookup in related_field_lookups:
+            for pk, value in queryset.values_list("pk", field_lookup):
+                values[pk].append(value)
+        with transaction.atomic():
+            SearchIndexEntry.objects.filter(content_type=content_type, object_id__in=chunk).exclude(
+                object_id__in=values.keys()
+            ).delete()
+            SearchIndexEntry.objects.bulk_create(
+                [
+                    SearchIndexEntry(content_type=content_type, object_id=pk, text=get_searchable_text(object_values))
+                    for pk, object_values in values.items()
+                ],
+                **bulk_create_kwargs,
+            )
+        count += len(values)
+    return count
+
+
+def is_searchable(value):
+    """Return whether the given search value can be matched against the search index."""
+    return VALUE_SEPARATOR not in value
+
+
+def get_matching_entries(value, models=None):
+    """
+    Return the `SearchIndexEntry` queryset of the objects (of the given models) whose searchable text matches the given
+    search value.
+    """
+    queryset = SearchIndexEntry.objects.filter(text__contains=value.lower())
+    if models is not None:
+        queryset = queryset.filter(content_type__in=ContentType.objects.get_for_models(*models).values())
+    return queryset
+
+
+def search(value, querysets, limit):
+    """
+    Search the objects of the given querysets of indexed models at once, returning up to `limit` matching objects of
+    each of them.
+
+    Objects match if their searchable text matches the value, or if they match any other predicate of their model's `q`
+    filter (such as the exact match of their ID). Only the objects of the given querysets are searched, so that those
+    that the user may not view (per `restrict()`) don't take up the `limit`.
+
+    Returns:
+        (dict): the model of each of the given querysets that has matching objects, to the list of the IDs of its first
+            matching objects
+    """
+    querysets_by_model = {queryset.model: queryset for queryset in querysets}
+    content_types = ContentType.objects.get_for_models(*querysets_by_model)
+    models_by_content_type_id = {content_type.pk: model for model, content_type in content_types.items()}
+    text_query = Q(text__contains=value.lower())
+    query = Q()
+    for model, content_type in content_types.items():
+        model_query = text_query
+        unindexed_query = get_unindexed_query(get_search_filter(model), value)
+        if unindexed_query:
+            model_query |= Q(object_id__in=model.objects.filter(unindexed_query).values("pk"))
+        query |= (
+            Q(content_type=content_type)
+            & model_query
+            & Q(object_id__in=querysets_by_model[model].order_by().values("pk"))
+        )
+    entries = (
+        SearchIndexEntry.objects.filter(query)
+        .annotate(rank=Window(RowNumber(), partition_by=F("content_type"), order_by=F("text").asc()))
+        .filter(rank__lte=limit)
+        .order_by("rank")
+        .values_list("content_type_id", "object_id")
+    )
+    results = defaultdict(list)
+    for content_type_id, object_id in entries:
+        results[models_by_content_type_id[content_type_id]].append(object_id)
+    return dict(results)
@@ -1,5 +1,7 @@
+from collections import defaultdict
 import contextlib
 import contextvars
+import json
 import logging
 import os
 import shutil
@@ -12,6 +14,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.storage import get_storage_class
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
 from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save, pre_delete, pre_save
 from django.dispatch import receiver
@@ -19,13 +22,17 @@ from django.utils import timezone
 from django_prometheus.models import model_deletes, model_inserts, model_updates
 import redis.exceptions
 
-from nautobot.core.celery import app, import_jobs
+from nautobot.core.celery import app, import_jobs, NautobotKombuJSONEncoder
 from nautobot.core.models import BaseModel
 from nautobot.core.utils.logging import sanitize
+from nautobot.core.utils.transactions import get_on_commit_callback
+from nautobot.extras import config_contexts, search_index, tree_closures
 from nautobot.extras.choices import JobResultStatusChoices, ObjectChangeActionChoices
 from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
 from nautobot.extras.models import (
     ComputedField,
+    ConfigContext,
+    ConfigContextModel,
     ContactAssociation,
     CustomField,
     DynamicGroup,
@@ -35,9 +42,11 @@ from nautobot.extras.models import (
     MetadataType,
     ObjectChange,
     Relationship,
+    RenderedConfigContext,
+    TaggedItem,
 )
 from nautobot.extras.querysets import NotesQuerySet
-from nautobot.extras.tasks import delete_custom_field_data, provision_field
+from nautobot.extras.tasks import create_object_changes, delete_custom_field_data, provision_field
 from nautobot.extras.utils import refresh_job_model_from_job_class
 
 # thread safe change context state variable
@@ -107,6 +116,184 @@ def invalidate_relationship_models_cache(sender, **kwargs):
             cache.delete_pattern(f"{method.cache_key_prefix}.*")
 
 
+def build_object_change(entry):
+    """
+    Return the (unsaved) ObjectChange for the given recorded change, or None if the changed object isn't change-logged.
+
+    Each recorded change is a dict of the "change_context", "action", changed "instance" and "user", and optionally the
+    already serialized "objectchange" and the "changed_object_id" and "changed_object_type" of a deleted object.
+    """
+    change_context = entry["change_context"]
+    objectchange = entry.get("objectchange") or entry["instance"].to_objectchange(entry["action"])
+    if objectchange is None:
+        return None
+    objectchange.user = entry["user"]
+    objectchange.user_name = entry["user"].username if entry["user"] is not None else "Undefined"
+    objectchange.request_id = change_context.change_id
+    objectchange.change_context = change_context.context
+    objectchange.change_context_detail = change_context.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
+    if not objectchange.changed_object_id:  # changed_object was deleted before it was serialized
+        # Clear out the GenericForeignKey to keep Django from complaining about an unsaved object:
+        objectchange.changed_object = None
+        # Set the component fields individually:
+        objectchange.changed_object_id = entry.get("changed_object_id")
+        objectchange.changed_object_type = entry.get("changed_object_type")
+    # Likewise for objects deleted after they were serialized, keeping the component fields as they were
+    for field_name in ("changed_object", "related_object"):
+        field = ObjectChange._meta.get_field(field_name)
+        cached_object = field.get_cached_value(objectchange, default=None)
+        if cached_object is not None and cached_object.pk is None:
+            field.delete_cached_value(objectchange)
+    return objectchange
+
+
+class PendingObjectChanges:
+    """
+    Changes to objects recorded for change logging once the database transaction (or savepoint) they're made in is
+    committed, with `settings.CHANGELOG_WRITE_MODE` set to "on_commit" or "celery".
+
+    Repeated changes to the same object by the same user are recorded only once, so that the object is serialized only
+    once, as of the end of the transaction. Objects being deleted are serialized immediately instead, as their related
+    objects may be deleted along with them.
+    """
+
+    def __init__(self):
+        self.changes = {}
+
+    def __call__(self):
+        write_object_changes([entry for entries in self.changes.values() for entry in entries])
+        self.changes = {}
+
+    def _get_key(self, change_context, instance, user):
+        return (change_context, ContentType.objects.get_for_model(instance).pk, instance.pk, getattr(user, "pk", None))
+
+    def record_change(self, change_context, instance, action, user):
+        """Record that the given object was created or updated."""
+        entries = self.changes.setdefault(self._get_key(change_context, instance, user), [])
+        if entries and entries[-1]["action"] != ObjectChangeActionChoices.ACTION_DELETE:
+            # Serialize the object as of its latest change, as either its creation or an update
+            entries[-1]["instance"] = instance
+            return
+        if entries:
+            # The object was deleted then recreated with the same pk (don't do this), so change the action to update
+            action = ObjectChangeActionChoices.ACTION_UPDATE
+            entries.pop()
+        entries.append({"change_context": change_context, "action": action, "instance": instance, "user": user})
+
+    def record_deletion(self, change_context, instance, user):
+        """Record that the given object is about to be deleted, serializing it as it is now."""
+        entries = self.changes.setdefault(self._get_key(change_context, instance, user), [])
+        action = ObjectChangeActionChoices.ACTION_DELETE
+        if entries and entries[-1]["action"] == ObjectChangeActionChoices.ACTION_DELETE:
+            return
+        if entries and entries[-1]["action"] == ObjectChangeActionChoices.ACTION_UPDATE:
+            # Log the deletion in place of the update
+            entries.pop()
+        elif entries:
+            # Serialize the creation of the object before it's gone
+            entries[-1]["objectchange"] = entries[-1]["instance"].to_objectchange(entries[-1]["action"])
+
+        entries.append(
+            {
+                "change_context": change_context,
+                "action": action,
+                "instance": instance,
+                "user": user,
+                "objectchange": instance.to_objectchange(action),
+                "changed_object_id": instance.pk,
+                "changed_object_type": ContentType.objects.get_for_model(instance),
+            }
+        )
+
+
+def is_change_logging_buffered(change_context):
+    """Return whether the changes recorded in the given ChangeContext are to be buffered by `PendingObjectChanges`."""
+    return settings.CHANGELOG_WRITE_MODE != "immediate" and not change_context.defer_object_changes
+
+
+def get_pending_object_changes(change_context):
+    """
+    Get the `PendingObjectChanges` to record changes made in the given ChangeContext to, creating it if necessary.
+
+    Changes made within a database transaction are change-logged when it is committed, and those made within each of
+    its savepoints separately, so that the changes of a savepoint that's rolled back are discarded along with it.
+    Changes made outside of a transaction are change-logged at the end of the ChangeContext instead.
+    """
+    if not transaction.get_connection().in_atomic_block:
+        if change_context.pending_object_changes is None:
+            change_context.pending_object_changes = PendingObjectChanges()
+        return change_context.pending_object_changes
+    return get_on_commit_callback("pending_object_changes", PendingObjectChanges, per_savepoint=True)
+
+
+def write_object_changes(entries, batch_size=1000):
+    """
+    Create the ObjectChanges for the given recorded changes (as recorded by `PendingObjectChanges`) in bulk.
+
+    With `settings.CHANGELOG_WRITE_MODE` set to "celery", the changed objects are still serialized here, but their
+    ObjectChanges are created by the `create_object_changes` task instead.
+
+    If `web_request_context()` already enqueued the webhooks and job hooks for the ChangeContext of these changes, they
+    are enqueued here for these as well; otherwise, it will do so once it exits.
+    """
+    from nautobot.extras.jobs import enqueue_job_hooks_for_object_changes  # prevent circular import
+    from nautobot.extras.webhooks import enqueue_webhooks_for_object_changes  # prevent circular import
+
+    object_changes = defaultdict(list)
+    for entry in entries:
+        objectchange = build_object_change(entry)
+        if objectchange is not None:
+            object_changes[entry["change_context"]].append(objectchange)
+
+    if settings.CHANGELOG_WRITE_MODE == "celery":
+        for change_context, changes in object_changes.items():
+            changes = [get_object_change_fields(objectchange) for objectchange in changes]
+            if change_context.enqueues_hooks and not change_context.hooks_enqueued:
+                # Leave these to web_request_context(), to enqueue their hooks once it has enqueued those of the others
+                change_context.unwritten_object_changes.extend(changes)
+            else:
+                enqueue_object_changes_creation(change_context, changes)
+        return
+
+    ObjectChange.objects.bulk_create(
+        [objectchange for changes in object_changes.values() for objectchange in changes], batch_size=batch_size
+    )
+
+    for change_context, changes in object_changes.items():
+        if change_context.hooks_enqueued:
+            enqueue_job_hooks_for_object_changes(changes)
+            enqueue_webhooks_for_object_changes(changes)
+
+
+def get_object_change_fields(objectchange):
+    """
+    Return the field values of the given (unsaved) ObjectChange as a JSON-serializable dict, for `create_object_changes`.
+
+    The object data is encoded the same way as when the ObjectChange is saved, so it's stored exactly as it would be.
+    """
+    return {
+        "user": str(objectchange.user_id) if objectchange.user_id is not None else None,
+        "user_name": objectchange.user_name,
+        "request_id": str(objectchange.request_id),
+        "action": objectchange.action,
+        "changed_object_type": objectchange.changed_object_type_id,
+        "changed_object_id": str(objectchange.changed_object_id) if objectchange.changed_object_id else None,
+        "change_context": objectchange.change_context,
+        "change_context_detail": objectchange.change_context_detail,
+        "related_object_type": objectchange.related_object_type_id,
+        "related_object_id": str(objectchange.related_object_id) if objectchange.related_object_id else None,
+        "object_repr": objectchange.object_repr,
+        "object_data": json.loads(json.dumps(objectchange.object_data, cls=DjangoJSONEncoder)),
+        "object_data_v2": json.loads(json.dumps(objectchange.object_data_v2, cls=NautobotKombuJSONEncoder)),
+    }
+
+
+def enqueue_object_changes_creation(change_context, changes):
+    """Enqueue the `create_object_changes` task for the given serialized changes made in the given ChangeContext."""
+    if changes:
+        create_object_changes.delay(changes, enqueue_hooks=change_context.enqueues_hooks)
+
+
 @receiver(post_save)
 @receiver(m2m_changed)
 def _handle_changed_object(sender, instance, raw=False, **kwargs):
@@ -134,7 +321,12 @@ def _handle_changed_object(sender, instance, raw=False, **kwargs):
         return
 
     # Record an ObjectChange if applicable
-    if hasattr(instance, "to_objectchange"):
+    if hasattr(instance, "to_objectchange") and is_change_logging_buffered(change_context):
+        get_pending_object_changes(change_context).record_change(
+            change_context, instance, action, change_context.get_user(instance)
+        )
+
+    elif hasattr(instance, "to_objectchange"):
         user = change_context.get_user(instance)
         # save a copy of this instance's field cache so it can be restored after serialization
         # to prevent unexpected behavior when chaining multiple signal handlers
@@ -218,7 +410,15 @@ def _handle_deleted_object(sender, instance, **kwargs):
         notes.delete()
 
     # Record an ObjectChange if applicable
-    if hasattr(instance, "to_objectchange"):
+    if hasattr(instance, "to_objectchange") and is_change_logging_buffered(change_context):
+        # save a copy of this instance's field cache so it can be restored after serialization
+        original_cache = instance._state.fields_cache.copy()
+        get_pending_object_changes(change_context).record_deletion(
+            change_context, instance, change_context.get_user(instance)
+        )
+        instance._state.fields_cache = original_cache
+
+    elif hasattr(instance, "to_objectchange"):
         user = change_context.get_user(instance)
 
         # save a copy of this instance's field cache so it can be restored after serialization
@@ -289,6 +489,222 @@ def _handle_deleted_object(sender, instance, **kwargs):
     model_deletes.labels(instance._meta.model_name).inc()
 
 
+#
+# Config contexts
+#
+
+
+def config_context_model_saved(sender, instance, raw=False, **kwargs):
+    """Refresh the rendered config context of a Device or VirtualMachine once it's saved."""
+    if raw or not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+        return
+    config_contexts.record_object_change(sender, [instance.pk])
+    config_contexts.schedule_pending_refresh()
+
+
+def config_context_model_deleted(sender, instance, **kwargs):
+    """Delete the rendered config context of a deleted Device or VirtualMachine."""
+    if not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+        return
+    RenderedConfigContext.objects.filter(
+        assigned_object_type=ContentType.objects.get_for_model(sender), assigned_object_id=instance.pk
+    ).delete()
+
+
+def config_context_model_tags_changed(sender, instance, action, **kwargs):
+    """Refresh the rendered config context of a Device or VirtualMachine once its tags are changed."""
+    if not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED or not isinstance(instance, ConfigContextModel):
+        return
+    if action.startswith("post_"):
+        config_contexts.record_object_change(instance._meta.concrete_model, [instance.pk])
+        config_contexts.schedule_pending_refresh()
+
+
+def config_context_pre_change(sender, instance, raw=False, **kwargs):
+    """Record the objects that a ConfigContext applies to before it's changed or deleted."""
+    if raw or not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED or instance._state.adding:
+        return
+    config_contexts.record_config_context_change([instance.pk])
+
+
+def config_context_post_change(sender, instance, raw=False, created=False, **kwargs):
+    """Refresh the rendered config contexts of the objects that a ConfigContext applies to, once it's changed."""
+    if raw or not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+        return
+    if created:
+        config_contexts.record_config_context_change([instance.pk], created=True)
+    config_contexts.schedule_pending_refresh()
+
+
+def config_context_qualifiers_changed(sender, instance, action, **kwargs):
+    """Refresh the rendered config contexts of the objects that a ConfigContext applies to, once its qualifiers change."""
+    if not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+        return
+    if action.startswith("pre_"):
+        config_contexts.record_config_context_change([instance.pk])
+    else:
+        config_contexts.schedule_pending_refresh()
+
+
+def config_context_qualifier_pre_save(sender, instance, raw=False, **kwargs):
+    """
+    Record the objects related to a potential ConfigContext qualifier, such as a Location, before it's changed in a way
+    that affects which ConfigContexts apply to them, such as assigning the Location to a different parent.
+    """
+    if raw or not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED or instance._state.adding:
+        return
+    field_name = config_contexts.get_qualifier_models()[sender]
+    attnames = [
+        sender._meta.get_field(name).attname for name in config_contexts.QUALIFIER_DEPENDENCY_FIELDS[field_name]
+    ]
+    old_values = sender.objects.filter(pk=instance.pk).values_list(*attnames).first()
+    if old_values is not None and tuple(old_values) != tuple(getattr(instance, attname) for attname in attnames):
+        config_contexts.record_qualifier_change(field_name, instance)
+
+
+def config_context_qualifier_pre_delete(sender, instance, **kwargs):
+    """
+    Record the ConfigContexts qualified by an object, and the objects related to it, before it's deleted.
+
+    Deleting a qualifier removes it from the ConfigContexts that it qualifies, without sending `m2m_changed` signals.
+    """
+    if not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+        return
+    field_name = config_contexts.get_qualifier_models()[sender]
+    config_contexts.record_config_context_change(
+        ConfigContext.objects.filter(**{field_name: instance}).values_list("pk", flat=True)
+    )
+    config_contexts.record_qualifier_change(field_name, instance)
+
+
+def config_context_qualifier_post_change(sender, instance, raw=False, **kwargs):
+    """Refresh the rendered config contexts affected by a change to a potential ConfigContext qualifier."""
+    if raw or not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+        return
+    config_contexts.schedule_pending_refresh()
+
+
+for _model in config_contexts.get_config_context_models():
+    post_save.connect(config_context_model_saved, sender=_model)
+    post_delete.connect(config_context_model_deleted, sender=_model)
+m2m_changed.connect(config_context_model_tags_changed, sender=TaggedItem)
+pre_save.connect(config_context_pre_change, sender=ConfigContext)
+pre_delete.connect(config_context_pre_change, sender=ConfigContext)
+post_save.connect(config_context_post_change, sender=ConfigContext)
+post_delete.connect(config_context_post_change, sender=ConfigContext)
+for _model, _field_name in config_contexts.get_qualifier_models().items():
+    m2m_changed.connect(config_context_qualifiers_changed, sender=getattr(ConfigContext, _field_name).through)
+    if _field_name in config_contexts.QUALIFIER_DEPENDENCY_FIELDS:
+        pre_save.connect(config_context_qualifier_pre_save, sender=_model)
+        post_save.connect(config_context_qualifier_post_change, sender=_model)
+    pre_delete.connect(config_context_qualifier_pre_delete, sender=_model)
+    post_delete.connect(config_context_qualifier_post_change, sender=_model)
+
+
+#
+# Tree closures
+#
+
+
+def tree_node_saved(sender, instance, raw=False, **kwargs):
+    """Update the closure table of the tree of a TreeModel instance once it's created or moved."""
+    if raw or not settings.TREE_CLOSURE_ENABLED:
+        return
+    tree_closures.update_tree_closure(instance)
+
+
+def tree_node_deleted(sender, instance, **kwargs):
+    """Remove a deleted TreeModel instance from the closure table of its tree."""
+    if not settings.TREE_CLOSURE_ENABLED:
+        return
+    tree_closures.delete_tree_closure(instance)
+
+
+for _model in tree_closures.get_tree_models():
+    post_save.connect(tree_node_saved, sender=_model)
+    post_delete.connect(tree_node_deleted, sender=_model)
+
+
+#
+# Search index
+#
+
+
+def _refresh_search_index_entries(dependent_ids):
+    for model, pks in dependent_ids.items():
+        if pks:
+            search_index.refresh_search_index(model, pks)
+
+
+def search_index_pre_change(sender, instance, raw=False, **kwargs):
+    """
+    Record the indexed objects whose searchable text depends on an object through a reverse or many-to-many relation,
+    before it's changed or deleted, as it may no longer be related to them afterwards.
+    """
+    if raw or not settings.SEARCH_INDEX_ENABLED or instance._state.adding:
+        return
+    dependencies = search_index.get_dependencies().get(instance._meta.concrete_model, [])
+    if any(is_reverse for _, _, is_reverse in dependencies):
+        instance._search_index_dependent_ids = search_index.get_dependent_ids(instance)
+
+
+def search_index_post_save(sender, instance, raw=False, **kwargs):
+    """Refresh the searchable text of a saved object, and of the indexed objects whose searchable text depends on it."""
+    if raw or not settings.SEARCH_INDEX_ENABLED:
+        return
+    model = instance._meta.concrete_model
+    if model not in search_index.get_indexed_models() and model not in search_index.get_dependencies():
+        return
+    dependent_ids = search_index.get_dependent_ids(instance)
+    for dependent_model, pks in getattr(instance, "_search_index_dependent_ids", {}).items():
+        dependent_ids[dependent_model].update(pks)
+    instance._search_index_dependent_ids = {}
+    if model in search_index.get_indexed_models():
+        dependent_ids[model].add(instance.pk)
+    _refresh_search_index_entries(dependent_ids)
+
+
+def search_index_post_delete(sender, instance, **kwargs):
+    """Remove a deleted object from the search index, and refresh the searchable text of the objects related to it."""
+    if not settings.SEARCH_INDEX_ENABLED:
+        return
+    model = instance._meta.concrete_model
+    dependent_ids = defaultdict(set, getattr(instance, "_search_index_dependent_ids", {}))
+    if model in search_index.get_indexed_models():
+        # Refreshing a deleted object removes its entry
+        dependent_ids[model].add(instance.pk)
+    _refresh_search_index_entries(dependent_ids)
+
+
+def search_index_m2m_changed(sender, instance, action, model, pk_set, **kwargs):
+    """Refresh the searchable text of the indexed objects affected by a change to a many-to-many relation."""
+    if not settings.SEARCH_INDEX_ENABLED or sender not in search_index.get_many_to_many_through_models():
+        return
+    if action == "pre_clear":
+        instance._search_index_dependent_ids = search_index.get_dependent_ids(instance)
+        return
+    if not action.startswith("post_"):
+        return
+    dependent_ids = search_index.get_dependent_ids(instance)
+    for dependent_model, pks in getattr(instance, "_search_index_dependent_ids", {}).items():
+        dependent_ids[dependent_model].update(pks)
+    instance._search_index_dependent_ids = {}
+    indexed_models = search_index.get_indexed_models()
+    if instance._meta.concrete_model in indexed_models:
+        dependent_ids[instance._meta.concrete_model].add(instance.pk)
+    if model._meta.concrete_model in indexed_models and pk_set:
+        dependent_ids[model._meta.concrete_model].update(pk_set)
+    _refresh_search_index_entries(dependent_ids)
+
+
+# The indexed models and their dependencies are only known once all of the apps' FilterSets can be imported
+pre_save.connect(search_index_pre_change)
+pre_delete.connect(search_index_pre_change)
+post_save.connect(search_index_post_save)
+post_delete.connect(search_index_post_delete)
+m2m_changed.connect(search_index_m2m_changed)
+
+
 #
 # Content types
 #
@@ -439,6 +855,58 @@ post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroup)
 post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroupMembership)
 
 
+class PendingDynamicGroupMembershipUpdate:
+    """Objects whose cached Dynamic Group memberships are to be updated once the current transaction is committed."""
+
+    def __init__(self):
+        self.object_ids = defaultdict(set)
+
+    def __call__(self):
+        for model, pks in self.object_ids.items():
+            added_count, removed_count = DynamicGroup.objects.update_cached_memberships(model, pks)
+            logger.debug(
+                "Updated cached dynamic group memberships of %d %s: %d added, %d removed",
+                len(pks),
+                model._meta.verbose_name_plural,
+                added_count,
+                removed_count,
+            )
+
+
+def dynamic_group_record_member_change(instance):
+    """Update the cached Dynamic Group memberships of the given object once the current transaction is committed."""
+    if not transaction.get_connection().in_atomic_block:
+        pending = PendingDynamicGroupMembershipUpdate()
+        pending.object_ids[instance._meta.concrete_model].add(instance.pk)
+        pending()
+        return
+    pending = get_on_commit_callback("dynamic_group_membership_update", PendingDynamicGroupMembershipUpdate)
+    pending.object_ids[instance._meta.concrete_model].add(instance.pk)
+
+
+@receiver(post_save)
+def dynamic_group_member_saved(sender, instance, raw=False, **kwargs):
+    """
+    When an object that can be a member of Dynamic Groups is saved, incrementally update its cached memberships.
+
+    Only done if `DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_ENABLED` is True. Cached memberships of deleted objects are
+    removed along with them, as `StaticGroupAssociation`s are deleted by cascade.
+    """
+    if raw or not settings.DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_ENABLED:
+        return
+    if getattr(sender, "is_dynamic_group_associable_model", False):
+        dynamic_group_record_member_change(instance)
+
+
+@receiver(m2m_changed)
+def dynamic_group_member_m2m_changed(sender, instance, action, reverse, **kwargs):
+    """When the many-to-many relations (such as tags) of an object are changed, update its cached memberships."""
+    if not settings.DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_ENABLED or reverse or not action.startswith("post_"):
+        return
+    if getattr(instance, "is_dynamic_group_associable_model", False):
+        dynamic_group_record_member_change(instance)
+
+
 #
 # Jobs
 #
@@ -1301,6 +1301,7 @@ class WebhookTable(BaseTable):
     type_update = BooleanColumn()
     type_delete = BooleanColumn()
     ssl_verification = BooleanColumn()
+    batch_events = BooleanColumn()
 
     class Meta(BaseTable.Meta):
         model = Webhook
@@ -1317,6 +1318,7 @@ class WebhookTable(BaseTable):
             "type_delete",
             "ssl_verification",
             "ca_file_path",
+            "batch_events",
         )
         default_columns = (
             "pk",
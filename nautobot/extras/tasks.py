@@ -1,4 +1,7 @@
+from http.cookiejar import DefaultCookiePolicy
+import json
 from logging import getLogger
+from urllib.parse import urlsplit
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -153,16 +156,76 @@ def provision_field(field_id, content_type_pk_set, change_context=None):
     return True
 
 
+# Pooled HTTP sessions used to send webhook requests, keyed by endpoint and TLS verification settings.
+# Each worker process maintains its own sessions, so that successive requests to the same endpoint can reuse
+# an already-established (TCP and TLS) connection rather than performing a new handshake for every event.
+_webhook_sessions = {}
+
+
 @nautobot_task
-def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
+def create_object_changes(changes, enqueue_hooks=False, batch_size=1000):
     """
-    Make a POST request to the defined Webhook
+    Create the given ObjectChanges in bulk.
+
+    This is used with `settings.CHANGELOG_WRITE_MODE` set to "celery", once the transaction that the objects were
+    changed in was committed. The objects were already serialized as of then, so only saving their ObjectChanges is
+    left to this task.
+
+    Args:
+        changes (list): List of dicts of the field values of each ObjectChange, as returned by `get_object_change_fields()`
+        enqueue_hooks (bool): Whether to enqueue the webhooks and job hooks of the ObjectChanges
+        batch_size (int): Number of ObjectChanges to create in each query
     """
-    from nautobot.extras.models import Webhook  # avoiding circular import
+    from django.contrib.auth import get_user_model
 
-    webhook = Webhook.objects.get(pk=webhook_pk)
+    from nautobot.extras.jobs import enqueue_job_hooks_for_object_changes
+    from nautobot.extras.models import ObjectChange
+    from nautobot.extras.webhooks import enqueue_webhooks_for_object_changes
+
+    user_pks = {change["user"] for change in changes if change["user"] is not None}
+    users = {str(pk): user for pk, user in get_user_model().objects.in_bulk(user_pks).items()}
+
+    object_changes = []
+    for change in changes:
+        fields = dict(change)
+        # The user may have been deleted since, in which case only their username is kept
+        fields["user"] = users.get(change["user"])
+        fields["changed_object_type"] = ContentType.objects.get_for_id(change["changed_object_type"])
+        if change["related_object_type"] is not None:
+            fields["related_object_type"] = ContentType.objects.get_for_id(change["related_object_type"])
+        object_changes.append(ObjectChange(**fields))
+    ObjectChange.objects.bulk_create(object_changes, batch_size=batch_size)
+
+    if enqueue_hooks:
+        enqueue_job_hooks_for_object_changes(object_changes)
+        enqueue_webhooks_for_object_changes(object_changes)
+    return len(object_changes)
+
+
+def get_webhook_session(webhook):
+    """
+    Get the pooled `requests.Session` to use for sending requests for the given Webhook.
 
-    context = {
+    As a session may be shared by several webhooks of the same endpoint, it rejects any cookies set by their responses,
+    so that none of them is sent along with the requests of the others.
+    """
+    verify = webhook.ssl_verification
+    if webhook.ca_file_path:
+        verify = webhook.ca_file_path
+    url = urlsplit(webhook.payload_url)
+    key = (url.scheme, url.netloc, verify)
+
+    session = _webhook_sessions.get(key)
+    if session is None:
+        session = requests.Session()
+        session.verify = verify
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _webhook_sessions[key] = session
+    return session
+
+
+def _get_webhook_context(event, timestamp, model_name, username, request_id, data, snapshots):
+    return {
         "event": dict(ObjectChangeActionChoices)[event].lower(),
         "timestamp": timestamp,
         "model": model_name,
@@ -172,6 +235,11 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "snapshots": snapshots,
     }
 
+
+def _send_webhook_request(webhook, context, body, description):
+    """
+    Send the request for a Webhook with the given body, using headers rendered from the given context.
+    """
     # Build the headers for the HTTP request
     headers = {
         "Content-Type": webhook.http_content_type,
@@ -182,13 +250,6 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         logger.error("Error parsing HTTP headers for webhook %s: %s", webhook, e)
         raise
 
-    # Render the request body
-    try:
-        body = webhook.render_body(context)
-    except TemplateError as e:
-        logger.error("Error rendering request body for webhook %s: %s", webhook, e)
-        raise
-
     # Prepare the HTTP request
     params = {
         "method": webhook.http_method,
@@ -196,7 +257,7 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "headers": headers,
         "data": body.encode("utf8"),
     }
-    logger.info("Sending %s request to %s (%s %s)", params["method"], params["url"], context["model"], context["event"])
+    logger.info("Sending %s request to %s (%s)", params["method"], params["url"], description)
     logger.debug("%s", params)
     try:
         prepared_request = requests.Request(**params).prepare()
@@ -209,11 +270,7 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         prepared_request.headers["X-Hook-Signature"] = generate_signature(prepared_request.body, webhook.secret)
 
     # Send the request
-    with requests.Session() as session:
-        session.verify = webhook.ssl_verification
-        if webhook.ca_file_path:
-            session.verify = webhook.ca_file_path
-        response = session.send(prepared_request, proxies=settings.HTTP_PROXIES)
+    response = get_webhook_session(webhook).send(prepared_request, proxies=settings.HTTP_PROXIES)
 
     if response.ok:
         logger.info("Request succeeded; response status %s", response.status_code)
@@ -223,3 +280,57 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         raise requests.exceptions.RequestException(
             f"Status {response.status_code} returned with content '{response.content}', webhook FAILED to process."
         )
+
+
+@nautobot_task
+def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
+    """
+    Make a POST request to the defined Webhook
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+
+    context = _get_webhook_context(event, timestamp, model_name, username, request_id, data, snapshots)
+
+    # Render the request body
+    try:
+        body = webhook.render_body(context)
+    except TemplateError as e:
+        logger.error("Error rendering request body for webhook %s: %s", webhook, e)
+        raise
+
+    return _send_webhook_request(webhook, context, body, f"{context['model']} {context['event']}")
+
+
+@nautobot_task
+def process_webhook_batch(webhook_pk, events):
+    """
+    Make a single request to the defined Webhook for multiple events, with a JSON array of the event payloads as body.
+
+    Args:
+        webhook_pk (uuid4): The PK of the Webhook
+        events (list): List of `[data, model_name, event, timestamp, username, request_id, snapshots]` lists, as in
+            the arguments to `process_webhook()`
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+
+    contexts = []
+    payloads = []
+    for data, model_name, event, timestamp, username, request_id, snapshots in events:
+        context = _get_webhook_context(event, timestamp, model_name, username, request_id, data, snapshots)
+        try:
+            payloads.append(json.loads(webhook.render_body(context)))
+        except TemplateError as e:
+            logger.error("Error rendering request body for webhook %s: %s", webhook, e)
+            raise
+        except ValueError as e:
+            logger.error("Request body for webhook %s is not valid JSON and cannot be batched: %s", webhook, e)
+            raise
+        contexts.append(context)
+
+    # Additional headers are rendered with the context of the first event of the batch
+    body = json.dumps(payloads, ensure_ascii=False)
+    return _send_webhook_request(webhook, contexts[0], body, f"batch of {len(payloads)} events")
@@ -0,0 +1,22 @@
+from nautobot.core.celery import register_jobs
+from nautobot.extras.jobs import get_task_logger, Job
+from nautobot.extras.models import JobLogEntry
+
+logger = get_task_logger(__name__)
+
+
+class TestLogBuffering(Job):
+    class Meta:
+        description = "Test logs being buffered before being saved to the database"
+
+    def run(self):
+        for i in range(4):
+            logger.info("Log entry %d", i)
+        count = JobLogEntry.objects.filter(job_result=self.job_result).count()
+        logger.warning("Warning entry")
+        # Report how many log entries (including the "Running job" entry) have been saved so far, before and after the
+        # warning was logged
+        return count, JobLogEntry.objects.filter(job_result=self.job_result).count()
+
+
+register_jobs(TestLogBuffering)
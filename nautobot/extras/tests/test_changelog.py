@@ -1,4 +1,7 @@
+from unittest import mock
+
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.test import override_settings
 from django.urls import reverse
 from django.utils.html import escape
@@ -19,6 +22,7 @@ from nautobot.extras.choices import (
     ObjectChangeEventContextChoices,
 )
 from nautobot.extras.models import CustomField, CustomFieldChoice, DynamicGroup, ObjectChange, Status, Tag
+from nautobot.extras.tasks import create_object_changes
 from nautobot.ipam.models import VLAN, VLANGroup
 from nautobot.virtualization.models import Cluster, ClusterType, VirtualMachine, VMInterface
 
@@ -593,3 +597,143 @@ class ObjectChangeModelTest(TestCase):  # TODO: change to BaseModelTestCase once
             self.assertIsNone(snapshots["postchange"])
             self.assertEqual(snapshots["differences"]["removed"], oc_with_object_data_v2.object_data_v2)
             self.assertIsNone(snapshots["differences"]["added"])
+
+    def test_get_snapshots_for(self):
+        location_type = LocationType.objects.get(name="Campus")
+        locations = []
+        for i in range(3):
+            with context_managers.web_request_context(self.user):
+                location = Location.objects.create(
+                    name=f"testobjectchangelocation{i}", status=self.location_status, location_type=location_type
+                )
+                locations.append(location)
+            for j in range(2):
+                with context_managers.web_request_context(self.user):
+                    location.description = f"changed description{j}"
+                    location.validated_save()
+        location_pks = [location.pk for location in locations]
+        with context_managers.web_request_context(self.user):
+            locations[0].delete()
+
+        object_changes = list(ObjectChange.objects.filter(changed_object_id__in=location_pks))
+        self.assertEqual(len(object_changes), 10)
+        with self.assertNumQueries(1):
+            snapshots = ObjectChange.get_snapshots_for(object_changes)
+        # Snapshots are cached on the instances
+        with self.assertNumQueries(0):
+            for object_change in object_changes:
+                self.assertIs(object_change.get_snapshots(), snapshots[object_change.pk])
+
+        for object_change in ObjectChange.objects.filter(changed_object_id__in=location_pks):
+            self.assertEqual(snapshots[object_change.pk], object_change.get_snapshots())
+
+
+class ChangeLogWriteModeTest(TestCase):
+    """Tests for the buffered change logging of the "on_commit" and "celery" `CHANGELOG_WRITE_MODE` settings."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.location_status = Status.objects.get_for_model(Location).first()
+        cls.location_type = LocationType.objects.get(name="Campus")
+
+    @override_settings(CHANGELOG_WRITE_MODE="on_commit")
+    def test_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with context_managers.web_request_context(self.user):
+                location = Location.objects.create(
+                    name="Buffered Location", status=self.location_status, location_type=self.location_type
+                )
+                location.description = "first description"
+                location.save()
+                location.description = "final description"
+                location.save()
+                # Nothing is logged until the transaction is committed
+                self.assertFalse(get_changes_for_model(location).exists())
+
+        # The object is serialized only once, as of the end of the transaction
+        oc = get_changes_for_model(location).get()
+        self.assertEqual(oc.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(oc.object_data["description"], "final description")
+        self.assertEqual(oc.user_id, self.user.pk)
+        self.assertEqual(oc.change_context, ObjectChangeEventContextChoices.CONTEXT_ORM)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with context_managers.web_request_context(self.user):
+                location.description = "deleted description"
+                location.save()
+                location_pk = location.pk
+                location.delete()
+
+        # The deletion takes the place of the update, and the object is serialized before it's deleted
+        object_changes = ObjectChange.objects.filter(changed_object_id=location_pk)
+        self.assertEqual(object_changes.count(), 2)
+        oc = object_changes.get(action=ObjectChangeActionChoices.ACTION_DELETE)
+        self.assertEqual(oc.object_data["description"], "deleted description")
+        self.assertEqual(oc.object_repr, "Buffered Location")
+
+    @override_settings(CHANGELOG_WRITE_MODE="on_commit")
+    def test_on_commit_rollback(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with context_managers.web_request_context(self.user):
+                location = Location.objects.create(
+                    name="Committed Location", status=self.location_status, location_type=self.location_type
+                )
+                try:
+                    with transaction.atomic():
+                        rolled_back_location = Location.objects.create(
+                            name="Rolled Back Location", status=self.location_status, location_type=self.location_type
+                        )
+                        location.description = "rolled back description"
+                        location.save()
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+
+        # The changes of the rolled back savepoint are discarded
+        oc = get_changes_for_model(location).get()
+        self.assertEqual(oc.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(oc.object_data["description"], "")
+        self.assertFalse(ObjectChange.objects.filter(changed_object_id=rolled_back_location.pk).exists())
+
+    @override_settings(CHANGELOG_WRITE_MODE="celery")
+    def test_celery(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with context_managers.web_request_context(self.user, context_detail="test_celery"):
+                location = Location.objects.create(
+                    name="Celery Location", status=self.location_status, location_type=self.location_type
+                )
+                location.description = "final description"
+                location.save()
+
+        oc = get_changes_for_model(location).get()
+        self.assertEqual(oc.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(oc.object_data["description"], "final description")
+        self.assertEqual(oc.user_id, self.user.pk)
+        self.assertEqual(oc.change_context_detail, "test_celery")
+
+    @override_settings(CHANGELOG_WRITE_MODE="celery")
+    def test_celery_serializes_on_commit(self):
+        """Objects are serialized when the transaction is committed, not when the Celery worker saves their changes."""
+        with mock.patch("nautobot.extras.signals.create_object_changes.delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                with context_managers.web_request_context(self.user, context_detail="test_celery"):
+                    location = Location.objects.create(
+                        name="Celery Location", status=self.location_status, location_type=self.location_type
+                    )
+            location_pk = location.pk
+            with self.captureOnCommitCallbacks(execute=True):
+                with context_managers.web_request_context(self.user, context_detail="test_celery"):
+                    location.delete()
+        self.assertEqual(delay.call_count, 2)
+        self.assertFalse(ObjectChange.objects.filter(changed_object_id=location_pk).exists())
+
+        for args, kwargs in delay.call_args_list:
+            create_object_changes(*args, **kwargs)
+        create_oc, delete_oc = ObjectChange.objects.filter(changed_object_id=location_pk).order_by("time")
+        self.assertEqual(create_oc.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(create_oc.object_data["name"], "Celery Location")
+        self.assertEqual(create_oc.object_data_v2["name"], "Celery Location")
+        self.assertEqual(create_oc.user, self.user)
+        self.assertEqual(create_oc.change_context_detail, "test_celery")
+        self.assertEqual(delete_oc.action, ObjectChangeActionChoices.ACTION_DELETE)
+        self.assertNotEqual(create_oc.request_id, delete_oc.request_id)
@@ -0,0 +1,175 @@
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import override_settings
+
+from nautobot.core.testing import TestCase
+from nautobot.dcim.models import Device, DeviceType, Location, LocationType, Manufacturer
+from nautobot.extras.config_contexts import get_object_ids_for_config_context
+from nautobot.extras.models import ConfigContext, RenderedConfigContext, Role, Status, Tag
+from nautobot.virtualization.models import VirtualMachine
+
+
+@override_settings(CONFIG_CONTEXT_MATERIALIZATION_ENABLED=True)
+class RenderedConfigContextTest(TestCase):
+    """Tests for the maintenance and use of materialized config contexts."""
+
+    @classmethod
+    def setUpTestData(cls):
+        location_type = LocationType.objects.create(name="Config Context Location Type", nestable=True)
+        location_status = Status.objects.get_for_model(Location).first()
+        cls.parent_location = Location.objects.create(
+            name="Parent Location", location_type=location_type, status=location_status
+        )
+        cls.location = Location.objects.create(
+            name="Location 1", location_type=location_type, status=location_status, parent=cls.parent_location
+        )
+        cls.other_location = Location.objects.create(
+            name="Location 2", location_type=location_type, status=location_status
+        )
+        cls.devicetype = DeviceType.objects.create(manufacturer=Manufacturer.objects.first(), model="Device Type 1")
+        cls.devicerole = Role.objects.get_for_model(Device).first()
+        cls.device_status = Status.objects.get_for_model(Device).first()
+        cls.tag = Tag.objects.create(name="Config Context Tag")
+        cls.tag.content_types.add(ContentType.objects.get_for_model(Device))
+
+    def create_device(self, name="Device 1", **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Device.objects.create(
+                name=name,
+                device_type=self.devicetype,
+                role=self.devicerole,
+                location=kwargs.pop("location", self.location),
+                status=self.device_status,
+                **kwargs,
+            )
+
+    def assertRenderedConfigContext(self, obj, expected_data):
+        rendered_config_context = RenderedConfigContext.objects.get(
+            assigned_object_type=ContentType.objects.get_for_model(obj), assigned_object_id=obj.pk
+        )
+        self.assertEqual(rendered_config_context.data, expected_data)
+        self.assertEqual(obj.get_config_context(), expected_data)
+
+    def test_device_create_update_delete(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            ConfigContext.objects.create(name="Context 1", weight=100, data={"a": 1, "b": 2})
+        device = self.create_device(local_config_context_data={"b": 3})
+        self.assertRenderedConfigContext(device, {"a": 1, "b": 3})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            device.local_config_context_data = {"c": 4}
+            device.save()
+        self.assertRenderedConfigContext(device, {"a": 1, "b": 2, "c": 4})
+
+        device_pk = device.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            device.delete()
+        self.assertFalse(RenderedConfigContext.objects.filter(assigned_object_id=device_pk).exists())
+
+    def test_rendered_config_context_is_used(self):
+        device = self.create_device()
+        RenderedConfigContext.objects.filter(assigned_object_id=device.pk).update(data={"materialized": True})
+
+        self.assertEqual(Device.objects.get(pk=device.pk).get_config_context(), {"materialized": True})
+        annotated_device = Device.objects.filter(pk=device.pk).annotate_config_context_data().get()
+        self.assertEqual(annotated_device.get_config_context(), {"materialized": True})
+        with override_settings(CONFIG_CONTEXT_MATERIALIZATION_ENABLED=False):
+            self.assertEqual(Device.objects.get(pk=device.pk).get_config_context(), {})
+        # Rendered config contexts don't include Dynamic Group assignments, so they aren't used along with them
+        with override_settings(CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED=True):
+            self.assertEqual(Device.objects.get(pk=device.pk).get_config_context(), {})
+            annotated_device = Device.objects.filter(pk=device.pk).annotate_config_context_data().get()
+            self.assertEqual(annotated_device.get_config_context(), {})
+
+    def test_config_context_changes(self):
+        device = self.create_device()
+        other_device = self.create_device(name="Device 2", location=self.other_location)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context = ConfigContext.objects.create(name="Context 1", data={"a": 1})
+            config_context.locations.add(self.parent_location)
+        self.assertRenderedConfigContext(device, {"a": 1})
+        self.assertRenderedConfigContext(other_device, {})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.data = {"a": 2}
+            config_context.save()
+            config_context.locations.set([self.other_location])
+        self.assertRenderedConfigContext(device, {})
+        self.assertRenderedConfigContext(other_device, {"a": 2})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.is_active = False
+            config_context.save()
+        self.assertRenderedConfigContext(other_device, {})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.is_active = True
+            config_context.save()
+        self.assertRenderedConfigContext(other_device, {"a": 2})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.delete()
+        self.assertRenderedConfigContext(other_device, {})
+
+    def test_tag_changes(self):
+        device = self.create_device()
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context = ConfigContext.objects.create(name="Context 1", data={"tagged": True})
+            config_context.tags.add(self.tag)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            device.tags.add(self.tag)
+        self.assertRenderedConfigContext(device, {"tagged": True})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            device.tags.remove(self.tag)
+        self.assertRenderedConfigContext(device, {})
+
+    def test_qualifier_changes(self):
+        device = self.create_device()
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context = ConfigContext.objects.create(name="Context 1", data={"a": 1})
+            config_context.locations.add(self.other_location)
+        self.assertRenderedConfigContext(device, {})
+
+        # Moving the device's location under the other location makes the context applicable to it
+        with self.captureOnCommitCallbacks(execute=True):
+            self.parent_location.parent = self.other_location
+            self.parent_location.save()
+        self.assertRenderedConfigContext(device, {"a": 1})
+
+        # Deleting the context's only qualifier makes the context applicable to all devices
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.tags.add(self.tag)
+        self.assertRenderedConfigContext(device, {})
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.locations.clear()
+            self.tag.delete()
+        self.assertRenderedConfigContext(device, {"a": 1})
+
+    def test_get_object_ids_for_config_context(self):
+        device = self.create_device()
+        other_device = self.create_device(name="Device 2", location=self.other_location)
+        config_context = ConfigContext.objects.create(name="Context 1", data={"a": 1})
+
+        self.assertEqual(
+            get_object_ids_for_config_context(Device, config_context), set(Device.objects.values_list("pk", flat=True))
+        )
+        config_context.locations.add(self.parent_location)
+        self.assertEqual(get_object_ids_for_config_context(Device, config_context), {device.pk})
+        config_context.roles.add(self.devicerole)
+        self.assertEqual(get_object_ids_for_config_context(Device, config_context), {device.pk})
+        self.assertNotIn(other_device.pk, get_object_ids_for_config_context(Device, config_context))
+        config_context.device_types.add(self.devicetype)
+        self.assertEqual(get_object_ids_for_config_context(VirtualMachine, config_context), set())
+
+    def test_refresh_config_contexts_command(self):
+        device = self.create_device()
+        RenderedConfigContext.objects.all().delete()
+        ConfigContext.objects.create(name="Context 1", data={"a": 1})
+
+        call_command("refresh_config_contexts", stdout=StringIO())
+        self.assertRenderedConfigContext(device, {"a": 1})
@@ -2,7 +2,9 @@ import random
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import ProtectedError, QuerySet
+from django.test import override_settings
 from django.urls import reverse
 
 from nautobot.core.forms.fields import MultiMatchModelMultipleChoiceField, MultiValueCharField
@@ -27,16 +29,20 @@ from nautobot.extras.choices import (
     CustomFieldTypeChoices,
     DynamicGroupOperatorChoices,
     DynamicGroupTypeChoices,
+    ObjectChangeActionChoices,
     RelationshipTypeChoices,
 )
+from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.filters import DynamicGroupFilterSet, DynamicGroupMembershipFilterSet
 from nautobot.extras.models import (
     CustomField,
     DynamicGroup,
     DynamicGroupMembership,
+    ObjectChange,
     Relationship,
     RelationshipAssociation,
     Role,
+    StaticGroupAssociation,
     Status,
     Tag,
 )
@@ -329,6 +335,74 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
         self.assertIsInstance(Prefix.objects.filter(ip_version=6).first().dynamic_groups, QuerySet)
         self.assertIn(sg, list(Prefix.objects.filter(ip_version=6).first().dynamic_groups))
 
+    def test_static_member_operations_change_logging(self):
+        """Changes to the members of a static group are change-logged in bulk."""
+        sg = DynamicGroup.objects.create(
+            name="Logged Prefixes",
+            content_type=ContentType.objects.get_for_model(Prefix),
+            group_type=DynamicGroupTypeChoices.TYPE_STATIC,
+        )
+        sga_ct = ContentType.objects.get_for_model(StaticGroupAssociation)
+        prefixes = Prefix.objects.filter(ip_version=4)
+        with web_request_context(self.user):
+            sg.add_members(prefixes)
+            # Members that are already present aren't logged again
+            sg.add_members(list(prefixes))
+        object_changes = ObjectChange.objects.filter(changed_object_type=sga_ct)
+        self.assertEqual(object_changes.count(), prefixes.count())
+        self.assertEqual(
+            set(object_changes.values_list("changed_object_id", flat=True)),
+            set(sg.static_group_associations.values_list("pk", flat=True)),
+        )
+        object_change = object_changes.first()
+        self.assertEqual(object_change.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(object_change.user, self.user)
+        self.assertEqual(object_change.user_name, self.user.username)
+        self.assertIn(str(sg), object_change.object_repr)
+
+        removed_pk = prefixes.first().pk
+        with web_request_context(self.user):
+            sg.members = prefixes.exclude(pk=removed_pk)
+        object_change = ObjectChange.objects.get(
+            changed_object_type=sga_ct, action=ObjectChangeActionChoices.ACTION_DELETE
+        )
+        self.assertEqual(object_change.object_data["associated_object_id"], str(removed_pk))
+        self.assertQuerysetEqualAndNotEmpty(sg.members, prefixes.exclude(pk=removed_pk))
+
+        # Cached members of non-static groups aren't change-logged
+        with web_request_context(self.user):
+            self.first_child.update_cached_members()
+        self.assertEqual(ObjectChange.objects.filter(changed_object_type=sga_ct).count(), prefixes.count() + 1)
+
+    @override_settings(CHANGELOG_WRITE_MODE="on_commit")
+    def test_static_member_operations_buffered_change_logging(self):
+        """Changes to the members of a static group are logged along with the rest of the transaction when buffered."""
+        sg = DynamicGroup.objects.create(
+            name="Buffered Prefixes",
+            content_type=ContentType.objects.get_for_model(Prefix),
+            group_type=DynamicGroupTypeChoices.TYPE_STATIC,
+        )
+        sga_ct = ContentType.objects.get_for_model(StaticGroupAssociation)
+        prefixes = Prefix.objects.filter(ip_version=4)
+        with self.captureOnCommitCallbacks(execute=True):
+            with web_request_context(self.user):
+                with transaction.atomic():
+                    sg.add_members(prefixes)
+                    self.assertFalse(ObjectChange.objects.filter(changed_object_type=sga_ct).exists())
+        object_changes = ObjectChange.objects.filter(changed_object_type=sga_ct)
+        self.assertEqual(object_changes.count(), prefixes.count())
+        self.assertEqual(object_changes.first().action, ObjectChangeActionChoices.ACTION_CREATE)
+
+        removed = prefixes.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            with web_request_context(self.user):
+                with transaction.atomic():
+                    sg.remove_members([removed])
+        object_change = ObjectChange.objects.get(
+            changed_object_type=sga_ct, action=ObjectChangeActionChoices.ACTION_DELETE
+        )
+        self.assertEqual(object_change.object_data["associated_object_id"], str(removed.pk))
+
     # TODO negative test that members=, add_members(), remove_members() raise appropriate errors for non-static groups
 
     def test_members_fail_closed(self):
@@ -1138,6 +1212,67 @@ class DynamicGroupMixinModelTest(DynamicGroupTestBase):
         self.assertEqual(set(groups), set([self.first_child, self.third_child, self.nested_child]))
 
 
+class DynamicGroupIncrementalMembershipTest(DynamicGroupTestBase):
+    """Tests for incremental updates of the cached members of DynamicGroups."""
+
+    def get_expected_groups(self, obj):
+        return {group for group in self.groups if group._get_group_queryset().filter(pk=obj.pk).exists()}
+
+    def test_update_cached_memberships(self):
+        for group in self.groups:
+            group.update_cached_members()
+        device = self.devices[0]
+        # Bypass signals, so that the cached memberships are stale
+        Device.objects.filter(pk=device.pk).update(location=self.locations[2], status=self.status_2)
+        self.assertNotEqual(set(DynamicGroup.objects.get_for_object(device)), self.get_expected_groups(device))
+
+        with self.assertApproximateNumQueries(minimum=3, maximum=10 + 2 * len(self.groups)):
+            added_count, removed_count = DynamicGroup.objects.update_cached_memberships(
+                Device, [device.pk for device in self.devices]
+            )
+        self.assertGreater(added_count, 0)
+        self.assertGreater(removed_count, 0)
+        for device in self.devices:
+            self.assertEqual(set(DynamicGroup.objects.get_for_object(device)), self.get_expected_groups(device))
+
+        # Nothing further to update
+        self.assertEqual(DynamicGroup.objects.update_cached_memberships(Device, [device.pk]), (0, 0))
+
+    @override_settings(DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_ENABLED=True)
+    def test_incremental_membership_on_save(self):
+        for group in self.groups:
+            group.update_cached_members()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            device = Device.objects.create(
+                name="device-location-1-new",
+                status=self.status_1,
+                role=self.device_role,
+                device_type=self.device_type,
+                location=self.locations[0],
+            )
+        self.assertIn(self.first_child, self.get_expected_groups(device))
+        self.assertEqual(set(DynamicGroup.objects.get_for_object(device)), self.get_expected_groups(device))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            device.location = self.locations[2]
+            device.save()
+        self.assertIn(self.second_child, self.get_expected_groups(device))
+        self.assertEqual(set(DynamicGroup.objects.get_for_object(device)), self.get_expected_groups(device))
+
+    @override_settings(DYNAMIC_GROUPS_INCREMENTAL_MEMBERSHIP_ENABLED=False)
+    def test_incremental_membership_disabled(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            device = Device.objects.create(
+                name="device-location-1-new",
+                status=self.status_1,
+                role=self.device_role,
+                device_type=self.device_type,
+                location=self.locations[0],
+            )
+        self.assertFalse(DynamicGroup.objects.get_for_object(device).exists())
+
+
 class DynamicGroupFilterTest(DynamicGroupTestBase, FilterTestCases.FilterTestCase):
     """DynamicGroup instance filterset tests."""
 
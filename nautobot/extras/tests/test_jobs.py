@@ -524,6 +524,32 @@ class JobTransactionTest(TransactionTestCase):
         self.assertFalse(logs.filter(message="I should NOT be logged to the database").exists())
         self.assertTrue(logs.filter(message="I should be logged to the database").exists())
 
+    @override_settings(JOB_LOG_BUFFER_SIZE=3, JOB_LOG_BUFFER_TIMEOUT=3600)
+    def test_log_buffering(self):
+        """
+        Test that log entries are saved to the database in batches, and all of them once the job ends.
+        """
+        module = "log_buffering"
+        name = "TestLogBuffering"
+        job_result = create_job_result_and_run_job(module, name)
+
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        # "Running job" was saved right away as the first entry, and the next three once the third of them was logged,
+        # then the last one along with the warning
+        self.assertEqual(job_result.result, [4, 6])
+        self.assertEqual(
+            list(job_result.job_log_entries.order_by("created").values_list("message", flat=True)),
+            [
+                "Running job",
+                "Log entry 0",
+                "Log entry 1",
+                "Log entry 2",
+                "Log entry 3",
+                "Warning entry",
+                "Job completed",
+            ],
+        )
+
     def test_object_vars(self):
         """
         Test that Object variable fields behave as expected.
@@ -615,7 +641,7 @@ class JobTransactionTest(TransactionTestCase):
         self.assertTrue(profiling_result.exists())
         profiling_result.unlink()
 
-    @mock.patch("nautobot.extras.context_managers.enqueue_webhooks")
+    @mock.patch("nautobot.extras.context_managers.enqueue_webhooks_for_object_changes")
     def test_job_fires_webhooks(self, mock_enqueue_webhooks):
         module = "atomic_transaction"
         name = "TestAtomicDecorator"
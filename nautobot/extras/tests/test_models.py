@@ -888,6 +888,43 @@ class ExportTemplateTest(ModelTestCases.BaseModelTestCase):
             )
             nonduplicate_template.validated_save()
 
+    def test_render_stream(self):
+        """render_stream() should render the same content as render(), retrieving the objects in chunks."""
+        status_ct = ContentType.objects.get_for_model(Status)
+        export_template = ExportTemplate.objects.create(
+            content_type=status_ct,
+            name="Streamed Export Template",
+            template_code="{{ queryset|length }}\r\n{% for obj in queryset %}{{ obj.name }}\r\n{% endfor %}",
+        )
+        queryset = Status.objects.all()
+        progress = []
+
+        output = "".join(export_template.render_stream(queryset, chunk_size=2, progress_callback=progress.append))
+
+        self.assertEqual(output, export_template.render(queryset))
+        self.assertNotIn("\r", output)
+        self.assertEqual(output.split("\n")[0], str(queryset.count()))
+        self.assertEqual(progress, [*range(2, queryset.count(), 2), queryset.count()])
+
+    def test_render_stream_indexing(self):
+        """render_stream() should support indexing, slicing and membership tests of the queryset like render()."""
+        status_ct = ContentType.objects.get_for_model(Status)
+        export_template = ExportTemplate.objects.create(
+            content_type=status_ct,
+            name="Streamed Export Template",
+            template_code=(
+                "{{ queryset[0].name }}\n{% for obj in queryset[1:3] %}{{ obj.name }}\n{% endfor %}"
+                "{{ queryset[0] in queryset }}"
+            ),
+        )
+        queryset = Status.objects.all()
+        render_queryset = export_template.get_render_queryset(queryset)
+
+        output = "".join(export_template.render_stream(queryset, chunk_size=2))
+
+        self.assertEqual(output, export_template.render(queryset))
+        self.assertEqual(output.split("\n"), [obj.name for obj in render_queryset[:3]] + ["True"])
+
 
 class ExternalIntegrationTest(ModelTestCases.BaseModelTestCase):
     """
@@ -0,0 +1,143 @@
+from io import StringIO
+from unittest import mock
+import urllib.parse
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+
+from nautobot.core.testing import TestCase
+from nautobot.dcim.filters import DeviceTypeFilterSet
+from nautobot.dcim.models import DeviceType, Manufacturer
+from nautobot.extras.models import SearchIndexEntry
+from nautobot.extras.search_index import get_indexed_models, search
+from nautobot.ipam.models import Prefix
+from nautobot.tenancy.filters import TenantFilterSet
+from nautobot.tenancy.models import Tenant
+from nautobot.users.models import ObjectPermission
+
+
+@override_settings(SEARCH_INDEX_ENABLED=True)
+class SearchIndexTest(TestCase):
+    """Tests for the maintenance and use of the search index."""
+
+    def get_text(self, obj):
+        return SearchIndexEntry.objects.get(
+            content_type=ContentType.objects.get_for_model(obj), object_id=obj.pk
+        ).text.split("\n")
+
+    def test_indexed_models(self):
+        self.assertIn(Tenant, get_indexed_models())
+        self.assertIn(DeviceType, get_indexed_models())
+        # Prefixes are searched by network rather than by field values
+        self.assertNotIn(Prefix, get_indexed_models())
+
+    def test_create_update_delete(self):
+        tenant = Tenant.objects.create(name="Search Index Tenant", description="Indexed Description")
+        self.assertEqual(self.get_text(tenant), ["search index tenant", "indexed description"])
+
+        tenant.description = ""
+        tenant.comments = "Some Comments"
+        tenant.save()
+        self.assertEqual(self.get_text(tenant), ["search index tenant", "some comments"])
+
+        tenant_pk = tenant.pk
+        tenant.delete()
+        self.assertFalse(SearchIndexEntry.objects.filter(object_id=tenant_pk).exists())
+
+    def test_related_object_changes(self):
+        manufacturer = Manufacturer.objects.create(name="Search Index Manufacturer")
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Search Index Model")
+        self.assertIn("search index manufacturer", self.get_text(device_type))
+
+        manufacturer.name = "Renamed Manufacturer"
+        manufacturer.save()
+        self.assertIn("renamed manufacturer", self.get_text(device_type))
+        self.assertNotIn("search index manufacturer", self.get_text(device_type))
+
+        filterset = DeviceTypeFilterSet({"q": "RENAMED manufacturer"}, DeviceType.objects.all())
+        self.assertQuerysetEqualAndNotEmpty(filterset.qs, [device_type])
+
+    def test_search_index_is_used(self):
+        tenant = Tenant.objects.create(name="Search Index Tenant")
+        other_tenant = Tenant.objects.create(name="Other Tenant", comments="Not a search index tenant")
+
+        filterset = TenantFilterSet({"q": "search index tenant"}, Tenant.objects.all())
+        self.assertQuerysetEqualAndNotEmpty(filterset.qs, [tenant, other_tenant], ordered=False)
+
+        # Objects missing from the search index aren't found
+        SearchIndexEntry.objects.filter(object_id=other_tenant.pk).delete()
+        filterset = TenantFilterSet({"q": "search index tenant"}, Tenant.objects.all())
+        self.assertQuerysetEqualAndNotEmpty(filterset.qs, [tenant])
+        with override_settings(SEARCH_INDEX_ENABLED=False):
+            filterset = TenantFilterSet({"q": "search index tenant"}, Tenant.objects.all())
+            self.assertQuerysetEqualAndNotEmpty(filterset.qs, [tenant, other_tenant], ordered=False)
+
+    def test_unindexed_predicates(self):
+        """Predicates other than substring matches are matched against the objects themselves, as without the index."""
+        tenant = Tenant.objects.create(name="Search Index Tenant")
+        Tenant.objects.create(name="Other Tenant")
+
+        for value in [str(tenant.pk), str(tenant.pk).upper(), f" {tenant.pk} "]:
+            filterset = TenantFilterSet({"q": value}, Tenant.objects.all())
+            self.assertQuerysetEqualAndNotEmpty(filterset.qs, [tenant])
+            self.assertEqual(search(value, [Tenant], limit=2), {Tenant: [tenant.pk]})
+
+        # Searches don't match the IDs of objects by substring
+        value = str(tenant.pk)[:8]
+        self.assertFalse(TenantFilterSet({"q": value}, Tenant.objects.all()).qs.exists())
+        self.assertEqual(search(value, [Tenant], limit=2), {})
+        with override_settings(SEARCH_INDEX_ENABLED=False):
+            self.assertFalse(TenantFilterSet({"q": value}, Tenant.objects.all()).qs.exists())
+
+        # Whitespace is significant to substring matches
+        self.assertFalse(TenantFilterSet({"q": " search index tenant "}, Tenant.objects.all()).qs.exists())
+        self.assertQuerysetEqualAndNotEmpty(TenantFilterSet({"q": "index "}, Tenant.objects.all()).qs, [tenant])
+
+    def test_search(self):
+        tenants = [Tenant.objects.create(name=f"Search Index Tenant {i}") for i in range(3)]
+        manufacturer = Manufacturer.objects.create(name="Search Index Manufacturer")
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Model 1")
+
+        results = search("search index", [Tenant.objects.all(), DeviceType.objects.all()], limit=2)
+        self.assertEqual(results, {Tenant: [tenants[0].pk, tenants[1].pk], DeviceType: [device_type.pk]})
+
+        # Only the objects of the given querysets are searched
+        results = search("search index", [Tenant.objects.exclude(pk=tenants[0].pk)], limit=2)
+        self.assertEqual(results, {Tenant: [tenants[1].pk, tenants[2].pk]})
+
+    def test_global_search_view(self):
+        self.user.is_superuser = True
+        self.user.save()
+        tenant = Tenant.objects.create(name="Search Index Tenant")
+
+        response = self.client.get(f"{reverse('search')}?{urllib.parse.urlencode({'q': 'search index tenant'})}")
+        self.assertHttpStatus(response, 200)
+        self.assertContains(response, tenant.get_absolute_url())
+
+    def test_global_search_view_constrained_permission(self):
+        """Objects that the user may not view don't keep the permitted matches from being shown."""
+        tenants = [Tenant.objects.create(name=f"Search Index Tenant {i}") for i in range(3)]
+        obj_perm = ObjectPermission(
+            name="Test permission",
+            constraints={"pk": tenants[2].pk},
+            actions=["view"],
+        )
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Tenant))
+
+        # Only the first permitted match fits within the results
+        with mock.patch("nautobot.core.views.SEARCH_MAX_RESULTS", 1):
+            response = self.client.get(f"{reverse('search')}?{urllib.parse.urlencode({'q': 'search index tenant'})}")
+        self.assertHttpStatus(response, 200)
+        self.assertContains(response, tenants[2].get_absolute_url())
+        self.assertNotContains(response, tenants[0].get_absolute_url())
+
+    def test_refresh_search_index_command(self):
+        tenant = Tenant.objects.create(name="Search Index Tenant")
+        SearchIndexEntry.objects.all().delete()
+
+        call_command("refresh_search_index", stdout=StringIO())
+        self.assertEqual(self.get_text(tenant), ["search index tenant"])
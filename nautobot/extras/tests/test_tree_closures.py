@@ -0,0 +1,94 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+
+from nautobot.core.testing import TestCase
+from nautobot.dcim.filters import RackGroupFilterSet
+from nautobot.dcim.models import Location, LocationType, RackGroup
+from nautobot.extras.models import Status, TreeClosure
+
+
+@override_settings(TREE_CLOSURE_ENABLED=True)
+class TreeClosureTest(TestCase):
+    """Tests for the maintenance and use of the closure tables of trees."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.location_type = LocationType.objects.create(name="Tree Closure Location Type", nestable=True)
+        cls.status = Status.objects.get_for_model(Location).first()
+
+    def create_location(self, name, parent=None):
+        return Location.objects.create(name=name, location_type=self.location_type, status=self.status, parent=parent)
+
+    def assertClosure(self, location, expected_ancestors):
+        """Assert that the closure table holds exactly the given ancestors of the location, from the root down."""
+        closures = TreeClosure.objects.filter(descendant_id=location.pk).order_by("-depth")
+        self.assertEqual(
+            [(closure.ancestor_id, closure.depth) for closure in closures],
+            [(ancestor.pk, len(expected_ancestors) - 1 - index) for index, ancestor in enumerate(expected_ancestors)],
+        )
+
+    def test_create_move_delete(self):
+        root = self.create_location("Root")
+        branch = self.create_location("Branch", parent=root)
+        leaf = self.create_location("Leaf", parent=branch)
+        other_root = self.create_location("Other Root")
+        self.assertClosure(root, [root])
+        self.assertClosure(branch, [root, branch])
+        self.assertClosure(leaf, [root, branch, leaf])
+
+        # Moving the branch moves its whole subtree
+        branch.parent = other_root
+        branch.save()
+        self.assertClosure(branch, [other_root, branch])
+        self.assertClosure(leaf, [other_root, branch, leaf])
+        self.assertFalse(TreeClosure.objects.filter(ancestor_id=root.pk, depth__gt=0).exists())
+
+        branch.parent = None
+        branch.save()
+        self.assertClosure(leaf, [branch, leaf])
+
+        leaf_pk = leaf.pk
+        leaf.delete()
+        self.assertFalse(TreeClosure.objects.filter(descendant_id=leaf_pk).exists())
+        self.assertFalse(TreeClosure.objects.filter(ancestor_id=leaf_pk).exists())
+
+    def test_closure_is_used(self):
+        root = self.create_location("Root")
+        branch = self.create_location("Branch", parent=root)
+        leaf = self.create_location("Leaf", parent=branch)
+        other_root = self.create_location("Other Root")
+
+        with self.assertNumQueries(2):
+            self.assertEqual(list(Location.objects.ancestors(leaf)), [root, branch])
+        self.assertEqual(list(Location.objects.ancestors(leaf, include_self=True)), [root, branch, leaf])
+        self.assertEqual(list(Location.objects.ancestors(root)), [])
+
+        rack_groups = {
+            location: RackGroup.objects.create(name=f"Rack Group {location.name}", location=location)
+            for location in (root, branch, leaf, other_root)
+        }
+        filterset = RackGroupFilterSet({"location": [branch.pk, other_root.pk]}, RackGroup.objects.all())
+        self.assertQuerysetEqualAndNotEmpty(
+            filterset.qs,
+            RackGroup.objects.filter(pk__in=[rack_groups[location].pk for location in (branch, leaf, other_root)]),
+        )
+
+        # Tree nodes missing from the closure table are looked up by walking the tree
+        TreeClosure.objects.filter(descendant_id__in=[branch.pk, leaf.pk]).delete()
+        self.assertEqual(list(Location.objects.ancestors(leaf)), [root, branch])
+        filterset = RackGroupFilterSet({"location": [branch.pk]}, RackGroup.objects.all())
+        self.assertQuerysetEqualAndNotEmpty(
+            filterset.qs, RackGroup.objects.filter(pk__in=[rack_groups[branch].pk, rack_groups[leaf].pk])
+        )
+
+    def test_refresh_tree_closures_command(self):
+        root = self.create_location("Root")
+        branch = self.create_location("Branch", parent=root)
+        leaf = self.create_location("Leaf", parent=branch)
+        TreeClosure.objects.all().delete()
+
+        call_command("refresh_tree_closures", stdout=StringIO())
+        self.assertClosure(leaf, [root, branch, leaf])
+        self.assertClosure(self.location_type, [self.location_type])
@@ -1,4 +1,5 @@
 from copy import deepcopy
+from email.message import Message
 import json
 from unittest.mock import patch
 import uuid
@@ -6,8 +7,11 @@ import uuid
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-from requests import Session
+from requests import Request, Session
+from requests.cookies import MockRequest, MockResponse
 
 from nautobot.core.api.exceptions import SerializerNotFound
 from nautobot.core.api.utils import get_serializer_for_model
@@ -17,11 +21,12 @@ from nautobot.dcim.api.serializers import LocationSerializer
 from nautobot.dcim.models import Location, LocationType
 from nautobot.extras.choices import ObjectChangeActionChoices
 from nautobot.extras.context_managers import web_request_context
-from nautobot.extras.models import Tag, Webhook
+from nautobot.extras.models import ObjectChange, Tag, Webhook
 from nautobot.extras.models.statuses import Status
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import get_webhook_session, process_webhook
 from nautobot.extras.utils import generate_signature
+from nautobot.extras.webhooks import enqueue_webhooks_for_object_changes
 
 User = get_user_model()
 
@@ -272,6 +277,70 @@ class WebhookTest(APITestCase):
                     snapshots,
                 )
 
+    def test_webhooks_batch_events(self):
+        """
+        Make sure that the events of a single request are sent in a single request by a webhook with batch_events.
+        """
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.batch_events = True
+        webhook.save()
+        requests_sent = []
+
+        def mock_send(_, request, **kwargs):
+            self.assertEqual(request.headers["X-Hook-Signature"], generate_signature(request.body, webhook.secret))
+            self.assertEqual(request.headers["X-Foo"], "Bar")
+            requests_sent.append(json.loads(request.body))
+
+            class FakeResponse:
+                ok = True
+                status_code = 200
+
+            return FakeResponse()
+
+        with patch.object(Session, "send", mock_send):
+            with web_request_context(self.user):
+                location_type = LocationType.objects.get(name="Campus")
+                for i in range(3):
+                    Location.objects.create(name=f"Location {i}", location_type=location_type, status=self.statuses[0])
+
+        self.assertEqual(len(requests_sent), 1)
+        self.assertEqual(len(requests_sent[0]), 3)
+        self.assertEqual(
+            {event["data"]["name"] for event in requests_sent[0]}, {"Location 0", "Location 1", "Location 2"}
+        )
+        for event in requests_sent[0]:
+            self.assertEqual(event["event"], "created")
+            self.assertEqual(event["model"], "location")
+
+    def test_get_webhook_session(self):
+        """
+        Make sure that webhooks share a pooled session per endpoint and TLS verification settings.
+        """
+        webhook = Webhook.objects.get(type_create=True)
+        session = get_webhook_session(webhook)
+        self.assertIs(get_webhook_session(webhook), session)
+        self.assertIs(get_webhook_session(Webhook.objects.get(type_update=True)), session)
+        self.assertTrue(session.verify)
+
+        webhook.ssl_verification = False
+        self.assertIsNot(get_webhook_session(webhook), session)
+        self.assertFalse(get_webhook_session(webhook).verify)
+        webhook.ssl_verification = True
+        webhook.payload_url = "https://localhost/"
+        self.assertIsNot(get_webhook_session(webhook), session)
+
+    def test_get_webhook_session_rejects_cookies(self):
+        """
+        Make sure that cookies set in response to one webhook aren't sent along with the requests of others.
+        """
+        webhook = Webhook.objects.get(type_create=True)
+        session = get_webhook_session(webhook)
+        headers = Message()
+        headers["Set-Cookie"] = "session=secret; Path=/"
+        request = Request("POST", webhook.payload_url).prepare()
+        session.cookies.extract_cookies(MockResponse(headers), MockRequest(request))
+        self.assertEqual(len(session.cookies), 0)
+
     def test_webhook_render_body_with_utf8(self):
         self.assertEqual(Webhook().render_body({"utf8": "I am UTF-8! 😀"}), '{"utf8": "I am UTF-8! 😀"}')
 
@@ -330,7 +399,7 @@ class WebhookTest(APITestCase):
         self.assertEqual(args[6], request_id)
         self.assertNotEqual(args[7], {})
 
-    @patch("nautobot.extras.context_managers.enqueue_webhooks")
+    @patch("nautobot.extras.context_managers.enqueue_webhooks_for_object_changes")
     def test_enqueue_webhooks_create_update(self, mock_enqueue_webhooks):
         """
         Make sure only one webhook is enqueued if there's a create and update in the same change context.
@@ -345,7 +414,31 @@ class WebhookTest(APITestCase):
 
         all_changes = get_changes_for_model(location)
         self.assertEqual(all_changes.count(), 1)
-        mock_enqueue_webhooks.assert_called_once_with(all_changes.first())
+        mock_enqueue_webhooks.assert_called_once()
+        self.assertEqual(list(mock_enqueue_webhooks.call_args[0][0]), [all_changes.first()])
+
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_enqueue_webhooks_for_object_changes(self, mock_async):
+        """
+        Make sure that the webhooks for multiple changes of the same type are only looked up once.
+        """
+        request_id = uuid.uuid4()
+        location_type = LocationType.objects.get(name="Campus")
+
+        with web_request_context(self.user, change_id=request_id):
+            for i in range(3):
+                Location.objects.create(name=f"Location {i}", location_type=location_type, status=self.statuses[0])
+
+        object_changes = list(ObjectChange.objects.filter(request_id=request_id))
+        self.assertEqual(len(object_changes), 3)
+        mock_async.reset_mock()
+        with CaptureQueriesContext(connection) as queries:
+            enqueue_webhooks_for_object_changes(object_changes)
+        self.assertEqual(mock_async.call_count, 3)
+        self.assertEqual(
+            {call[1]["args"][0] for call in mock_async.call_args_list}, {Webhook.objects.get(type_create=True).pk}
+        )
+        self.assertEqual(len([query for query in queries if "extras_webhook" in query["sql"]]), 1)
 
     def test_all_webhook_supported_models(self):
         """
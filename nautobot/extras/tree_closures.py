@@ -0,0 +1,118 @@
+"""Maintenance of the closure tables (`TreeClosure`) of the trees of `TreeModel`s, such as Locations."""
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Q
+
+from nautobot.core.models.tree_queries import TreeModel
+from nautobot.extras.models import TreeClosure
+
+
+def get_tree_models():
+    """Return the list of (concrete) `TreeModel`s whose trees have closure tables."""
+    return [model for model in apps.get_models() if issubclass(model, TreeModel) and not model._meta.proxy]
+
+
+def get_closed_node_ids(pks):
+    """
+    Return the set of the given primary keys of tree nodes that are in the closure table of their tree.
+
+    Nodes that are missing from it, such as those created while it wasn't being maintained, need to be looked up by
+    walking the tree instead.
+    """
+    return set(TreeClosure.objects.filter(ancestor_id__in=pks, depth=0).values_list("ancestor_id", flat=True))
+
+
+def refresh_tree_closure(model, batch_size=1000):
+    """
+    Rebuild the closure table of the tree of the given model from scratch.
+
+    Args:
+        model (Model): TreeModel, such as Location
+        batch_size (int): Number of closure records to store at a time
+
+    Returns:
+        (int): the number of tree nodes in the closure table
+    """
+    parent_ids = dict(model.objects.without_tree_fields().order_by().values_list("pk", "parent_id"))
+    tree_type = ContentType.objects.get_for_model(model)
+
+    # The ancestors of each node, starting with the node itself and ending with the root of its tree
+    ancestor_ids = {}
+    for pk in parent_ids:
+        path = []
+        node_id = pk
+        while node_id is not None and node_id not in ancestor_ids:
+            path.append(node_id)
+            node_id = parent_ids.get(node_id)
+        tail = ancestor_ids[node_id] if node_id is not None else []
+        for index, node_id in enumerate(path):
+            ancestor_ids[node_id] = path[index:] + tail
+
+    closures = (
+        TreeClosure(tree_type=tree_type, ancestor_id=ancestor_id, descendant_id=pk, depth=depth)
+        for pk in parent_ids
+        for depth, ancestor_id in enumerate(ancestor_ids[pk])
+    )
+    with transaction.atomic():
+        TreeClosure.objects.filter(tree_type=tree_type).delete()
+        batch = []
+        for closure in closures:
+            batch.append(closure)
+            if len(batch) >= batch_size:
+                TreeClosure.objects.bulk_create(batch)
+                batch = []
+        TreeClosure.objects.bulk_create(batch)
+    return len(parent_ids)
+
+
+def update_tree_closure(instance):
+    """
+    Update the closure table of the tree of the given (saved) tree node, once it's created or moved to another parent.
+
+    Moving a node moves its whole subtree, so the closures between its subtree and its former ancestors are replaced by
+    those between its subtree and its new ancestors. If the new parent of the node is missing from the closure table,
+    the subtree is removed from it instead, so that its nodes are looked up by walking the tree until it's refreshed.
+    """
+    parent_id = instance.parent_id
+    closures = dict(
+        TreeClosure.objects.filter(descendant_id=instance.pk, depth__lte=1).values_list("depth", "ancestor_id")
+    )
+    if 0 in closures and closures.get(1) == parent_id:
+        return
+
+    tree_type = ContentType.objects.get_for_model(instance._meta.concrete_model)
+    with transaction.atomic():
+        if 0 in closures:
+            subtree = list(TreeClosure.objects.filter(ancestor_id=instance.pk).values_list("descendant_id", "depth"))
+            subtree_ids = [descendant_id for descendant_id, _ in subtree]
+            TreeClosure.objects.filter(descendant_id__in=subtree_ids).exclude(ancestor_id__in=subtree_ids).delete()
+        else:
+            subtree = [(instance.pk, 0)]
+            subtree_ids = [instance.pk]
+            TreeClosure.objects.create(tree_type=tree_type, ancestor_id=instance.pk, descendant_id=instance.pk, depth=0)
+        if parent_id is None:
+            return
+
+        parent_closures = list(TreeClosure.objects.filter(descendant_id=parent_id).values_list("ancestor_id", "depth"))
+        if not parent_closures:
+            TreeClosure.objects.filter(descendant_id__in=subtree_ids).delete()
+            return
+        TreeClosure.objects.bulk_create(
+            [
+                TreeClosure(
+                    tree_type=tree_type,
+                    ancestor_id=ancestor_id,
+                    descendant_id=descendant_id,
+                    depth=ancestor_depth + descendant_depth + 1,
+                )
+                for ancestor_id, ancestor_depth in parent_closures
+                for descendant_id, descendant_depth in subtree
+            ]
+        )
+
+
+def delete_tree_closure(instance):
+    """Remove the given (deleted) tree node from the closure table of its tree."""
+    TreeClosure.objects.filter(Q(ancestor_id=instance.pk) | Q(descendant_id=instance.pk)).delete()
@@ -1,9 +1,74 @@
+import contextlib
+import itertools
+
+from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 
+from nautobot.core.celery import app
 from nautobot.extras.choices import ObjectChangeActionChoices
-from nautobot.extras.models import Webhook
+from nautobot.extras.constants import WEBHOOK_BATCH_MAX_EVENTS
+from nautobot.extras.models import ObjectChange, Webhook
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhook_batch
+
+ACTION_FLAGS = {
+    ObjectChangeActionChoices.ACTION_CREATE: "type_create",
+    ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
+    ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
+}
+
+
+def get_webhooks_for_object_change(object_change):
+    """
+    Return the list of enabled Webhooks applicable to the changed object type and action of the given ObjectChange.
+    """
+    # Determine whether this type of object supports webhooks
+    content_type = ContentType.objects.get_for_id(object_change.changed_object_type_id)
+    if content_type.model not in registry["model_features"]["webhooks"].get(content_type.app_label, []):
+        return []
+
+    action_flag = ACTION_FLAGS[object_change.action]
+    return list(Webhook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True}))
+
+
+def _get_webhook_event(object_change):
+    """Return the list of `process_webhook()` arguments, excluding the webhook, describing the given ObjectChange."""
+    # fall back to object_data if object_data_v2 is not available
+    serialized_data = object_change.object_data_v2
+    if serialized_data is None:
+        serialized_data = object_change.object_data
+
+    return [
+        serialized_data,
+        ContentType.objects.get_for_id(object_change.changed_object_type_id).model,
+        object_change.action,
+        str(timezone.now()),
+        object_change.user_name,
+        object_change.request_id,
+        object_change.get_snapshots(),
+    ]
+
+
+def _enqueue_webhooks(object_change, webhooks, producer=None, batches=None):
+    """
+    Enqueue the given Webhooks for the given ObjectChange.
+
+    Events for webhooks with `batch_events` enabled are appended to `batches` (a dict of webhook PK to list of events)
+    for the caller to enqueue later, if provided; otherwise they're enqueued immediately, as a batch of one event.
+    """
+    if not webhooks:
+        return
+
+    event = _get_webhook_event(object_change)
+
+    # Enqueue the webhooks
+    for webhook in webhooks:
+        if not webhook.batch_events:
+            process_webhook.apply_async(args=[webhook.pk, *event], producer=producer)
+        elif batches is not None:
+            batches.setdefault(webhook.pk, []).append(event)
+        else:
+            process_webhook_batch.apply_async(args=[webhook.pk, [event]], producer=producer)
 
 
 def enqueue_webhooks(object_change):
@@ -11,37 +76,45 @@ def enqueue_webhooks(object_change):
     Find Webhook(s) assigned to this instance + action and enqueue them
     to be processed
     """
-    # Determine whether this type of object supports webhooks
-    app_label = object_change.changed_object_type.app_label
-    model_name = object_change.changed_object_type.model
-    if model_name not in registry["model_features"]["webhooks"].get(app_label, []):
-        return
+    _enqueue_webhooks(object_change, get_webhooks_for_object_change(object_change))
+
+
+def enqueue_webhooks_for_object_changes(object_changes, chunk_size=1000):
+    """
+    Find and enqueue the Webhook(s) applicable to each of the given ObjectChanges, such as all those of a single request.
+
+    The applicable webhooks are looked up only once for each distinct changed object type and action, rather than once
+    per change, the snapshots of each chunk of changes are computed together by `ObjectChange.get_snapshots_for()`,
+    and all of the resulting tasks are published using a single Celery producer (broker connection).
+    The events for webhooks with `batch_events` enabled are coalesced into tasks of up to `WEBHOOK_BATCH_MAX_EVENTS`
+    events each, each of which sends a single request.
+    """
+    webhooks_by_group = {}
+    batches = {}
+    object_changes = iter(object_changes)
+    with contextlib.ExitStack() as stack:
+        producer = None
+        while chunk := list(itertools.islice(object_changes, chunk_size)):
+            changes_with_webhooks = []
+            for object_change in chunk:
+                group = (object_change.changed_object_type_id, object_change.action)
+                if group not in webhooks_by_group:
+                    webhooks_by_group[group] = get_webhooks_for_object_change(object_change)
+                if webhooks_by_group[group]:
+                    changes_with_webhooks.append(object_change)
+            if not changes_with_webhooks:
+                continue
+
+            # Only connect to the broker once there's something to publish
+            if producer is None:
+                producer = stack.enter_context(app.producer_or_acquire())
+            ObjectChange.get_snapshots_for(changes_with_webhooks)
+            for object_change in changes_with_webhooks:
+                webhooks = webhooks_by_group[(object_change.changed_object_type_id, object_change.action)]
+                _enqueue_webhooks(object_change, webhooks, producer=producer, batches=batches)
 
-    # Retrieve any applicable Webhooks
-    content_type = object_change.changed_object_type
-    action_flag = {
-        ObjectChangeActionChoices.ACTION_CREATE: "type_create",
-        ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
-        ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
-    }[object_change.action]
-    webhooks = Webhook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
-
-    if webhooks.exists():
-        # fall back to object_data if object_data_v2 is not available
-        serialized_data = object_change.object_data_v2
-        if serialized_data is None:
-            serialized_data = object_change.object_data
-
-        # Enqueue the webhooks
-        for webhook in webhooks:
-            args = [
-                webhook.pk,
-                serialized_data,
-                model_name,
-                object_change.action,
-                str(timezone.now()),
-                object_change.user_name,
-                object_change.request_id,
-                object_change.get_snapshots(),
-            ]
-            process_webhook.apply_async(args=args)
+        for webhook_pk, events in batches.items():
+            for i in range(0, len(events), WEBHOOK_BATCH_MAX_EVENTS):
+                process_webhook_batch.apply_async(
+                    args=[webhook_pk, events[i : i + WEBHOOK_BATCH_MAX_EVENTS]], producer=producer
+                )
@@ -0,0 +1,107 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+import netaddr
+
+from nautobot.extras.models import Status
+from nautobot.ipam.models import get_default_namespace, IPAddress, Namespace, Prefix
+from nautobot.ipam.utils.hierarchy import bulk_load_namespace
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk load prefixes and IP addresses into a Namespace and rebuild its Prefix/IPAddress parent hierarchy. "
+        "When no input files are given, only the hierarchy of the Namespace is rebuilt."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--namespace",
+            help="Name of the Namespace to load into (defaults to the Global namespace)",
+        )
+        parser.add_argument(
+            "--prefixes",
+            metavar="FILE",
+            help="File containing one prefix CIDR per line, or '-' to read from stdin",
+        )
+        parser.add_argument(
+            "--ip-addresses",
+            metavar="FILE",
+            dest="ip_addresses",
+            help="File containing one IP address (with mask length) per line, or '-' to read from stdin",
+        )
+        parser.add_argument(
+            "--status",
+            default="Active",
+            help="Name of the Status to assign to created prefixes and IP addresses (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of rows per bulk database operation (default: %(default)s)",
+        )
+
+    def _open(self, path):
+        if path is None:
+            return None
+        if path == "-":
+            return sys.stdin
+        try:
+            return open(path, "r")
+        except OSError as err:
+            raise CommandError(f"Unable to read {path}: {err}")
+
+    def _get_status(self, name, model):
+        try:
+            return Status.objects.get_for_model(model).get(name=name)
+        except Status.DoesNotExist:
+            raise CommandError(f"Status {name!r} does not exist or is not applicable to {model._meta.verbose_name}")
+
+    def handle(self, *args, **options):
+        if options["namespace"]:
+            try:
+                namespace = Namespace.objects.get(name=options["namespace"])
+            except Namespace.DoesNotExist:
+                raise CommandError(f"Namespace {options['namespace']!r} does not exist")
+        else:
+            namespace = get_default_namespace()
+
+        if options["prefixes"] == "-" and options["ip_addresses"] == "-":
+            raise CommandError("Only one of --prefixes and --ip-addresses can be read from stdin")
+
+        prefix_status = self._get_status(options["status"], Prefix) if options["prefixes"] else None
+        ip_address_status = self._get_status(options["status"], IPAddress) if options["ip_addresses"] else None
+        prefixes_file = self._open(options["prefixes"])
+        ip_addresses_file = self._open(options["ip_addresses"])
+
+        self.stdout.write(self.style.NOTICE(f"Loading namespace {namespace}..."))
+        start_time = time.monotonic()
+        try:
+            result = bulk_load_namespace(
+                namespace,
+                prefixes=prefixes_file or (),
+                ip_addresses=ip_addresses_file or (),
+                prefix_status=prefix_status,
+                ip_address_status=ip_address_status,
+                batch_size=options["batch_size"],
+            )
+        except (netaddr.AddrFormatError, ValueError) as err:
+            raise CommandError(str(err))
+        finally:
+            for file in (prefixes_file, ip_addresses_file):
+                if file is not None and file is not sys.stdin:
+                    file.close()
+        elapsed = time.monotonic() - start_time
+
+        for ip_address in result.orphaned_ip_addresses:
+            self.stdout.write(self.style.WARNING(f"  Skipped {ip_address}: no suitable parent Prefix exists"))
+        self.stdout.write(f"  Created {result.prefixes_created} prefixes, reparented {result.prefixes_reparented}")
+        self.stdout.write(
+            f"  Created {result.ip_addresses_created} IP addresses, reparented {result.ip_addresses_reparented}"
+        )
+        if result.skipped:
+            self.stdout.write(f"  Skipped {result.skipped} records already present in the namespace")
+        self.stdout.write(self.style.SUCCESS(f"Finished in {elapsed:.1f} seconds."))
@@ -0,0 +1,125 @@
+from django.contrib.contenttypes.models import ContentType
+from django.test import SimpleTestCase
+import netaddr
+
+from nautobot.core.testing import TestCase
+from nautobot.extras.models import Status
+from nautobot.ipam.models import IPAddress, Namespace, Prefix
+from nautobot.ipam.utils.hierarchy import bulk_load_namespace, compute_parents, ip_address_node, prefix_node
+
+
+class ComputeParentsTest(SimpleTestCase):
+    """Validate the sweep-line algorithm of `compute_parents()`."""
+
+    def test_compute_parents(self):
+        prefixes = [
+            "10.0.0.0/8",
+            "10.0.0.0/16",
+            "10.0.0.0/24",
+            "10.0.1.0/24",
+            "10.1.0.0/16",
+            "11.0.0.0/8",
+            "::/0",
+            "2001:db8::/32",
+        ]
+        ip_addresses = ["10.0.0.0/24", "10.0.0.5/24", "10.0.0.5/16", "10.2.3.4/32", "12.0.0.1/32", "2001:db8::1/64"]
+
+        prefix_parents, ip_address_parents = compute_parents(
+            [prefix_node(cidr, netaddr.IPNetwork(cidr)) for cidr in reversed(prefixes)],
+            [ip_address_node(address, netaddr.IPNetwork(address)) for address in ip_addresses],
+        )
+
+        self.assertEqual(
+            prefix_parents,
+            {
+                "10.0.0.0/8": None,
+                "10.0.0.0/16": "10.0.0.0/8",
+                "10.0.0.0/24": "10.0.0.0/16",
+                "10.0.1.0/24": "10.0.0.0/16",
+                "10.1.0.0/16": "10.0.0.0/8",
+                "11.0.0.0/8": None,
+                "::/0": None,
+                "2001:db8::/32": "::/0",
+            },
+        )
+        self.assertEqual(
+            ip_address_parents,
+            {
+                "10.0.0.0/24": "10.0.0.0/24",
+                "10.0.0.5/24": "10.0.0.0/24",
+                # Only the host address needs to be contained by the parent, regardless of the mask
+                "10.0.0.5/16": "10.0.0.0/24",
+                "10.2.3.4/32": "10.0.0.0/8",
+                "12.0.0.1/32": None,
+                "2001:db8::1/64": "2001:db8::/32",
+            },
+        )
+
+
+class BulkLoadNamespaceTest(TestCase):
+    """Validate `bulk_load_namespace()` against the results of the per-object `save()` logic."""
+
+    def setUp(self):
+        self.namespace = Namespace.objects.create(name="Bulk Load Test")
+        self.status = Status.objects.get_for_model(Prefix).first()
+        self.status.content_types.add(ContentType.objects.get_for_model(IPAddress))
+
+    def test_bulk_load_namespace(self):
+        existing_root = Prefix.objects.create(prefix="10.0.0.0/8", status=self.status, namespace=self.namespace)
+        existing_child = Prefix.objects.create(prefix="10.1.1.0/24", status=self.status, namespace=self.namespace)
+        existing_ip = IPAddress.objects.create(address="10.1.1.1/24", status=self.status, namespace=self.namespace)
+        self.assertEqual(existing_ip.parent, existing_child)
+
+        result = bulk_load_namespace(
+            self.namespace,
+            prefixes=["10.1.0.0/16", "10.1.1.0/25", "10.1.1.0/24", "# a comment", "", "192.168.0.0/16"],
+            ip_addresses=["10.1.1.2/24", "10.1.1.3/25", "10.1.1.1/24", "172.16.0.1/32"],
+            prefix_status=self.status,
+            ip_address_status=self.status,
+        )
+
+        self.assertEqual(result.prefixes_created, 3)
+        self.assertEqual(result.prefixes_reparented, 1)
+        self.assertEqual(result.ip_addresses_created, 2)
+        self.assertEqual(result.ip_addresses_reparented, 0)
+        self.assertEqual(result.skipped, 2)
+        self.assertEqual(result.orphaned_ip_addresses, ["172.16.0.1/32"])
+
+        supernet = Prefix.objects.get(namespace=self.namespace, network="10.1.0.0", prefix_length=16)
+        subnet = Prefix.objects.get(namespace=self.namespace, network="10.1.1.0", prefix_length=25)
+        existing_child.refresh_from_db()
+        self.assertEqual(supernet.parent, existing_root)
+        self.assertEqual(existing_child.parent, supernet)
+        self.assertEqual(subnet.parent, existing_child)
+        self.assertIsNone(Prefix.objects.get(namespace=self.namespace, network="192.168.0.0").parent)
+        self.assertEqual(
+            IPAddress.objects.get(parent__namespace=self.namespace, host="10.1.1.2").parent, existing_child
+        )
+        self.assertEqual(IPAddress.objects.get(parent__namespace=self.namespace, host="10.1.1.3").parent, subnet)
+
+        # The bulk-computed hierarchy must match the one maintained by Prefix.save()
+        for prefix in Prefix.objects.filter(namespace=self.namespace):
+            supernets = prefix.supernets()
+            expected = max(supernets, key=lambda p: p.prefix_length) if supernets else None
+            self.assertEqual(prefix.parent, expected)
+
+    def test_bulk_load_namespace_repairs_hierarchy(self):
+        root = Prefix.objects.create(prefix="10.0.0.0/8", status=self.status, namespace=self.namespace)
+        child = Prefix.objects.create(prefix="10.0.0.0/16", status=self.status, namespace=self.namespace)
+        ip = IPAddress.objects.create(address="10.0.0.1/32", status=self.status, namespace=self.namespace)
+        # Corrupt the hierarchy without going through save()
+        Prefix.objects.filter(pk=child.pk).update(parent=None)
+        IPAddress.objects.filter(pk=ip.pk).update(parent=root)
+
+        result = bulk_load_namespace(self.namespace)
+
+        self.assertEqual(result.prefixes_reparented, 1)
+        self.assertEqual(result.ip_addresses_reparented, 1)
+        child.refresh_from_db()
+        ip.refresh_from_db()
+        self.assertEqual(child.parent, root)
+        self.assertEqual(ip.parent, child)
+
+    def test_bulk_load_namespace_requires_status(self):
+        with self.assertRaises(ValueError):
+            bulk_load_namespace(self.namespace, prefixes=["10.0.0.0/8"])
@@ -0,0 +1,247 @@
+"""Bulk computation of the Prefix/IPAddress parent hierarchy within a Namespace."""
+
+from collections import namedtuple
+import logging
+
+from django.db import transaction
+import netaddr
+
+from nautobot.extras.models import CustomField
+from nautobot.ipam.models import IPAddress, Prefix
+
+logger = logging.getLogger(__name__)
+
+# Lightweight in-memory representations used by the sweep-line algorithm.
+# `first` and `last` are the integer values of the first and last addresses covered by the object.
+PrefixNode = namedtuple("PrefixNode", ["key", "ip_version", "first", "last", "prefix_length"])
+IPAddressNode = namedtuple("IPAddressNode", ["key", "ip_version", "first", "last"])
+
+# Sort order for objects that start at the same address: a Prefix may be the parent of an IPAddress with the same
+# starting address, so prefixes must be visited first.
+_PREFIX_EVENT = 0
+_IP_ADDRESS_EVENT = 1
+
+BulkLoadResult = namedtuple(
+    "BulkLoadResult",
+    [
+        "prefixes_created",
+        "prefixes_reparented",
+        "ip_addresses_created",
+        "ip_addresses_reparented",
+        "skipped",
+        "orphaned_ip_addresses",
+    ],
+)
+
+
+def prefix_node(key, cidr):
+    """Build a `PrefixNode` for the given key and `netaddr.IPNetwork`."""
+    return PrefixNode(key, cidr.version, cidr.first, cidr.last, cidr.prefixlen)
+
+
+def ip_address_node(key, address):
+    """
+    Build an `IPAddressNode` for the given key and `netaddr.IPNetwork` address.
+
+    This mirrors the lookup performed by `IPAddress._get_closest_parent()`: a parent Prefix need only contain the host
+    address, regardless of the IP's mask.
+    """
+    host = int(address.ip)
+    return IPAddressNode(key, address.version, host, host)
+
+
+def compute_parents(prefix_nodes, ip_address_nodes=()):
+    """
+    Compute the closest parent Prefix of every given Prefix and IPAddress in a single sweep-line pass.
+
+    All objects are assumed to belong to the same Namespace. The objects are sorted by address family and starting
+    address, and a stack of the currently "open" prefixes is maintained; as prefixes never partially overlap, the
+    stack always holds a chain of nested prefixes, the innermost of which is on top.
+
+    Args:
+        prefix_nodes (iterable): `PrefixNode` tuples.
+        ip_address_nodes (iterable): `IPAddressNode` tuples.
+
+    Returns:
+        (tuple[dict, dict]): Mappings of Prefix key to parent Prefix key and of IPAddress key to parent Prefix key.
+            Objects with no possible parent are mapped to `None`.
+    """
+    events = [(node.ip_version, node.first, _PREFIX_EVENT, node.prefix_length, node) for node in prefix_nodes]
+    events.extend((node.ip_version, node.first, _IP_ADDRESS_EVENT, 0, node) for node in ip_address_nodes)
+    events.sort(key=lambda event: event[:4])
+
+    prefix_parents = {}
+    ip_address_parents = {}
+    stack = []
+    current_version = None
+
+    for ip_version, first, event_type, _, node in events:
+        if ip_version != current_version:
+            stack.clear()
+            current_version = ip_version
+
+        # Close any prefixes that end before this object starts.
+        while stack and stack[-1].last < first:
+            stack.pop()
+
+        if event_type == _PREFIX_EVENT:
+            prefix_parents[node.key] = stack[-1].key if stack else None
+            stack.append(node)
+        else:
+            ip_address_parents[node.key] = stack[-1].key if stack else None
+
+    return prefix_parents, ip_address_parents
+
+
+def _custom_field_defaults(model):
+    """Return the default `_custom_field_data` for new instances of the given model."""
+    return {cf.key: cf.default for cf in CustomField.objects.get_for_model(model) if cf.default is not None}
+
+
+def _parse_cidrs(values, strict):
+    """Yield `netaddr.IPNetwork` objects from an iterable of strings, skipping comments and blank lines."""
+    for value in values:
+        value = value.strip()
+        if not value or value.startswith("#"):
+            continue
+        cidr = netaddr.IPNetwork(value)
+        yield cidr.cidr if strict else cidr
+
+
+def bulk_load_namespace(
+    namespace,
+    prefixes=(),
+    ip_addresses=(),
+    prefix_status=None,
+    ip_address_status=None,
+    batch_size=1000,
+):
+    """
+    Load a stream of prefixes and IP addresses into a Namespace and rebuild its entire parent hierarchy.
+
+    Rather than calling `Prefix.save()` for each record (which runs several range queries per row to find supernets,
+    subnets and child IPs), all existing and new objects of the Namespace are loaded into memory, their parents are
+    computed in a single pass by `compute_parents()`, and the results are written with `bulk_create()` and
+    `bulk_update()`. Calling this with no `prefixes` or `ip_addresses` simply repairs the hierarchy of the Namespace.
+
+    Note that, like any `bulk_create()`/`bulk_update()`, this bypasses `save()`, model signals and change logging.
+
+    Args:
+        namespace (Namespace): Namespace to load the objects into.
+        prefixes (iterable): Prefix CIDR strings to create. Prefixes already present in the Namespace are skipped.
+        ip_addresses (iterable): IP address strings (with mask length) to create. Addresses whose host is already
+            present in the Namespace are skipped.
+        prefix_status (Status): Status to assign to newly created prefixes. Required if `prefixes` is non-empty.
+        ip_address_status (Status): Status to assign to newly created IP addresses. Required if `ip_addresses` is
+            non-empty.
+        batch_size (int): Batch size for the bulk database operations.
+
+    Returns:
+        (BulkLoadResult): Counts of created and reparented objects and the IP addresses that could not be loaded
+            because no parent Prefix exists for them.
+    """
+    skipped = 0
+
+    with transaction.atomic():
+        existing_prefixes = list(
+            Prefix.objects.filter(namespace=namespace).only(
+                "id", "parent", "network", "broadcast", "prefix_length", "ip_version"
+            )
+        )
+        prefixes_by_cidr = {(p.network, p.prefix_length): p for p in existing_prefixes}
+        prefix_nodes = [prefix_node(p.pk, p.prefix) for p in existing_prefixes]
+
+        new_prefixes = {}
+        prefix_cf_defaults = _custom_field_defaults(Prefix)
+        for cidr in _parse_cidrs(prefixes, strict=True):
+            if (str(cidr.network), cidr.prefixlen) in prefixes_by_cidr:
+                skipped += 1
+                continue
+            if prefix_status is None:
+                raise ValueError("A prefix_status is required in order to create prefixes")
+            prefix = Prefix(
+                prefix=cidr,
+                namespace=namespace,
+                status=prefix_status,
+                _custom_field_data=prefix_cf_defaults.copy(),
+            )
+            prefixes_by_cidr[(prefix.network, prefix.prefix_length)] = prefix
+            new_prefixes[prefix.pk] = prefix
+            prefix_nodes.append(prefix_node(prefix.pk, cidr))
+
+        existing_ip_addresses = list(
+            IPAddress.objects.filter(parent__namespace=namespace).only(
+                "id", "parent", "host", "mask_length", "ip_version"
+            )
+        )
+        hosts = {ip.host for ip in existing_ip_addresses}
+        ip_address_nodes = [ip_address_node(ip.pk, ip.address) for ip in existing_ip_addresses]
+
+        new_ip_addresses = {}
+        ip_address_cf_defaults = _custom_field_defaults(IPAddress)
+        for address in _parse_cidrs(ip_addresses, strict=False):
+            if str(address.ip) in hosts:
+                skipped += 1
+                continue
+            if ip_address_status is None:
+                raise ValueError("An ip_address_status is required in order to create IP addresses")
+            ip_address = IPAddress(
+                address=address,
+                status=ip_address_status,
+                _custom_field_data=ip_address_cf_defaults.copy(),
+            )
+            hosts.add(ip_address.host)
+            new_ip_addresses[ip_address.pk] = ip_address
+            ip_address_nodes.append(ip_address_node(ip_address.pk, address))
+
+        prefix_parents, ip_address_parents = compute_parents(prefix_nodes, ip_address_nodes)
+
+        reparented_prefixes = []
+        for prefix in existing_prefixes:
+            if prefix.parent_id != prefix_parents[prefix.pk]:
+                prefix.parent_id = prefix_parents[prefix.pk]
+                reparented_prefixes.append(prefix)
+        for prefix in new_prefixes.values():
+            prefix.parent_id = prefix_parents[prefix.pk]
+
+        reparented_ip_addresses = []
+        for ip_address in existing_ip_addresses:
+            parent_id = ip_address_parents[ip_address.pk]
+            # An existing IP whose parent was deleted out from under it keeps its current parent.
+            if parent_id is not None and ip_address.parent_id != parent_id:
+                ip_address.parent_id = parent_id
+                reparented_ip_addresses.append(ip_address)
+        orphaned_ip_addresses = []
+        for ip_address in list(new_ip_addresses.values()):
+            ip_address.parent_id = ip_address_parents[ip_address.pk]
+            if ip_address.parent_id is None:
+                orphaned_ip_addresses.append(str(ip_address))
+                del new_ip_addresses[ip_address.pk]
+
+        # Sorting by (ip_version, network, prefix_length) guarantees that every parent is inserted before its
+        # children, which matters for databases that don't defer foreign key constraint checks.
+        Prefix.objects.bulk_create(
+            sorted(new_prefixes.values(), key=lambda p: (p.ip_version, p.prefix.first, p.prefix_length)),
+            batch_size=batch_size,
+        )
+        Prefix.objects.bulk_update(reparented_prefixes, ["parent"], batch_size=batch_size)
+        IPAddress.objects.bulk_create(new_ip_addresses.values(), batch_size=batch_size)
+        IPAddress.objects.bulk_update(reparented_ip_addresses, ["parent"], batch_size=batch_size)
+
+    logger.info(
+        "Bulk loaded %d prefixes and %d IP addresses into namespace %s; reparented %d prefixes and %d IP addresses",
+        len(new_prefixes),
+        len(new_ip_addresses),
+        namespace,
+        len(reparented_prefixes),
+        len(reparented_ip_addresses),
+    )
+
+    return BulkLoadResult(
+        prefixes_created=len(new_prefixes),
+        prefixes_reparented=len(reparented_prefixes),
+        ip_addresses_created=len(new_ip_addresses),
+        ip_addresses_reparented=len(reparented_ip_addresses),
+        skipped=skipped,
+        orphaned_ip_addresses=orphaned_ip_addresses,
+    )
@@ -1,7 +1,7 @@
 import graphene
 
+from nautobot.core.graphql.loaders import load_dynamic_groups
 from nautobot.core.graphql.types import OptimizedNautobotObjectType
-from nautobot.extras.models import DynamicGroup
 from nautobot.virtualization.filters import ClusterFilterSet, VirtualMachineFilterSet, VMInterfaceFilterSet
 from nautobot.virtualization.models import Cluster, VirtualMachine, VMInterface
 
@@ -15,8 +15,8 @@ class ClusterType(OptimizedNautobotObjectType):
         model = Cluster
         filterset_class = ClusterFilterSet
 
-    def resolve_dynamic_groups(self, args):
-        return DynamicGroup.objects.get_for_object(self)
+    def resolve_dynamic_groups(self, info):
+        return load_dynamic_groups(self, info)
 
 
 class VirtualMachineType(OptimizedNautobotObjectType):
@@ -28,8 +28,8 @@ class VirtualMachineType(OptimizedNautobotObjectType):
         model = VirtualMachine
         filterset_class = VirtualMachineFilterSet
 
-    def resolve_dynamic_groups(self, args):
-        return DynamicGroup.objects.get_for_object(self)
+    def resolve_dynamic_groups(self, info):
+        return load_dynamic_groups(self, info)
 
 
 class VMInterfaceType(OptimizedNautobotObjectType):